@@ -1,34 +1,53 @@
-print("Введите массив целых чисел:")
-M = input().split()
-num1 = [int(num) for num in M]
+import argparse
+import bisect
+import os
+import sys
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
 
-print("Введите значение суммы:")
-target = int(input(" "))
 
 def sumoftwo(num1, target):
+    """
+    Находит два различных индекса, значения по которым в сумме дают target.
     
+    Если подходящих пар несколько, возвращается лексикографически наименьшая
+    пара [i, j], i < j: с наименьшим i, а при равных i - с наименьшим j.
+    Двумя указателями перебираются различные значения по возрастанию; для каждого
+    значения хранятся два его наименьших индекса, поэтому повторы не теряют пар.
+    
+    Args:
+        num1: Массив чисел
+        target: Искомая сумма
+    
+    Returns:
+        Список [i, j] или [], если пары нет
+    """
     if len(num1) < 2:
         print("Массив содержит меньше 2х элементов")
         return []
     
-    indexed_num1 = [(num, i) for i, num in enumerate(num1)]
-    indexed_num1.sort(key=lambda x: x[0])
-    left, right = 0, len(indexed_num1) - 1
-    result = [] 
+    first_indexes = {}
+    for i, num in enumerate(num1):
+        indexes = first_indexes.setdefault(num, [])
+        if len(indexes) < 2:
+            indexes.append(i)
+    values = sorted(first_indexes)
+    left, right = 0, len(values) - 1
+    result = []
     
-    while left < right:
-        current_sum = indexed_num1[left][0] + indexed_num1[right][0]
+    while left <= right:
+        current_sum = values[left] + values[right]
         
         if current_sum == target:
-            idx1, idx2 = indexed_num1[left][1], indexed_num1[right][1]
+            if left < right:
+                pair = sorted([first_indexes[values[left]][0], first_indexes[values[right]][0]])
+            else:
+                # Одно значение дважды: нужны два его наименьших индекса
+                pair = first_indexes[values[left]]
             
-            pair = [min(idx1, idx2), max(idx1, idx2)]
-            
-            if not result:
-                result = pair
-            elif pair[0] < result[0]:  
-                result = pair
-            elif pair[0] == result[0] and pair[1] < result[1]:  
+            if len(pair) == 2 and (not result or pair < result):
                 result = pair
             
             left += 1
@@ -38,12 +57,329 @@ def sumoftwo(num1, target):
             left += 1
         else:
             right -= 1
-    return result if result else []
+    return result
+
+
+# Наибольшее число пар, для которого ksum(k=4) строит таблицу сумм пар:
+# словарь на миллион сумм занимает порядка 100 МБ
+PAIR_TABLE_LIMIT = 1_000_000
+
+
+def ksum(nums: List[int], target: int, k: int = 2) -> List[int]:
+    """
+    Находит k различных индексов, значения по которым в сумме дают target.
+    
+    Среди всех решений возвращается лексикографически наименьший набор индексов
+    (по возрастанию) - то же правило, что у sumoftwo. Первый индекс перебирается
+    по возрастанию с отсечением по границам: если target не лежит между суммой
+    k наименьших и k наибольших элементов суффикса, индекс пропускается.
+    
+    k=2 - sumoftwo, O(n log n);
+    k=3 - проверка пары отсортированными двумя указателями, O(n^2) в худшем случае;
+    k=4 - встреча посередине: таблица сумм пар {сумма: наибольший первый индекс},
+    O(n^2) времени и памяти в худшем случае. Таблица строится, только если дешёвый
+    перебор не нашёл ответ быстро и пар не больше PAIR_TABLE_LIMIT; иначе пары
+    проверяются перебором, O(n^3) в худшем случае, но без дополнительной памяти;
+    k>4 - перебор первого индекса со сведением к (k-1)-сумме.
+    
+    Args:
+        nums: Массив целых чисел
+        target: Искомая сумма
+        k: Количество слагаемых
+    
+    Returns:
+        Список из k индексов по возрастанию или [], если решения нет
+    
+    Raises:
+        ValueError: Если k меньше 1
+    """
+    if k < 1:
+        raise ValueError("k должно быть натуральным числом")
+    n = len(nums)
+    if n < k:
+        return []
+    if k == 2:
+        return sumoftwo(nums, target)
+    
+    # Индексы каждого значения по возрастанию
+    positions = defaultdict(list)
+    for i, num in enumerate(nums):
+        positions[num].append(i)
+    last_index = {num: idx[-1] for num, idx in positions.items()}
+    
+    if k == 1:
+        return [positions[target][0]] if target in positions else []
+    
+    # min_sums[m][p] / max_sums[m][p] - сумма m наименьших / наибольших элементов nums[p:]
+    inf = float("inf")
+    min_sums = [[inf] * (n + 1) for _ in range(k)]
+    max_sums = [[-inf] * (n + 1) for _ in range(k)]
+    smallest, largest = [], []
+    for p in range(n - 1, -1, -1):
+        bisect.insort(smallest, nums[p])
+        del smallest[k - 1:]
+        bisect.insort(largest, -nums[p])
+        del largest[k - 1:]
+        low = high = 0
+        for m in range(1, len(smallest) + 1):
+            low += smallest[m - 1]
+            high -= largest[m - 1]
+            min_sums[m][p] = low
+            max_sums[m][p] = high
+    
+    def out_of_bounds(rest: int, m: int, p: int) -> bool:
+        return rest < min_sums[m][p] or rest > max_sums[m][p]
+    
+    def two_sum(p: int, rest: int) -> Optional[List[int]]:
+        for j in range(p, n):
+            need = rest - nums[j]
+            if last_index.get(need, -1) > j:
+                idx = positions[need]
+                return [j, idx[bisect.bisect_right(idx, j)]]
+        return None
+    
+    order = sorted(range(n), key=nums.__getitem__)
+    order_values = [nums[i] for i in order]
+    
+    def pair_exists_after(i: int, rest: int) -> bool:
+        """Два указателя по отсортированному массиву, пропуская индексы <= i."""
+        lo, hi = 0, n - 1
+        while True:
+            while lo < hi and order[lo] <= i:
+                lo += 1
+            while lo < hi and order[hi] <= i:
+                hi -= 1
+            if lo >= hi:
+                return False
+            current = order_values[lo] + order_values[hi]
+            if current == rest:
+                return True
+            if current < rest:
+                lo += 1
+            else:
+                hi -= 1
+    
+    def three_sum(p: int, rest: int) -> Optional[List[int]]:
+        for i in range(p, n - 2):
+            remainder = rest - nums[i]
+            if out_of_bounds(remainder, 2, i + 1):
+                continue
+            if pair_exists_after(i, remainder):
+                return [i] + two_sum(i + 1, remainder)
+        return None
+    
+    pair_table = None
+    
+    def build_pair_table() -> Dict[int, int]:
+        # j растёт, поэтому для каждой суммы остаётся наибольший первый индекс пары
+        table = {}
+        for j in range(n - 1):
+            head = nums[j]
+            table.update(dict.fromkeys([head + x for x in nums[j + 1:]], j))
+        return table
+    
+    def four_sum(p: int, rest: int) -> Optional[List[int]]:
+        nonlocal pair_table
+        # Пока перебор дешёвый, каждая пара-якорь проверяется за O(n);
+        # после n // 8 неудачных якорей окупается таблица сумм пар
+        budget = n // 8
+        too_many_pairs = n * (n - 1) // 2 > PAIR_TABLE_LIMIT
+        for i in range(p, n - 3):
+            rest_i = rest - nums[i]
+            if out_of_bounds(rest_i, 3, i + 1):
+                continue
+            for j in range(i + 1, n - 2):
+                remainder = rest_i - nums[j]
+                if out_of_bounds(remainder, 2, j + 1):
+                    continue
+                if pair_table is None and (budget > 0 or too_many_pairs):
+                    budget -= 1
+                    pair = two_sum(j + 1, remainder)
+                    if pair is not None:
+                        return [i, j] + pair
+                    continue
+                if pair_table is None:
+                    pair_table = build_pair_table()
+                if pair_table.get(remainder, -1) > j:
+                    return [i, j] + two_sum(j + 1, remainder)
+        return None
+    
+    def solve(p: int, rest: int, m: int) -> Optional[List[int]]:
+        if m == 2:
+            return two_sum(p, rest)
+        if m == 3:
+            return three_sum(p, rest)
+        if m == 4:
+            return four_sum(p, rest)
+        for i in range(p, n - m + 1):
+            remainder = rest - nums[i]
+            if out_of_bounds(remainder, m - 1, i + 1):
+                continue
+            found = solve(i + 1, remainder, m - 1)
+            if found is not None:
+                return [i] + found
+        return None
+    
+    return solve(0, target, k) or []
+
+
+Case = Tuple[List[int], int, int]
+
+
+def check_k(k: int) -> None:
+    """
+    Проверяет количество слагаемых из строки случая или параметра -k.
+    
+    Raises:
+        ValueError: Если количество слагаемых не натуральное
+    """
+    if k < 1:
+        raise ValueError(f"количество слагаемых должно быть натуральным числом, получено {k}")
+
+
+def parse_case(line: str, k: int = 2) -> Case:
+    """
+    Разбирает строку вида "1 2 3 ; 5" или "1 2 3 ; 6 ; 3" (массив ; сумма [; k]).
+    
+    Args:
+        line: Строка входного файла
+        k: Количество слагаемых, если оно не указано в строке
+    
+    Returns:
+        Кортеж (массив, сумма, k)
+    
+    Raises:
+        ValueError: Если строка не соответствует формату
+    """
+    parts = line.split(";")
+    if len(parts) not in (2, 3):
+        raise ValueError("ожидается 'числа ; сумма' или 'числа ; сумма ; k'")
+    nums = [int(num) for num in parts[0].split()]
+    target = int(parts[1])
+    if len(parts) == 3:
+        k = int(parts[2])
+    check_k(k)
+    return nums, target, k
+
+
+def read_cases(lines: Iterable[str], k: int = 2) -> List[Case]:
+    """
+    Читает случаи из строк, пропуская пустые строки и комментарии (#).
+    
+    Raises:
+        ValueError: Если строка не соответствует формату (с номером строки)
+    """
+    cases = []
+    for number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        try:
+            cases.append(parse_case(line, k))
+        except ValueError as e:
+            raise ValueError(f"Строка {number}: {e}") from None
+    return cases
+
+
+def solve_case(case: Case) -> str:
+    """
+    Решает один случай и возвращает строку ответа: индексы через пробел или '-'.
+    
+    При k=2 ответ совпадает с ответом интерактивного режима (sumoftwo).
+    """
+    nums, target, k = case
+    result = ksum(nums, target, k)
+    return " ".join(map(str, result)) if result else "-"
+
+
+def solve_cases(cases: List[Case], workers: Optional[int] = None,
+                chunksize: Optional[int] = None) -> List[str]:
+    """
+    Решает случаи в пуле процессов, сохраняя порядок ответов.
+    
+    Случаи раздаются процессам пачками по chunksize, чтобы накладные расходы
+    на передачу данных между процессами не превышали время решения.
+    
+    Args:
+        cases: Список случаев (массив, сумма, k)
+        workers: Количество процессов (по умолчанию - число ядер; 1 - без пула)
+        chunksize: Размер пачки (по умолчанию - около четырёх пачек на процесс)
+    
+    Returns:
+        Ответы в порядке случаев
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(cases) < 2:
+        return [solve_case(case) for case in cases]
+    if chunksize is None:
+        chunksize = max(1, len(cases) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(solve_case, cases, chunksize=chunksize))
+
+
+def run_batch(argv: Optional[List[str]] = None) -> int:
+    """
+    Пакетный режим: читает случаи из файла или stdin и пишет ответы по одному на строку.
+    
+    Пропускная способность (случаев в секунду) выводится в stderr.
+    
+    Returns:
+        Код возврата: 0 - успех, 2 - ошибка во входных данных
+    """
+    parser = argparse.ArgumentParser(
+        description="Поиск k индексов с заданной суммой для набора случаев",
+        epilog="Формат строки: 'числа ; сумма' или 'числа ; сумма ; k', например '2 7 11 15 ; 9'.")
+    parser.add_argument("input", help="файл со случаями ('-' - стандартный ввод)")
+    parser.add_argument("-o", "--output", help="файл для ответов (по умолчанию - стандартный вывод)")
+    parser.add_argument("-k", type=int, default=2, help="количество слагаемых, если оно не указано в строке")
+    parser.add_argument("-w", "--workers", type=int, help="количество процессов (по умолчанию - число ядер)")
+    parser.add_argument("--chunksize", type=int, help="сколько случаев передавать процессу за раз")
+    args = parser.parse_args(argv)
+    
+    try:
+        check_k(args.k)
+        if args.input == "-":
+            cases = read_cases(sys.stdin, args.k)
+        else:
+            with open(args.input, encoding="utf-8") as f:
+                cases = read_cases(f, args.k)
+    except ValueError as e:
+        print(f"Ошибка во входных данных: {e}", file=sys.stderr)
+        return 2
+    
+    start = time.perf_counter()
+    answers = solve_cases(cases, args.workers, args.chunksize)
+    elapsed = time.perf_counter() - start
+    
+    text = "".join(answer + "\n" for answer in answers)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        sys.stdout.write(text)
+    
+    rate = len(cases) / elapsed if elapsed > 0 else float("inf")
+    print(f"Обработано случаев: {len(cases)} за {elapsed:.3f} с ({rate:.0f} случаев/с)", file=sys.stderr)
+    return 0
+
+
+def interactive():
+    print("Введите массив целых чисел:")
+    M = input().split()
+    num1 = [int(num) for num in M]
+
+    print("Введите значение суммы:")
+    target = int(input(" "))
+
+    result = sumoftwo(num1, target)
+
+    if result:
+        print(f"Ответ: {result}")
+    else:
+        print("В введённом массиве нет такой пары чисел, которая в сумме даст target")
 
-result = sumoftwo(num1, target)
 
-if result:
-    print(f"Ответ: {result}")
-else:
-    print("В введённом массиве нет такой пары чисел, которая в сумме даст target")
-    
\ No newline at end of file
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        sys.exit(run_batch())
+    interactive()
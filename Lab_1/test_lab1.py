@@ -0,0 +1,160 @@
+import contextlib
+import io
+import itertools
+import os
+import random
+import tempfile
+import unittest
+from unittest import mock
+
+import Lab1_Sum_of_two
+from Lab1_Sum_of_two import ksum, parse_case, read_cases, run_batch, solve_case, solve_cases, sumoftwo
+
+
+def brute_force(nums, target, k):
+    """Лексикографически наименьший набор из k индексов с заданной суммой или []."""
+    for indexes in itertools.combinations(range(len(nums)), k):
+        if sum(nums[i] for i in indexes) == target:
+            return list(indexes)
+    return []
+
+
+class TestSumOfTwo(unittest.TestCase):
+
+    def test_example(self):
+        self.assertEqual(sumoftwo([2, 7, 11, 15], 9), [0, 1])
+
+    def test_smallest_pair_returned(self):
+        self.assertEqual(sumoftwo([-1, -2, 3, 1, -1, -1], -3), [0, 1])
+        self.assertEqual(sumoftwo([3, 3, 3], 6), [0, 1])
+
+    def test_not_found(self):
+        self.assertEqual(sumoftwo([1, 2, 3], 100), [])
+
+    def test_matches_brute_force(self):
+        rng = random.Random(2)
+        for _ in range(500):
+            nums = [rng.randint(-5, 5) for _ in range(rng.randint(2, 10))]
+            target = rng.randint(-10, 10)
+            self.assertEqual(sumoftwo(nums, target), brute_force(nums, target, 2), (nums, target))
+
+
+class TestKSum(unittest.TestCase):
+
+    def check_random(self, k, cases=300, seed=1):
+        rng = random.Random(seed + k)
+        for _ in range(cases):
+            nums = [rng.randint(-6, 6) for _ in range(rng.randint(0, 12))]
+            target = rng.randint(-3 * k, 3 * k)
+            self.assertEqual(ksum(nums, target, k), brute_force(nums, target, k), (nums, target, k))
+
+    def test_matches_brute_force(self):
+        for k in range(1, 6):
+            with self.subTest(k=k):
+                self.check_random(k)
+
+    def test_k2_same_as_sumoftwo(self):
+        nums = [-1, -2, 3, 1, -1, -1]
+        self.assertEqual(ksum(nums, -3, 2), sumoftwo(nums, -3))
+
+    def test_duplicates(self):
+        self.assertEqual(ksum([0] * 8, 0, 4), [0, 1, 2, 3])
+        self.assertEqual(ksum([5, 5, 5, 5, 5], 25, 5), [0, 1, 2, 3, 4])
+        self.assertEqual(ksum([5, 5, 5, 5], 25, 5), [])
+
+    def test_pair_table_matches_brute_force(self):
+        # Массивы длиннее n // 8 неудачных якорей доходят до таблицы сумм пар
+        rng = random.Random(4)
+        for _ in range(30):
+            nums = [rng.randint(-20, 20) for _ in range(40)]
+            target = rng.randint(-60, 60)
+            self.assertEqual(ksum(nums, target, 4), brute_force(nums, target, 4), (nums, target))
+
+    def test_pair_table_limit(self):
+        rng = random.Random(5)
+        # С нулевым пределом таблица не строится, и все пары проверяются перебором
+        with mock.patch.object(Lab1_Sum_of_two, "PAIR_TABLE_LIMIT", 0):
+            for _ in range(30):
+                nums = [rng.randint(-20, 20) for _ in range(40)]
+                target = rng.randint(-60, 60)
+                self.assertEqual(ksum(nums, target, 4), brute_force(nums, target, 4), (nums, target))
+
+    def test_invalid_k(self):
+        with self.assertRaises(ValueError):
+            ksum([1, 2, 3], 3, 0)
+
+
+class TestBatch(unittest.TestCase):
+
+    def test_parse_case(self):
+        self.assertEqual(parse_case("2 7 11 15 ; 9"), ([2, 7, 11, 15], 9, 2))
+        self.assertEqual(parse_case("1 2 3 ; 6 ; 3", k=2), ([1, 2, 3], 6, 3))
+        self.assertEqual(parse_case("1 2 ; 3", k=4), ([1, 2], 3, 4))
+
+    def test_parse_case_invalid(self):
+        for line in ["1 2 3", "1 2 ; 3 ; 2 ; 1", "1 x ; 3", "1 2 ; y", "1 2 ; 3 ; 0", "1 2 ; 3 ; -2"]:
+            with self.subTest(line=line), self.assertRaises(ValueError):
+                parse_case(line)
+
+    def test_read_cases_skips_comments(self):
+        lines = ["# комментарий\n", "\n", "1 2 ; 3\n", "  1 2 3 ; 6 ; 3  \n"]
+        self.assertEqual(read_cases(lines, k=2), [([1, 2], 3, 2), ([1, 2, 3], 6, 3)])
+
+    def test_read_cases_error_line_number(self):
+        with self.assertRaisesRegex(ValueError, "^Строка 3: "):
+            read_cases(["1 2 ; 3", "# комментарий", "1 2 3"])
+
+    def test_solve_case_matches_interactive(self):
+        nums = [-1, -2, 3, 1, -1, -1]
+        self.assertEqual(solve_case((nums, -3, 2)), " ".join(map(str, sumoftwo(nums, -3))))
+        self.assertEqual(solve_case((nums, -3, 2)), "0 1")
+        self.assertEqual(solve_case(([1, 2], 100, 2)), "-")
+
+    def test_solve_cases_workers(self):
+        rng = random.Random(7)
+        cases = []
+        for _ in range(40):
+            nums = [rng.randint(-6, 6) for _ in range(rng.randint(0, 10))]
+            k = rng.randint(1, 4)
+            cases.append((nums, rng.randint(-10, 10), k))
+        expected = [" ".join(map(str, brute_force(*case))) or "-" for case in cases]
+        self.assertEqual(solve_cases(cases, workers=1), expected)
+        self.assertEqual(solve_cases(cases, workers=2, chunksize=5), expected)
+
+    def run_batch_on(self, text, *argv):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "cases.txt")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+            stdout, stderr = io.StringIO(), io.StringIO()
+            with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                code = run_batch([path, *argv])
+        return code, stdout.getvalue(), stderr.getvalue()
+
+    def test_run_batch(self):
+        code, out, err = self.run_batch_on("2 7 11 15 ; 9\n-1 -2 3 1 -1 -1 ; -3\n1 2 3 ; 100 ; 3\n", "-w", "1")
+        self.assertEqual(code, 0)
+        self.assertEqual(out, "0 1\n0 1\n-\n")
+        self.assertIn("Обработано случаев: 3", err)
+
+    def test_run_batch_bad_input(self):
+        code, out, err = self.run_batch_on("1 2 ; 3\n1 2 3\n", "-w", "1")
+        self.assertEqual(code, 2)
+        self.assertEqual(out, "")
+        self.assertIn("Строка 2", err)
+
+    def test_run_batch_invalid_k(self):
+        code, out, err = self.run_batch_on("1 2 ; 3\n1 2 ; 3 ; 0\n", "-w", "1")
+        self.assertEqual(code, 2)
+        self.assertEqual(out, "")
+        self.assertIn("Строка 2: количество слагаемых", err)
+
+        for k in ("0", "-1"):
+            code, out, err = self.run_batch_on("1 2 ; 3\n", "-w", "1", "-k", k)
+            self.assertEqual(code, 2)
+            self.assertEqual(out, "")
+            self.assertIn("количество слагаемых", err)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,14 +1,20 @@
 from typing import List, Union, Optional, Tuple
 
+from sorted_buckets import SortedBuckets
 
-def guess_number(target: int, lst: List[int], search_type: str = 'seq') -> Tuple[Optional[int], Optional[int]]:
+
+def guess_number(target: int, lst: Union[List[int], SortedBuckets],
+                 search_type: str = 'seq', workers: int = 1) -> Tuple[Optional[int], Optional[int]]:
     """
     Функция для поиска числа в списке с использованием указанного алгоритма.
     
     Args:
         target: Искомое число
-        lst: Список чисел для поиска (может быть неотсортированным)
+        lst: Список чисел для поиска (может быть неотсортированным) или SortedBuckets;
+            для SortedBuckets бинарный поиск выполняется без сортировки
         search_type: Тип поиска - 'seq' для последовательного, 'bin' для бинарного
+        workers: Количество процессов для последовательного поиска; при workers > 1
+            список копируется в разделяемую память и просматривается блоками параллельно
     
     Returns:
         Кортеж из двух элементов: (найденное_число, количество_сравнений)
@@ -20,6 +26,11 @@ def guess_number(target: int, lst: List[int], search_type: str = 'seq') -> Tuple
     comparisons = 0
     
     if search_type == 'seq':
+        if workers > 1:
+            # numpy и multiprocessing нужны только параллельному поиску
+            from parallel_search import parallel_seq_search
+            return parallel_seq_search(target, lst, workers)
+        
         # Последовательный поиск
         for num in lst:
             comparisons += 1
@@ -28,6 +39,10 @@ def guess_number(target: int, lst: List[int], search_type: str = 'seq') -> Tuple
         return (None, comparisons)
     
     elif search_type == 'bin':
+        # SortedBuckets (и любой контейнер с методом search) уже отсортирован
+        if hasattr(lst, 'search'):
+            return lst.search(target)
+        
         # Бинарный поиск требует отсортированного списка
         sorted_lst = sorted(lst)
         left = 0
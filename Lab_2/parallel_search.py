@@ -0,0 +1,218 @@
+import multiprocessing
+import os
+import random
+import time
+from multiprocessing import shared_memory
+from typing import Dict, Iterable, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+INT64_MIN, INT64_MAX = -2 ** 63, 2 ** 63 - 1
+MAX_BLOCK = 1 << 20
+# fork копирует таблицы страниц родителя, и для процесса с огромным списком это секунды;
+# forkserver порождает исполнителей из маленького процесса-сервера
+START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+
+class SharedIntArray:
+    """
+    Массив int64 в разделяемой памяти (multiprocessing.shared_memory).
+
+    Процессы-исполнители подключаются к нему по имени и читают данные без копирования.
+    Если по одним и тем же данным выполняется много поисков, массив выгодно создать
+    один раз: копирование списка в разделяемую память дороже самого просмотра.
+    """
+
+    def __init__(self, values: Union[Sequence[int], np.ndarray]):
+        """
+        Args:
+            values: Целые числа в диапазоне int64
+
+        Raises:
+            TypeError: Если значения не целые числа или не помещаются в int64
+        """
+        source = np.asarray(values)
+        if source.dtype.kind not in "iub" or (source.dtype.kind == "u" and source.dtype.itemsize == 8):
+            raise TypeError("Ожидаются целые числа в диапазоне int64")
+        self.size = len(source)
+        self._shm = shared_memory.SharedMemory(create=True, size=max(1, self.size * 8))
+        self.array = np.ndarray((self.size,), dtype=np.int64, buffer=self._shm.buf)
+        self.array[:] = source
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def __len__(self) -> int:
+        return self.size
+
+    def close(self) -> None:
+        """Освобождает разделяемую память."""
+        if self._shm is not None:
+            self.array = None
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def __enter__(self) -> "SharedIntArray":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _scan_blocks(name: str, size: int, target: int, first: int, step: int, block: int, best) -> None:
+    """
+    Просматривает блоки first, first + step, ... массива в разделяемой памяти.
+
+    Найденный индекс записывается в best, если он меньше текущего. Блок, начинающийся
+    не раньше best, просматривать бессмысленно - в нём не может быть первого вхождения.
+    """
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        array = np.ndarray((size,), dtype=np.int64, buffer=shm.buf)
+        for start in range(first * block, size, step * block):
+            if best.value <= start:
+                break
+            hits = np.flatnonzero(array[start:start + block] == target)
+            if hits.size:
+                index = start + int(hits[0])
+                with best.get_lock():
+                    if index < best.value:
+                        best.value = index
+                break
+        del array
+    finally:
+        shm.close()
+
+
+def _sequential(target: int, values: Iterable[int]) -> Tuple[Optional[int], int]:
+    comparisons = 0
+    for num in values:
+        comparisons += 1
+        if num == target:
+            return (num, comparisons)
+    return (None, comparisons)
+
+
+def parallel_seq_search(target: int, values: Union[Sequence[int], SharedIntArray],
+                        workers: Optional[int] = None, block: Optional[int] = None) -> Tuple[Optional[int], int]:
+    """
+    Последовательный поиск первого вхождения, распределённый по процессам.
+
+    Массив делится на блоки, которые процессы просматривают по очереди (процесс w -
+    блоки w, w + workers, ...), так что блоки с меньшими индексами проверяются раньше.
+    Как только найдено вхождение, процессы пропускают блоки после него.
+    Количество сравнений считается таким, каким оно было бы у последовательного поиска:
+    индекс первого вхождения + 1 или длина списка.
+
+    Исполнители запускаются через forkserver (или spawn), поэтому, как и с любым
+    multiprocessing, вызывающий скрипт должен быть защищён if __name__ == '__main__'.
+
+    Args:
+        target: Искомое число
+        values: Список целых чисел или SharedIntArray (без повторного копирования)
+        workers: Количество процессов (по умолчанию - число ядер)
+        block: Размер блока в элементах (по умолчанию - от 4096 до 2^20)
+
+    Returns:
+        Кортеж (найденное_число или None, количество_сравнений)
+    """
+    if isinstance(values, SharedIntArray):
+        shared, owned = values, False
+    else:
+        try:
+            shared, owned = SharedIntArray(values), True
+        except (TypeError, ValueError):
+            # Не целые числа или не помещаются в int64 - просматриваем список как есть
+            return _sequential(target, values)
+
+    try:
+        size = shared.size
+        if isinstance(target, int) and not INT64_MIN <= target <= INT64_MAX:
+            return (None, size)
+
+        workers = workers or os.cpu_count() or 1
+        if block is None:
+            block = min(MAX_BLOCK, max(4096, size // (workers * 8)))
+        workers = max(1, min(workers, -(-size // block)))
+
+        context = multiprocessing.get_context(START_METHOD)
+        if START_METHOD == "forkserver":
+            context.set_forkserver_preload(["numpy"])
+        best = context.Value("q", size)
+        processes = [context.Process(target=_scan_blocks,
+                                     args=(shared.name, size, target, w, workers, block, best))
+                     for w in range(workers)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        if any(process.exitcode != 0 for process in processes):
+            raise RuntimeError("Процесс поиска завершился с ошибкой")
+
+        index = best.value
+        return (int(shared.array[index]), index + 1) if index < size else (None, size)
+    finally:
+        if owned:
+            shared.close()
+
+
+def benchmark_seq(size: int = 10_000_000, workers_counts=(1, 2, 4),
+                  seed: int = 0) -> Tuple[Dict[str, Dict[str, float]], float]:
+    """
+    Сравнивает обычный последовательный поиск guess_number и параллельный поиск по разделяемой памяти.
+
+    Args:
+        size: Длина неотсортированного списка
+        workers_counts: Количество процессов для параллельного поиска
+        seed: Зерно генератора случайных чисел
+
+    Returns:
+        Кортеж (словарь {вариант: {положение искомого числа: время в секундах}},
+        время копирования списка в разделяемую память в секундах)
+    """
+    from Lab2 import guess_number
+
+    rng = random.Random(seed)
+    values = list(range(size))
+    rng.shuffle(values)
+    targets = {"10%": values[size // 10], "90%": values[size * 9 // 10], "нет": -1}
+
+    results = {"guess_number 'seq'": {}}
+    for place, target in targets.items():
+        start = time.perf_counter()
+        guess_number(target, values, 'seq')
+        results["guess_number 'seq'"][place] = time.perf_counter() - start
+
+    with SharedIntArray(values) as shared:
+        parallel_seq_search(-1, shared, 1)  # прогрев: отображение страниц разделяемой памяти
+        for workers in workers_counts:
+            name = f"разделяемая память, {workers} проц."
+            results[name] = {}
+            for place, target in targets.items():
+                start = time.perf_counter()
+                parallel_seq_search(target, shared, workers)
+                results[name][place] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    SharedIntArray(values).close()
+    return results, time.perf_counter() - start
+
+
+def main():
+    size = 10_000_000
+    print(f"Последовательный поиск в неотсортированном списке из {size} чисел (время в секундах)")
+    print(f"Ядер: {os.cpu_count()}")
+    results, copy_time = benchmark_seq(size)
+
+    places = list(next(iter(results.values())))
+    print(f"{'Вариант':<36}" + "".join(f"{'число на ' + place if place != 'нет' else 'числа нет':<16}"
+                                       for place in places))
+    for name, timings in results.items():
+        print(f"{name:<36}" + "".join(f"{timings[place]:<16.3f}" for place in places))
+    print(f"Копирование списка в разделяемую память: {copy_time:.3f} с")
+
+
+if __name__ == "__main__":
+    main()
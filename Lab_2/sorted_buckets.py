@@ -0,0 +1,275 @@
+import bisect
+import itertools
+import random
+import time
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+
+class SortedBuckets:
+    """
+    Отсортированный набор чисел с быстрой вставкой и удалением (sqrt-декомпозиция).
+
+    Элементы хранятся в отсортированных корзинах размером от load / 2 до 2 * load,
+    а максимумы корзин - в отдельном списке. Вставка и удаление находят корзину
+    бинарным поиском по максимумам и сдвигают элементы только внутри неё,
+    поэтому стоят O(log n + load) вместо O(n) у отсортированного списка.
+    Переполненная корзина делится пополам, опустевшая удаляется.
+    """
+
+    def __init__(self, values: Iterable[int] = (), load: int = 1000):
+        """
+        Args:
+            values: Начальные элементы (в любом порядке, повторы допускаются)
+            load: Целевой размер корзины
+
+        Raises:
+            ValueError: Если размер корзины меньше 4
+        """
+        if load < 4:
+            raise ValueError("Размер корзины должен быть не меньше 4")
+        self._load = load
+        ordered = sorted(values)
+        self._lists: List[List[int]] = [ordered[i:i + load] for i in range(0, len(ordered), load)]
+        self._maxes: List[int] = [bucket[-1] for bucket in self._lists]
+        self._len = len(ordered)
+        self._offsets: Optional[List[int]] = None
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[int]:
+        return itertools.chain.from_iterable(self._lists)
+
+    def __contains__(self, value: int) -> bool:
+        pos = bisect.bisect_left(self._maxes, value)
+        if pos == len(self._maxes):
+            return False
+        bucket = self._lists[pos]
+        return bucket[bisect.bisect_left(bucket, value)] == value
+
+    def __getitem__(self, index: int) -> int:
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("Индекс вне диапазона")
+        offsets = self._get_offsets()
+        pos = bisect.bisect_right(offsets, index) - 1
+        return self._lists[pos][index - offsets[pos]]
+
+    def __repr__(self) -> str:
+        return f"SortedBuckets({list(self)})"
+
+    def _get_offsets(self) -> List[int]:
+        # Номера первых элементов корзин пересчитываются лениво - после изменений, при первом запросе
+        if self._offsets is None:
+            self._offsets = [0, *itertools.accumulate(len(bucket) for bucket in self._lists)][:-1]
+        return self._offsets
+
+    def add(self, value: int) -> None:
+        """Вставляет элемент, сохраняя порядок."""
+        maxes = self._maxes
+        if not maxes:
+            self._lists.append([value])
+            maxes.append(value)
+        else:
+            pos = bisect.bisect_right(maxes, value)
+            if pos == len(maxes):
+                pos -= 1
+                self._lists[pos].append(value)
+                maxes[pos] = value
+            else:
+                bisect.insort(self._lists[pos], value)
+            if len(self._lists[pos]) > 2 * self._load:
+                self._split(pos)
+        self._len += 1
+        self._offsets = None
+
+    def update(self, values: Iterable[int]) -> None:
+        """Вставляет несколько элементов."""
+        for value in values:
+            self.add(value)
+
+    def _split(self, pos: int) -> None:
+        bucket = self._lists[pos]
+        half = len(bucket) // 2
+        self._lists[pos:pos + 1] = [bucket[:half], bucket[half:]]
+        self._maxes[pos:pos + 1] = [bucket[half - 1], bucket[-1]]
+
+    def discard(self, value: int) -> bool:
+        """
+        Удаляет одно вхождение элемента, если он есть.
+
+        Returns:
+            True, если элемент был удалён
+        """
+        maxes = self._maxes
+        pos = bisect.bisect_left(maxes, value)
+        if pos == len(maxes):
+            return False
+        bucket = self._lists[pos]
+        index = bisect.bisect_left(bucket, value)
+        if bucket[index] != value:
+            return False
+
+        del bucket[index]
+        self._len -= 1
+        self._offsets = None
+        if not bucket:
+            del self._lists[pos]
+            del maxes[pos]
+        else:
+            maxes[pos] = bucket[-1]
+            if len(bucket) < self._load // 2 and len(self._lists) > 1:
+                self._merge(pos)
+        return True
+
+    def remove(self, value: int) -> None:
+        """
+        Удаляет одно вхождение элемента.
+
+        Raises:
+            ValueError: Если элемента нет в наборе
+        """
+        if not self.discard(value):
+            raise ValueError(f"Число {value} отсутствует в наборе")
+
+    def _merge(self, pos: int) -> None:
+        # Маленькая корзина сливается с соседней, а слишком большая после слияния снова делится
+        if pos == len(self._lists) - 1:
+            pos -= 1
+        self._lists[pos:pos + 2] = [self._lists[pos] + self._lists[pos + 1]]
+        self._maxes[pos:pos + 2] = [self._maxes[pos + 1]]
+        if len(self._lists[pos]) > 2 * self._load:
+            self._split(pos)
+
+    def search(self, target: int) -> Tuple[Optional[int], int]:
+        """
+        Бинарный поиск с подсчётом сравнений: сначала по максимумам корзин, затем внутри корзины.
+
+        Returns:
+            Кортеж (найденное_число или None, количество_сравнений)
+        """
+        comparisons = 0
+        maxes = self._maxes
+        left, right = 0, len(maxes)
+        while left < right:
+            comparisons += 1
+            mid = (left + right) // 2
+            if maxes[mid] < target:
+                left = mid + 1
+            else:
+                right = mid
+        if left == len(maxes):
+            return (None, comparisons)
+
+        bucket = self._lists[left]
+        left, right = 0, len(bucket) - 1
+        while left <= right:
+            comparisons += 1
+            mid = (left + right) // 2
+            if bucket[mid] == target:
+                return (bucket[mid], comparisons)
+            elif bucket[mid] < target:
+                left = mid + 1
+            else:
+                right = mid - 1
+        return (None, comparisons)
+
+    def _bisect(self, value: int, right: bool) -> int:
+        find = bisect.bisect_right if right else bisect.bisect_left
+        pos = find(self._maxes, value)
+        if pos == len(self._maxes):
+            return self._len
+        return self._get_offsets()[pos] + find(self._lists[pos], value)
+
+    def rank(self, value: int) -> int:
+        """Количество элементов, меньших value (позиция, на которую встал бы value)."""
+        return self._bisect(value, right=False)
+
+    def irange(self, minimum: int, maximum: int) -> Iterator[int]:
+        """Элементы из отрезка [minimum, maximum] по возрастанию."""
+        maxes = self._maxes
+        pos = bisect.bisect_left(maxes, minimum)
+        if pos == len(maxes):
+            return
+        bucket = self._lists[pos]
+        start = bisect.bisect_left(bucket, minimum)
+        for pos in range(pos, len(maxes)):
+            bucket = self._lists[pos]
+            if maxes[pos] <= maximum:
+                yield from bucket[start:]
+            else:
+                yield from bucket[start:bisect.bisect_right(bucket, maximum)]
+                return
+            start = 0
+
+    def count_range(self, minimum: int, maximum: int) -> int:
+        """Количество элементов из отрезка [minimum, maximum]."""
+        if minimum > maximum:
+            return 0
+        return self._bisect(maximum, right=True) - self._bisect(minimum, right=False)
+
+
+def benchmark_updates(sizes=(10_000, 100_000), operations: int = 500, seed: int = 0) -> dict:
+    """
+    Сравнивает поддержку изменяющегося набора: пересортировка списка и SortedBuckets.
+
+    Каждая операция - вставка или удаление случайного числа, за которой следует
+    бинарный поиск через guess_number.
+
+    Args:
+        sizes: Начальные размеры набора
+        operations: Количество операций для каждого варианта
+        seed: Зерно генератора случайных чисел
+
+    Returns:
+        Словарь {размер: {вариант: среднее время операции в секундах}}
+    """
+    from Lab2 import guess_number
+
+    results = {}
+    for n in sizes:
+        rng = random.Random(seed)
+        initial = [rng.randrange(10 * n) for _ in range(n)]
+        ops = [(rng.random() < 0.5, rng.randrange(10 * n)) for _ in range(operations)]
+
+        def resort():
+            lst = list(initial)
+            for insert, value in ops:
+                if insert:
+                    lst.append(value)
+                elif value in lst:
+                    lst.remove(value)
+                lst.sort()
+                guess_number(value, lst, 'bin')
+
+        def buckets():
+            sb = SortedBuckets(initial)
+            for insert, value in ops:
+                if insert:
+                    sb.add(value)
+                else:
+                    sb.discard(value)
+                guess_number(value, sb, 'bin')
+
+        timings = {}
+        for name, run in [("пересортировка списка", resort), ("SortedBuckets", buckets)]:
+            start = time.perf_counter()
+            run()
+            timings[name] = (time.perf_counter() - start) / operations
+        results[n] = timings
+    return results
+
+
+def main():
+    print("Изменение набора и бинарный поиск guess_number (среднее время операции)")
+    results = benchmark_updates()
+
+    names = list(next(iter(results.values())))
+    print(f"{'Размер':<10}" + "".join(f"{name + ' (мкс)':<30}" for name in names))
+    for n, timings in results.items():
+        print(f"{n:<10}" + "".join(f"{timings[name] * 1e6:<30.1f}" for name in names))
+
+
+if __name__ == "__main__":
+    main()
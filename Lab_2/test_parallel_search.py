@@ -0,0 +1,51 @@
+import random
+import unittest
+
+from Lab2 import guess_number
+from parallel_search import INT64_MAX, SharedIntArray, parallel_seq_search
+
+
+class TestParallelSearch(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        rng = random.Random(0)
+        cls.values = [rng.randint(-1000, 1000) for _ in range(50_000)]
+
+    def test_matches_sequential(self):
+        targets = [self.values[0], self.values[-1], self.values[len(self.values) // 2], 5000]
+        with SharedIntArray(self.values) as shared:
+            for target in targets:
+                expected = guess_number(target, self.values, 'seq')
+                for workers in (1, 2, 3):
+                    with self.subTest(target=target, workers=workers):
+                        self.assertEqual(parallel_seq_search(target, shared, workers, block=1000), expected)
+
+    def test_missing_target(self):
+        self.assertEqual(parallel_seq_search(5000, self.values, 2, block=1000), (None, len(self.values)))
+        self.assertEqual(parallel_seq_search(INT64_MAX + 1, self.values, 2), (None, len(self.values)))
+
+    def test_returns_stored_element(self):
+        values = [3, 1, 4, 1, 5]
+        self.assertEqual(parallel_seq_search(4.0, values, 2, block=1), guess_number(4.0, values, 'seq'))
+        found, comparisons = parallel_seq_search(4.0, values, 2, block=1)
+        self.assertIs(type(found), int)
+        self.assertEqual(comparisons, 3)
+
+    def test_guess_number_workers(self):
+        target = self.values[40_000]
+        self.assertEqual(guess_number(target, self.values, 'seq', workers=2),
+                         guess_number(target, self.values, 'seq'))
+
+    def test_non_int_fallback(self):
+        for values, target in [([1.5, 2.5, 3.5], 2.5), (["a", "b", "c"], "c"), ([1, 2 ** 70, 3], 2 ** 70)]:
+            with self.subTest(values=values):
+                self.assertEqual(parallel_seq_search(target, values, 2), guess_number(target, values, 'seq'))
+                self.assertEqual(parallel_seq_search(-7, values, 2), (None, len(values)))
+
+    def test_empty(self):
+        self.assertEqual(parallel_seq_search(1, [], 2), (None, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import bisect
+import random
+import unittest
+
+from Lab2 import guess_number
+from sorted_buckets import SortedBuckets
+
+
+class TestSortedBuckets(unittest.TestCase):
+
+    def check_invariants(self, buckets, reference):
+        self.assertEqual(list(buckets), reference)
+        self.assertEqual(len(buckets), len(reference))
+        for bucket, maximum in zip(buckets._lists, buckets._maxes):
+            self.assertTrue(bucket)
+            self.assertEqual(bucket[-1], maximum)
+            self.assertLessEqual(len(bucket), 2 * buckets._load)
+
+    def test_matches_sorted_list(self):
+        rng = random.Random(0)
+        buckets = SortedBuckets(load=4)
+        reference = []
+        for step in range(3000):
+            value = rng.randint(-50, 50)
+            if rng.random() < 0.6:
+                buckets.add(value)
+                bisect.insort(reference, value)
+            else:
+                removed = buckets.discard(value)
+                self.assertEqual(removed, value in reference)
+                if removed:
+                    reference.remove(value)
+            if step % 100 == 0:
+                self.check_invariants(buckets, reference)
+        self.check_invariants(buckets, reference)
+
+    def test_queries_match_bisect(self):
+        rng = random.Random(1)
+        reference = sorted(rng.randint(-100, 100) for _ in range(500))
+        buckets = SortedBuckets(reference[::-1], load=8)
+        for i in (0, 1, len(reference) // 2, -1, -len(reference)):
+            self.assertEqual(buckets[i], reference[i])
+        for value in range(-105, 106):
+            self.assertEqual(value in buckets, value in reference)
+            self.assertEqual(buckets.rank(value), bisect.bisect_left(reference, value))
+            high = value + rng.randint(-5, 20)
+            expected = reference[bisect.bisect_left(reference, value):bisect.bisect_right(reference, high)]
+            self.assertEqual(list(buckets.irange(value, high)), expected)
+            self.assertEqual(buckets.count_range(value, high), len(expected))
+
+    def test_search_matches_binary_search(self):
+        rng = random.Random(2)
+        values = [rng.randint(0, 1000) for _ in range(2000)]
+        buckets = SortedBuckets(values, load=16)
+        for target in range(-1, 1002, 7):
+            found, comparisons = buckets.search(target)
+            self.assertEqual(found, target if target in values else None)
+            self.assertEqual(guess_number(target, buckets, 'bin')[0], found)
+            self.assertGreater(comparisons, 0)
+
+    def test_empty(self):
+        buckets = SortedBuckets()
+        self.assertEqual(buckets.search(1), (None, 0))
+        self.assertNotIn(1, buckets)
+        self.assertEqual(list(buckets.irange(0, 10)), [])
+        self.assertEqual(buckets.count_range(0, 10), 0)
+        self.assertFalse(buckets.discard(1))
+        with self.assertRaises(IndexError):
+            buckets[0]
+
+    def test_remove_missing(self):
+        buckets = SortedBuckets([1, 2, 3])
+        with self.assertRaises(ValueError):
+            buckets.remove(5)
+
+    def test_small_load_rejected(self):
+        with self.assertRaises(ValueError):
+            SortedBuckets(load=3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,7 +2,8 @@ from collections import defaultdict, deque
 from typing import Any, Dict, Optional
 
 def gen_bin_tree(root: int = 12, height: int = 4, 
-                 left_func: callable = None, right_func: callable = None) -> Dict[str, Any]:
+                 left_func: callable = None, right_func: callable = None,
+                 index: Any = None) -> Dict[str, Any]:
     """
     Рекурсивная генерация бинарного дерева в виде словаря.
     
@@ -11,6 +12,8 @@ def gen_bin_tree(root: int = 12, height: int = 4,
         height: высота дерева
         left_func: функция для вычисления левого потомка (root^3)
         right_func: функция для вычисления правого потомка ((root*2)-1)
+        index: обратный индекс с методом add(value, key, level), например TreeIndex из Lab_5;
+            ключ узла - путь вида 'root.left.right'
     
     Returns:
         Словарь, представляющий бинарное дерево
@@ -21,11 +24,14 @@ def gen_bin_tree(root: int = 12, height: int = 4,
     if right_func is None:
         right_func = lambda x: (x * 2) - 1
     
-    def build_tree(node_value: int, current_height: int) -> Optional[Dict[str, Any]]:
+    def build_tree(node_value: int, current_height: int, path: str = "root") -> Optional[Dict[str, Any]]:
         """Рекурсивная функция построения дерева."""
         if current_height <= 0:
             return None
         
+        if index is not None:
+            index.add(node_value, path, height - current_height)
+        
         tree = {
             'root': node_value,
             'left': None,
@@ -33,8 +39,12 @@ def gen_bin_tree(root: int = 12, height: int = 4,
         }
         
         if current_height > 1:
-            tree['left'] = build_tree(left_func(node_value), current_height - 1)
-            tree['right'] = build_tree(right_func(node_value), current_height - 1)
+            # Пути нужны только индексу - без него строки не формируются
+            left_path = right_path = None
+            if index is not None:
+                left_path, right_path = f"{path}.left", f"{path}.right"
+            tree['left'] = build_tree(left_func(node_value), current_height - 1, left_path)
+            tree['right'] = build_tree(right_func(node_value), current_height - 1, right_path)
         
         return tree
     
@@ -128,13 +138,15 @@ def print_tree_collections(node: TreeNode, indent: str = "", child_type: str = "
         print_tree_collections(node.children['right'], indent + "    ", "right")
 
 
-def tree_with_deque(root: int = 12, height: int = 4) -> Dict[int, list]:
+def tree_with_deque(root: int = 12, height: int = 4, index: Any = None) -> Dict[int, list]:
     """
     Реализация дерева с использованием deque для обхода в ширину.
     
     Args:
         root: значение корневого узла
         height: высота дерева
+        index: обратный индекс с методом add(value, key, level); ключ узла - номер в куче
+            (корень 1, потомки узла i - 2i и 2i + 1), он совпадает с порядком обхода в ширину
     
     Returns:
         Словарь, где ключи - уровни дерева, значения - списки узлов на уровне
@@ -144,6 +156,7 @@ def tree_with_deque(root: int = 12, height: int = 4) -> Dict[int, list]:
     
     result = defaultdict(list)
     queue = deque([(root, 0, "root")])  # (значение, уровень, тип)
+    position = 0
     
     while queue:
         value, level, node_type = queue.popleft()
@@ -152,6 +165,9 @@ def tree_with_deque(root: int = 12, height: int = 4) -> Dict[int, list]:
             break
         
         result[level].append((value, node_type))
+        position += 1
+        if index is not None:
+            index.add(value, position, level)
         
         if level < height - 1:
             left_value = value ** 3
@@ -1,7 +1,7 @@
 import timeit
 import matplotlib.pyplot as plt
 from functools import lru_cache
-from typing import List, Callable, Tuple
+from typing import List, Callable, Iterable, Iterator, Tuple
 
 
 def fact_recursive(n: int) -> int:
@@ -19,11 +19,13 @@ def fact_recursive(n: int) -> int:
     return n * fact_recursive(n - 1)
 
 
-@lru_cache(maxsize=None)
+@lru_cache(maxsize=1024)
 def fact_recursive_cached(n: int) -> int:
     """
     Вычисление факториала числа рекурсивным методом с мемоизацией.
     
+    Кэш ограничен 1024 значениями, статистика доступна через cache_info().
+    
     Args:
         n (int): Число для вычисления факториала (n >= 0)
         
@@ -51,6 +53,63 @@ def fact_iterative(n: int) -> int:
     return result
 
 
+# Итеративный вариант с ограниченным кэшем для нагрузок с повторяющимися n
+fact_iterative_cached = lru_cache(maxsize=1024)(fact_iterative)
+
+
+def range_product(low: int, high: int) -> int:
+    """
+    Произведение целых чисел из полуинтервала (low, high] деревом произведений.
+    
+    Диапазон рекурсивно делится пополам, поэтому перемножаются числа
+    сопоставимой длины - это быстрее, чем домножать растущее произведение
+    на маленькие множители по одному.
+    
+    Args:
+        low (int): Левая граница (не входит в произведение)
+        high (int): Правая граница (входит в произведение)
+        
+    Returns:
+        int: (low + 1) * (low + 2) * ... * high или 1 для пустого диапазона
+    """
+    if high - low <= 16:
+        result = 1
+        for i in range(low + 1, high + 1):
+            result *= i
+        return result
+    middle = (low + high) // 2
+    return range_product(low, middle) * range_product(middle, high)
+
+
+def factorials_for(ns: Iterable[int]) -> Iterator[Tuple[int, int]]:
+    """
+    Факториалы для возрастающей последовательности чисел за один проход.
+    
+    Каждый следующий факториал получается из предыдущего домножением на
+    произведение (prev, n], вычисленное деревом произведений, поэтому весь
+    пакет стоит примерно как вычисление наибольшего факториала.
+    Результаты выдаются по мере вычисления.
+    
+    Args:
+        ns: Неотрицательные числа по неубыванию (например, результат get_numbers_from_input)
+        
+    Yields:
+        Tuple[int, int]: Пары (n, n!)
+        
+    Raises:
+        ValueError: Если число отрицательное или последовательность убывает
+    """
+    previous, result = 0, 1
+    for n in ns:
+        if n < 0:
+            raise ValueError(f"Факториал не определён для отрицательного числа {n}")
+        if n < previous:
+            raise ValueError(f"Числа должны идти по неубыванию: {n} после {previous}")
+        result *= range_product(previous, n)
+        previous = n
+        yield n, result
+
+
 def benchmark(func: Callable[[int], int], n: int, number: int = 1000, repeat: int = 5) -> float:
     """
     Замер времени выполнения функции для заданного n.
@@ -164,6 +223,25 @@ def print_statistics(test_data: List[int],
         print(f"  Итеративный:           {results_iterative[idx]:.2e} с")
 
 
+def compare_batch(test_data: List[int], repeat: int = 5) -> Tuple[float, float]:
+    """
+    Сравнение вычисления факториалов всего списка по одному и пакетом factorials_for.
+    
+    Args:
+        test_data: Отсортированный список чисел без повторов
+        repeat: Количество повторений (берётся минимальное время)
+        
+    Returns:
+        Tuple[float, float]: Время (с) для fact_iterative по каждому числу и для factorials_for
+    """
+    time_single = min(timeit.repeat(lambda: [fact_iterative(n) for n in test_data], repeat=repeat, number=1))
+    time_batch = min(timeit.repeat(lambda: list(factorials_for(test_data)), repeat=repeat, number=1))
+    
+    print(f"\nВесь список: итеративно по одному={time_single:.2e} с, "
+          f"пакетом factorials_for={time_batch:.2e} с")
+    return time_single, time_batch
+
+
 def save_recursive_vs_iterative_plot(test_data: List[int],
                                      results_recursive: List[float],
                                      results_iterative: List[float]) -> None:
@@ -200,6 +278,8 @@ def main() -> None:
     
     print_statistics(test_data, results_recursive, results_recursive_cached, results_iterative)
     
+    compare_batch(test_data)
+    
     save_recursive_vs_iterative_plot(test_data, results_recursive, results_iterative)
     
 
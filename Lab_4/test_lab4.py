@@ -0,0 +1,45 @@
+import math
+import random
+import unittest
+
+from Lab4 import fact_iterative, fact_iterative_cached, fact_recursive, factorials_for, range_product
+
+
+class TestFactorials(unittest.TestCase):
+
+    def test_single_factorials(self):
+        for n in range(0, 60):
+            self.assertEqual(fact_recursive(n), math.factorial(n))
+            self.assertEqual(fact_iterative(n), math.factorial(n))
+            self.assertEqual(fact_iterative_cached(n), math.factorial(n))
+
+    def test_range_product(self):
+        rng = random.Random(0)
+        for _ in range(200):
+            low = rng.randint(0, 300)
+            high = low + rng.randint(0, 300)
+            self.assertEqual(range_product(low, high), math.factorial(high) // math.factorial(low))
+        self.assertEqual(range_product(5, 5), 1)
+
+    def test_factorials_for_matches_math(self):
+        rng = random.Random(1)
+        ns = sorted(rng.randint(0, 2000) for _ in range(50))
+        ns[1:1] = [ns[0]]  # повтор
+        self.assertEqual(list(factorials_for(ns)), [(n, math.factorial(n)) for n in ns])
+        self.assertEqual(list(factorials_for([0, 0, 1])), [(0, 1), (0, 1), (1, 1)])
+        self.assertEqual(list(factorials_for([])), [])
+
+    def test_factorials_for_is_lazy(self):
+        results = factorials_for(iter([3, 5, 2]))
+        self.assertEqual(next(results), (3, 6))
+        self.assertEqual(next(results), (5, 120))
+        with self.assertRaises(ValueError):
+            next(results)
+
+    def test_factorials_for_negative(self):
+        with self.assertRaises(ValueError):
+            list(factorials_for([1, -1]))
+
+
+if __name__ == "__main__":
+    unittest.main()
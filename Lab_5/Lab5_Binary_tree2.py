@@ -1,13 +1,16 @@
 from collections import deque, namedtuple, defaultdict, OrderedDict
 from typing import Dict, Optional, Callable
 
+from tree_index import TreeIndex
+
 # Определение структуры узла с помощью namedtuple
 TreeNode = namedtuple('TreeNode', ['value', 'left', 'right'])
 
 def gen_bin_tree(height: int = 4, 
                  root: int = 12, 
                  left_branch: Callable[[int], int] = lambda x: x ** 3,
-                 right_branch: Callable[[int], int] = lambda x: (x * 2) - 1) -> Dict:
+                 right_branch: Callable[[int], int] = lambda x: (x * 2) - 1,
+                 index: Optional[TreeIndex] = None) -> Dict:
     """
     Генерация бинарного дерева нерекурсивным способом.
     
@@ -16,6 +19,7 @@ def gen_bin_tree(height: int = 4,
         root: Значение корневого узла
         left_branch: Функция для вычисления левого потомка
         right_branch: Функция для вычисления правого потомка
+        index: Обратный индекс, в который добавляются узлы (ключ - путь узла)
     
     Returns:
         Словарь, представляющий бинарное дерево
@@ -35,6 +39,8 @@ def gen_bin_tree(height: int = 4,
         
         # Добавляем узел в словарь
         tree_dict[path] = value
+        if index is not None:
+            index.add(value, path, current_height - 1)
         
         # Если достигли максимальной высоты, не добавляем потомков
         if current_height >= height:
@@ -0,0 +1,75 @@
+import json
+import os
+import tempfile
+import unittest
+
+from Lab5_Binary_tree2 import gen_bin_tree
+from tree_builder import TreeBuilder
+
+
+def cheap_left(x):
+    return 2 * x
+
+
+def cheap_right(x):
+    return 2 * x + 1
+
+
+class TestTreeBuilder(unittest.TestCase):
+
+    def test_extend_matches_gen_bin_tree(self):
+        builder = TreeBuilder()
+        for height in range(0, 7):
+            self.assertEqual(builder.tree, gen_bin_tree(height))
+            self.assertEqual(builder.height, height)
+            builder.extend(1)
+
+    def test_shrink_and_resize(self):
+        builder = TreeBuilder(1, cheap_left, cheap_right, height=8)
+        for height in (5, 0, 3, 10, 2):
+            builder.resize(height)
+            self.assertEqual(builder.tree, gen_bin_tree(height, 1, cheap_left, cheap_right))
+            self.assertEqual(builder.height, height)
+        self.assertEqual(builder.frontier, [("root.left", 2), ("root.right", 3)])
+
+    def test_invalid_levels(self):
+        builder = TreeBuilder(height=2)
+        with self.assertRaises(ValueError):
+            builder.extend(-1)
+        with self.assertRaises(ValueError):
+            builder.shrink(3)
+        with self.assertRaises(ValueError):
+            builder.resize(-1)
+
+    def test_save_load_round_trip(self):
+        # Значения x ** 3 быстро выходят за 4300 десятичных цифр
+        builder = TreeBuilder(height=9)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "tree.json")
+            builder.save(path)
+            loaded = TreeBuilder.load(path)
+        self.assertEqual(loaded.tree, builder.tree)
+        self.assertEqual(loaded.frontier, builder.frontier)
+        loaded.extend(1)
+        builder.extend(1)
+        self.assertEqual(loaded.tree, builder.tree)
+        loaded.shrink(3)
+        self.assertEqual(loaded.tree, gen_bin_tree(7))
+
+    def test_state_is_json(self):
+        builder = TreeBuilder(-3, cheap_left, cheap_right, height=4)
+        state = json.loads(json.dumps(builder.to_state()))
+        restored = TreeBuilder.from_state(state, cheap_left, cheap_right)
+        self.assertEqual(restored.tree, gen_bin_tree(4, -3, cheap_left, cheap_right))
+
+    def test_invalid_state(self):
+        state = TreeBuilder(height=3).to_state()
+        with self.assertRaises(ValueError):
+            TreeBuilder.from_state({**state, "version": 0})
+        state["levels"][2].pop()
+        with self.assertRaises(ValueError):
+            TreeBuilder.from_state(state)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+import os
+import sys
+import unittest
+from collections import defaultdict
+
+from Lab5_Binary_tree2 import gen_bin_tree
+from tree_index import TreeIndex
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Lab_3"))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Lab_6"))
+
+
+def heap_nodes(height, root):
+    """Узлы дерева Lab_3/Lab_6 {номер в куче: значение} для функций x ** 3 и 2x - 1."""
+    nodes = {1: root}
+    for position in range(1, 2 ** (height - 1)):
+        nodes[2 * position] = nodes[position] ** 3
+        nodes[2 * position + 1] = nodes[position] * 2 - 1
+    return nodes
+
+
+def expected_positions(nodes):
+    positions = defaultdict(list)
+    for key, value in nodes.items():
+        positions[value].append(key)
+    return positions
+
+
+class TestTreeIndex(unittest.TestCase):
+
+    def check_index(self, index, nodes, level_of):
+        positions = expected_positions(nodes)
+        self.assertEqual(len(index), len(nodes))
+        for value, keys in positions.items():
+            self.assertEqual(sorted(index.find(value)), sorted(keys))
+            self.assertIn(value, index)
+        self.assertEqual(index.find(object()), [])
+
+        levels = defaultdict(list)
+        for key, value in nodes.items():
+            levels[level_of(key)].append(value)
+        self.assertEqual(index.height, len(levels))
+        for level, values in levels.items():
+            self.assertEqual(index.level_bounds(level), (min(values), max(values)))
+        self.assertIsNone(index.level_bounds(index.height))
+
+        if not index.compact:
+            values = sorted(positions)
+            low, high = values[len(values) // 4], values[len(values) // 2]
+            expected = {value: sorted(keys) for value, keys in positions.items() if low <= value <= high}
+            found = index.find_range(low, high)
+            self.assertEqual({value: sorted(keys) for value, keys in found.items()}, expected)
+            for level in range(index.height):
+                if level not in index.levels_in_range(low, high):
+                    self.assertFalse(any(low <= value <= high for value in levels[level]))
+
+    def test_lab5_gen_bin_tree(self):
+        for compact in (False, True):
+            for left, right in [(lambda x: x + 1, lambda x: x - 1), (lambda x: x ** 3, lambda x: 2 * x - 1)]:
+                with self.subTest(compact=compact):
+                    index = TreeIndex(compact)
+                    tree = gen_bin_tree(6, 2, left, right, index=index)
+                    self.check_index(index, tree, lambda path: path.count("."))
+
+    def test_lab3_generators(self):
+        from Lab3_Binary_tree import gen_bin_tree as gen_nested_tree, tree_with_deque
+
+        for compact in (False, True):
+            for root in (12, 1, 0):
+                with self.subTest(compact=compact, root=root):
+                    index = TreeIndex(compact)
+                    gen_nested_tree(root, 5, index=index)
+                    reference = gen_bin_tree(5, root)
+                    self.check_index(index, reference, lambda path: path.count("."))
+
+                    index = TreeIndex(compact)
+                    tree_with_deque(root, 5, index=index)
+                    self.check_index(index, heap_nodes(5, root), lambda key: key.bit_length() - 1)
+
+    def test_lab6_generators(self):
+        from Lab6 import build_tree_iterative, build_tree_recursive
+
+        for build in (build_tree_recursive, build_tree_iterative):
+            for compact in (False, True):
+                with self.subTest(build=build.__name__, compact=compact):
+                    index = TreeIndex(compact)
+                    build(5, 1, index=index)
+                    self.check_index(index, heap_nodes(5, 1), lambda key: key.bit_length() - 1)
+
+                    index = TreeIndex(compact)
+                    build(5, 12, index=index)
+                    self.check_index(index, heap_nodes(5, 12), lambda key: key.bit_length() - 1)
+
+    def test_compact_mode(self):
+        index = TreeIndex(compact=True)
+        gen_bin_tree(5, 12, index=index)
+        huge = 12 ** 27
+        self.assertEqual(index.find(huge), ["root.left.left.left"])
+        self.assertNotIn(huge + 1, index)
+        self.assertEqual(index._levels, [[] for _ in range(5)])
+        with self.assertRaises(ValueError):
+            index.find_range(0, 100)
+        self.assertEqual(index.levels_in_range(12, 12), [0])
+
+    def test_compact_equal_numbers(self):
+        for compact in (False, True):
+            with self.subTest(compact=compact):
+                index = TreeIndex(compact)
+                index.add(2, "root", 0)
+                index.add(2.0 ** 70, "root.left", 1)
+                index.add(-1.0, "root.right", 1)
+                self.assertEqual(index.find(2.0), ["root"])
+                self.assertEqual(index.find(2 ** 70), ["root.left"])
+                self.assertEqual(index.find(-1), ["root.right"])
+                index.add(1, "root.left.left", 2)
+                self.assertEqual(index.find(True), ["root.left.left"])
+                self.assertNotIn(2.5, index)
+
+    def test_duplicates(self):
+        index = TreeIndex()
+        gen_bin_tree(4, 1, index=index)
+        self.assertEqual(len(index.find(1)), 15)
+        self.assertEqual(index.find_range(0, 2), {1: index.find(1)})
+
+    def test_empty(self):
+        index = TreeIndex()
+        gen_bin_tree(0, index=index)
+        self.assertEqual(len(index), 0)
+        self.assertEqual(index.find(12), [])
+        self.assertEqual(index.find_range(0, 100), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import math
+import os
+import sys
+import unittest
+
+import numpy as np
+
+from Lab5_Binary_tree2 import gen_bin_tree
+from vectorized_tree import gen_bin_tree_vectorized, gen_levels
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Lab_3"))
+
+
+class TestVectorizedTree(unittest.TestCase):
+
+    def test_default_branches_overflow_to_object(self):
+        # x ** 3 от корня 12 выходит за int64 на третьем уровне
+        for height in range(0, 7):
+            self.assertEqual(gen_bin_tree_vectorized(height), gen_bin_tree(height))
+        levels = gen_levels(6)
+        self.assertEqual(levels[1].dtype, np.int64)
+        self.assertEqual(levels[-1].dtype, object)
+
+    def test_cheap_branches_stay_int64(self):
+        left, right = (lambda x: x + 1), (lambda x: x - 1)
+        self.assertEqual(gen_bin_tree_vectorized(10, 12, left, right), gen_bin_tree(10, 12, left, right))
+        self.assertEqual(gen_levels(10, 12, left, right)[-1].dtype, np.int64)
+
+    def test_negative_and_huge_roots(self):
+        for root in (-7, 0, 1, 2 ** 63, -(2 ** 70)):
+            with self.subTest(root=root):
+                self.assertEqual(gen_bin_tree_vectorized(5, root), gen_bin_tree(5, root))
+
+    def test_int64_boundary(self):
+        left, right = (lambda x: x * 2 ** 20), (lambda x: -x * 2 ** 20)
+        self.assertEqual(gen_bin_tree_vectorized(5, 3, left, right), gen_bin_tree(5, 3, left, right))
+
+    def test_scalar_only_and_constant_branches(self):
+        left, right = math.factorial, (lambda x: 5)
+        self.assertEqual(gen_bin_tree_vectorized(4, 3, left, right), gen_bin_tree(4, 3, left, right))
+
+    def test_float_branches(self):
+        left, right = (lambda x: x / 2), (lambda x: x * 1.5)
+        self.assertEqual(gen_bin_tree_vectorized(6, 12, left, right), gen_bin_tree(6, 12, left, right))
+
+    def test_nested_matches_lab3(self):
+        from Lab3_Binary_tree import gen_bin_tree as gen_nested_tree
+
+        for height in range(0, 6):
+            self.assertEqual(gen_bin_tree_vectorized(height, fmt="nested"), gen_nested_tree(12, height))
+
+    def test_flat_heap_order(self):
+        left, right = (lambda x: 3 * x), (lambda x: 3 * x + 1)
+        flat = gen_bin_tree_vectorized(6, 1, left, right, fmt="flat")
+        self.assertEqual(len(flat), 63)
+        for i in range(31):
+            self.assertEqual(flat[2 * i + 1], left(flat[i]))
+            self.assertEqual(flat[2 * i + 2], right(flat[i]))
+        self.assertEqual(len(gen_bin_tree_vectorized(0, fmt="flat")), 0)
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            gen_bin_tree_vectorized(3, fmt="xml")
+
+
+if __name__ == "__main__":
+    unittest.main()
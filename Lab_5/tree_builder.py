@@ -0,0 +1,212 @@
+import json
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+STATE_VERSION = 1
+
+
+def _encode(value: Any) -> Any:
+    # Огромные целые не переводятся в десятичную строку (ограничение 4300 цифр),
+    # поэтому хранятся шестнадцатеричной строкой - перевод линейный и без ограничений
+    return format(value, "x") if type(value) is int else value
+
+
+def _decode(value: Any) -> Any:
+    return int(value, 16) if isinstance(value, str) else value
+
+
+class TreeBuilder:
+    """
+    Наращиваемое бинарное дерево в формате gen_bin_tree ({путь: значение}).
+
+    Строитель хранит узлы по уровням и фронт - нижний уровень, поэтому
+    extend вычисляет только новые листья, а shrink удаляет нижние уровни
+    без пересчёта остального дерева. Перебор высот 1..h стоит как одно
+    построение дерева высоты h, а не сумма построений всех высот.
+    """
+
+    def __init__(self, root: int = 12,
+                 left_branch: Callable[[int], int] = lambda x: x ** 3,
+                 right_branch: Callable[[int], int] = lambda x: (x * 2) - 1,
+                 height: int = 0):
+        """
+        Args:
+            root: Значение корневого узла
+            left_branch: Функция для вычисления левого потомка
+            right_branch: Функция для вычисления правого потомка
+            height: Начальная высота дерева
+        """
+        self.root = root
+        self.left_branch = left_branch
+        self.right_branch = right_branch
+        self.tree: Dict[str, int] = {}
+        self._levels: List[List[str]] = []
+        self.extend(height)
+
+    @property
+    def height(self) -> int:
+        return len(self._levels)
+
+    @property
+    def frontier(self) -> List[Tuple[str, int]]:
+        """Узлы нижнего уровня (путь, значение) слева направо."""
+        if not self._levels:
+            return []
+        return [(path, self.tree[path]) for path in self._levels[-1]]
+
+    def extend(self, levels: int = 1) -> Dict[str, int]:
+        """
+        Добавляет уровни снизу, вычисляя только новые узлы.
+
+        Args:
+            levels: Количество добавляемых уровней
+
+        Returns:
+            Словарь дерева (тот же объект, что self.tree)
+
+        Raises:
+            ValueError: Если levels отрицательно
+        """
+        if levels < 0:
+            raise ValueError("Количество уровней не может быть отрицательным")
+        tree = self.tree
+        left_branch, right_branch = self.left_branch, self.right_branch
+        for _ in range(levels):
+            if not self._levels:
+                tree["root"] = self.root
+                self._levels.append(["root"])
+                continue
+            paths = []
+            for path in self._levels[-1]:
+                value = tree[path]
+                left_path, right_path = f"{path}.left", f"{path}.right"
+                tree[left_path] = left_branch(value)
+                tree[right_path] = right_branch(value)
+                paths.append(left_path)
+                paths.append(right_path)
+            self._levels.append(paths)
+        return tree
+
+    def shrink(self, levels: int = 1) -> Dict[str, int]:
+        """
+        Удаляет нижние уровни.
+
+        Args:
+            levels: Количество удаляемых уровней (не больше текущей высоты)
+
+        Returns:
+            Словарь дерева (тот же объект, что self.tree)
+
+        Raises:
+            ValueError: Если levels отрицательно или больше высоты дерева
+        """
+        if not 0 <= levels <= self.height:
+            raise ValueError(f"Можно удалить от 0 до {self.height} уровней")
+        tree = self.tree
+        for _ in range(levels):
+            for path in self._levels.pop():
+                del tree[path]
+        return tree
+
+    def resize(self, height: int) -> Dict[str, int]:
+        """Наращивает или укорачивает дерево до заданной высоты."""
+        if height < 0:
+            raise ValueError("Высота не может быть отрицательной")
+        if height >= self.height:
+            return self.extend(height - self.height)
+        return self.shrink(self.height - height)
+
+    def to_state(self) -> Dict[str, Any]:
+        """
+        Состояние строителя для сохранения в JSON: корень и значения узлов по уровням.
+
+        Пути не сохраняются - они однозначно восстанавливаются по порядку узлов уровня.
+        """
+        return {
+            "version": STATE_VERSION,
+            "root": _encode(self.root),
+            "levels": [[_encode(self.tree[path]) for path in paths] for paths in self._levels],
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any],
+                   left_branch: Callable[[int], int] = lambda x: x ** 3,
+                   right_branch: Callable[[int], int] = lambda x: (x * 2) - 1) -> "TreeBuilder":
+        """
+        Восстанавливает строитель без пересчёта узлов.
+
+        Функции ветвей не сериализуются, их нужно передать те же, что при построении.
+
+        Raises:
+            ValueError: Если состояние другой версии или размеры уровней не соответствуют бинарному дереву
+        """
+        if state.get("version") != STATE_VERSION:
+            raise ValueError(f"Неподдерживаемая версия состояния: {state.get('version')}")
+        builder = cls(_decode(state["root"]), left_branch, right_branch)
+        paths = ["root"]
+        for depth, values in enumerate(state["levels"]):
+            if depth > 0:
+                paths = [f"{path}.{side}" for path in paths for side in ("left", "right")]
+            if len(values) != len(paths):
+                raise ValueError(f"На уровне {depth} ожидалось {len(paths)} узлов, получено {len(values)}")
+            builder.tree.update(zip(paths, map(_decode, values)))
+            builder._levels.append(paths)
+        return builder
+
+    def save(self, filename: str) -> None:
+        """Сохраняет состояние в JSON-файл."""
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump(self.to_state(), f)
+
+    @classmethod
+    def load(cls, filename: str,
+             left_branch: Callable[[int], int] = lambda x: x ** 3,
+             right_branch: Callable[[int], int] = lambda x: (x * 2) - 1) -> "TreeBuilder":
+        """Загружает строитель из JSON-файла, сохранённого save (см. from_state)."""
+        with open(filename, encoding="utf-8") as f:
+            return cls.from_state(json.load(f), left_branch, right_branch)
+
+
+def benchmark_sweep(max_height: int = 12, root: int = 12,
+                    left_branch: Optional[Callable[[int], int]] = None,
+                    right_branch: Optional[Callable[[int], int]] = None) -> Dict[str, float]:
+    """
+    Сравнивает перебор высот 1..max_height: gen_bin_tree заново и TreeBuilder.extend(1).
+
+    Returns:
+        Словарь {вариант: суммарное время в секундах}
+    """
+    from Lab5_Binary_tree2 import gen_bin_tree
+
+    branches = {}
+    if left_branch is not None:
+        branches["left_branch"] = left_branch
+    if right_branch is not None:
+        branches["right_branch"] = right_branch
+
+    start = time.perf_counter()
+    for height in range(1, max_height + 1):
+        gen_bin_tree(height, root, **branches)
+    rebuild = time.perf_counter() - start
+
+    start = time.perf_counter()
+    builder = TreeBuilder(root, **branches)
+    for _ in range(max_height):
+        builder.extend(1)
+    incremental = time.perf_counter() - start
+
+    return {"gen_bin_tree для каждой высоты": rebuild, "TreeBuilder.extend(1)": incremental}
+
+
+def main():
+    print("Перебор высот дерева Lab_5 от 1 до 12 (суммарное время)")
+    for name, seconds in benchmark_sweep().items():
+        print(f"{name:<32} {seconds:.4f} с")
+
+    print("\nТо же с дешёвыми функциями 2x и 2x + 1 до высоты 18")
+    for name, seconds in benchmark_sweep(18, 1, lambda x: 2 * x, lambda x: 2 * x + 1).items():
+        print(f"{name:<32} {seconds:.4f} с")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+import bisect
+import time
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+# В компактном режиме небольшие целые хранятся как есть, а остальные значения -
+# как hash(value), сдвинутый за пределы диапазона небольших целых, чтобы ключи не пересекались
+_SMALL_LIMIT = 1 << 62
+
+
+class _Positions(list):
+    """Список позиций значения, встречающегося в дереве несколько раз."""
+    __slots__ = ()
+
+
+class TreeIndex:
+    """
+    Обратный индекс дерева: значение -> позиции узлов, плюс границы значений по уровням.
+
+    Заполняется генераторами деревьев во время построения (параметр index): они
+    вызывают add(value, key, level) для каждого узла. Ключ - то, чем генератор
+    адресует узел: путь 'root.left.right' или номер в куче (корень 1, потомки 2i и 2i + 1).
+
+    В компактном режиме вместо огромных чисел (x ** 3 быстро растёт) хранятся их хеши,
+    поэтому индекс не удерживает значения в памяти. Ценой этого с вероятностью порядка
+    n / 2^62 find может вернуть позиции другого значения с тем же хешем, а поиск по
+    диапазону доступен только на уровне границ уровней.
+    """
+
+    def __init__(self, compact: bool = False):
+        """
+        Args:
+            compact: Хранить хеши значений вместо самих значений
+        """
+        self.compact = compact
+        self._positions: Dict[Hashable, Any] = {}
+        self._mins: List[Any] = []
+        self._maxes: List[Any] = []
+        self._counts: List[int] = []
+        self._levels: List[List[Any]] = []
+        self._sorted_levels: Dict[int, List[Any]] = {}
+
+    def _key(self, value: Any) -> Hashable:
+        if not self.compact:
+            return value
+        # Равные числа разных типов (2, 2.0, True) должны попадать в один ключ, как в обычном режиме
+        if type(value) is bool or type(value) is float and value.is_integer():
+            value = int(value)
+        if type(value) is int and -_SMALL_LIMIT <= value < _SMALL_LIMIT:
+            return value
+        return _SMALL_LIMIT + hash(value) % _SMALL_LIMIT
+
+    def add(self, value: Any, key: Hashable, level: int) -> None:
+        """
+        Добавляет узел в индекс.
+
+        Args:
+            value: Значение узла
+            key: Позиция узла (путь или номер в куче)
+            level: Глубина узла (корень - 0)
+        """
+        index_key = self._key(value)
+        positions = self._positions
+        existing = positions.get(index_key)
+        if existing is None:
+            positions[index_key] = key
+        elif type(existing) is _Positions:
+            existing.append(key)
+        else:
+            positions[index_key] = _Positions((existing, key))
+
+        if level >= len(self._counts):
+            missing = level + 1 - len(self._counts)
+            self._mins.extend([None] * missing)
+            self._maxes.extend([None] * missing)
+            self._counts.extend([0] * missing)
+            self._levels.extend([] for _ in range(missing))
+        if self._counts[level] == 0:
+            self._mins[level] = self._maxes[level] = value
+        elif value < self._mins[level]:
+            self._mins[level] = value
+        elif value > self._maxes[level]:
+            self._maxes[level] = value
+        self._counts[level] += 1
+        if not self.compact:
+            self._levels[level].append(value)
+            self._sorted_levels.pop(level, None)
+
+    def find(self, value: Any) -> List[Hashable]:
+        """Все позиции узлов с данным значением (пустой список, если значения нет)."""
+        found = self._positions.get(self._key(value))
+        if found is None:
+            return []
+        return list(found) if type(found) is _Positions else [found]
+
+    def __contains__(self, value: Any) -> bool:
+        return self._key(value) in self._positions
+
+    def __len__(self) -> int:
+        """Количество проиндексированных узлов."""
+        return sum(self._counts)
+
+    @property
+    def height(self) -> int:
+        return len(self._counts)
+
+    def level_bounds(self, level: int) -> Optional[Tuple[Any, Any]]:
+        """Наименьшее и наибольшее значение на уровне или None для пустого уровня."""
+        if level >= len(self._counts) or self._counts[level] == 0:
+            return None
+        return self._mins[level], self._maxes[level]
+
+    def levels_in_range(self, low: Any, high: Any) -> List[int]:
+        """Уровни, на которых могут быть значения из [low, high]; остальные можно не обходить."""
+        return [level for level, count in enumerate(self._counts)
+                if count and self._mins[level] <= high and self._maxes[level] >= low]
+
+    def find_range(self, low: Any, high: Any) -> Dict[Any, List[Hashable]]:
+        """
+        Значения из отрезка [low, high] и их позиции.
+
+        Просматриваются только уровни, границы которых пересекают отрезок;
+        значения уровня сортируются при первом запросе.
+
+        Raises:
+            ValueError: В компактном режиме, где значения не хранятся
+        """
+        if self.compact:
+            raise ValueError("В компактном режиме поиск по диапазону недоступен, используйте levels_in_range")
+        result = {}
+        for level in self.levels_in_range(low, high):
+            values = self._sorted_levels.get(level)
+            if values is None:
+                values = self._sorted_levels[level] = sorted(self._levels[level])
+            for value in values[bisect.bisect_left(values, low):bisect.bisect_right(values, high)]:
+                if value not in result:
+                    result[value] = self.find(value)
+        return result
+
+
+def benchmark_lookup(height: int = 18, lookups: int = 1000) -> Dict[str, float]:
+    """
+    Сравнивает поиск позиции значения полным обходом словаря дерева и через TreeIndex.
+
+    Используются дешёвые функции ветвей (2x и 2x + 1), чтобы дерево высоты 18
+    (262 тысячи узлов) строилось за секунды.
+
+    Returns:
+        Словарь {вариант: среднее время в секундах}
+    """
+    from Lab5_Binary_tree2 import gen_bin_tree
+
+    branches = {"root": 1, "left_branch": lambda x: 2 * x, "right_branch": lambda x: 2 * x + 1}
+    start = time.perf_counter()
+    tree = gen_bin_tree(height, **branches)
+    build_plain = time.perf_counter() - start
+
+    index = TreeIndex()
+    start = time.perf_counter()
+    gen_bin_tree(height, index=index, **branches)
+    build_indexed = time.perf_counter() - start
+
+    targets = [(len(tree) * i) // lookups for i in range(lookups)]
+    start = time.perf_counter()
+    for target in targets[:10]:
+        [path for path, value in tree.items() if value == target]
+    scan = (time.perf_counter() - start) / 10
+
+    start = time.perf_counter()
+    for target in targets:
+        index.find(target)
+    lookup = (time.perf_counter() - start) / lookups
+
+    return {"построение": build_plain, "построение с индексом": build_indexed,
+            "поиск обходом": scan, "поиск по индексу": lookup}
+
+
+def main():
+    print("Поиск значения в дереве Lab_5 высоты 18 (262143 узла)")
+    results = benchmark_lookup()
+    for name, seconds in results.items():
+        print(f"{name:<24} {seconds * 1e6:>14.1f} мкс")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+TREE_FORMATS = ("levels", "flat", "dict", "nested")
+
+# Порог, начиная с которого результат int64 считается переполненным; запас в 2 раза
+# покрывает погрешность проверочного вычисления во float64
+_INT64_SAFE = float(2 ** 62)
+
+
+def apply_branch(func: Callable[[Any], Any], level: np.ndarray) -> np.ndarray:
+    """
+    Применяет функцию ветви ко всему уровню сразу.
+
+    Функции из арифметики (x ** 3, x * 2 - 1) работают с массивами NumPy напрямую.
+    Если результат int64 мог переполниться (проверяется вычислением во float64),
+    уровень пересчитывается в dtype=object на целых Python без ограничения размера.
+    Функции, которые не принимают массив, применяются поэлементно через np.frompyfunc.
+
+    Args:
+        func: Функция ветви
+        level: Значения уровня
+
+    Returns:
+        Значения потомков той же длины, что level
+    """
+    try:
+        with np.errstate(all="ignore"):
+            result = np.asarray(func(level))
+            if result.dtype.kind in "iu" and level.dtype != object:
+                approx = func(level.astype(np.float64))
+                if not np.all(np.abs(approx) < _INT64_SAFE):
+                    result = np.asarray(func(level.astype(object)))
+    except (TypeError, ValueError):
+        result = np.frompyfunc(func, 1, 1)(level)
+    if result.shape != level.shape:
+        result = np.broadcast_to(result, level.shape)
+    return result
+
+
+def gen_levels(height: int = 4, root: int = 12,
+               left_branch: Callable[[Any], Any] = lambda x: x ** 3,
+               right_branch: Callable[[Any], Any] = lambda x: (x * 2) - 1) -> List[np.ndarray]:
+    """
+    Генерация дерева по уровням: next_level = interleave(left(level), right(level)).
+
+    Args:
+        height: Высота дерева
+        root: Значение корневого узла
+        left_branch: Функция для вычисления левого потомка (совместимая с массивами NumPy)
+        right_branch: Функция для вычисления правого потомка
+
+    Returns:
+        Список массивов уровней; потомки узла i уровня - элементы 2i и 2i + 1 следующего уровня
+    """
+    if height <= 0:
+        return []
+    level = np.array([root], dtype=object if type(root) is int and abs(root) >= _INT64_SAFE else None)
+    levels = [level]
+    for _ in range(height - 1):
+        left = apply_branch(left_branch, level)
+        right = apply_branch(right_branch, level)
+        dtype = object if object in (left.dtype, right.dtype) else np.result_type(left, right)
+        level = np.empty(2 * len(level), dtype=dtype)
+        level[0::2] = left
+        level[1::2] = right
+        levels.append(level)
+    return levels
+
+
+def levels_to_dict(levels: List[np.ndarray]) -> Dict[str, Any]:
+    """Словарь {путь: значение}, как у gen_bin_tree из Lab_5."""
+    tree = {}
+    paths = ["root"]
+    for depth, level in enumerate(levels):
+        if depth > 0:
+            paths = [path + side for path in paths for side in (".left", ".right")]
+        tree.update(zip(paths, level.tolist()))
+    return tree
+
+
+def levels_to_nested(levels: List[np.ndarray]) -> Optional[Dict[str, Any]]:
+    """Вложенный словарь {'root', 'left', 'right'}, как у gen_bin_tree из Lab_3."""
+    if not levels:
+        return None
+    nodes = [{'root': value, 'left': None, 'right': None} for value in levels[-1].tolist()]
+    for level in reversed(levels[:-1]):
+        nodes = [{'root': value, 'left': nodes[2 * i], 'right': nodes[2 * i + 1]}
+                 for i, value in enumerate(level.tolist())]
+    return nodes[0]
+
+
+def gen_bin_tree_vectorized(height: int = 4, root: int = 12,
+                            left_branch: Callable[[Any], Any] = lambda x: x ** 3,
+                            right_branch: Callable[[Any], Any] = lambda x: (x * 2) - 1,
+                            fmt: str = "dict") -> Any:
+    """
+    Векторизованная генерация бинарного дерева: функции ветвей вызываются один раз на уровень.
+
+    Args:
+        height: Высота дерева
+        root: Значение корневого узла
+        left_branch: Функция для вычисления левого потомка
+        right_branch: Функция для вычисления правого потомка
+        fmt: 'dict' - {путь: значение} (Lab_5), 'nested' - вложенные словари (Lab_3),
+            'flat' - массив в порядке кучи (потомки узла i - 2i + 1 и 2i + 2), 'levels' - список уровней
+
+    Raises:
+        ValueError: Если передан неизвестный формат
+    """
+    if fmt not in TREE_FORMATS:
+        raise ValueError(f"Неизвестный формат дерева: {fmt}. Используйте один из {TREE_FORMATS}.")
+    levels = gen_levels(height, root, left_branch, right_branch)
+    if fmt == "levels":
+        return levels
+    if fmt == "flat":
+        return np.concatenate(levels) if levels else np.array([], dtype=np.int64)
+    if fmt == "nested":
+        return levels_to_nested(levels)
+    return levels_to_dict(levels)
+
+
+def benchmark_generation(heights=(16, 20)) -> Dict[int, Dict[str, float]]:
+    """
+    Сравнивает поузловую генерацию Lab_5/Lab_3 и векторизованную для дешёвых функций x + 1 и x - 1.
+
+    Returns:
+        Словарь {высота: {вариант: время в секундах}}
+    """
+    import os
+    import sys
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Lab_3"))
+    from Lab3_Binary_tree import gen_bin_tree as gen_nested_tree
+    from Lab5_Binary_tree2 import gen_bin_tree
+
+    def left(x):
+        return x + 1
+
+    def right(x):
+        return x - 1
+
+    results = {}
+    for height in heights:
+        variants = {
+            "Lab_5 поузлово": lambda: gen_bin_tree(height, 12, left, right),
+            "векторно, dict": lambda: gen_bin_tree_vectorized(height, 12, left, right, "dict"),
+            "Lab_3 поузлово": lambda: gen_nested_tree(12, height, left, right),
+            "векторно, nested": lambda: gen_bin_tree_vectorized(height, 12, left, right, "nested"),
+            "векторно, flat": lambda: gen_bin_tree_vectorized(height, 12, left, right, "flat"),
+        }
+        timings = {}
+        for name, build in variants.items():
+            start = time.perf_counter()
+            build()
+            timings[name] = time.perf_counter() - start
+        results[height] = timings
+    return results
+
+
+def main():
+    print("Генерация дерева с функциями x + 1 и x - 1 (время в секундах)")
+    results = benchmark_generation()
+
+    names = list(next(iter(results.values())))
+    print(f"{'Высота':<8}" + "".join(f"{name:<18}" for name in names))
+    for height, timings in results.items():
+        print(f"{height:<8}" + "".join(f"{timings[name]:<18.4f}" for name in names))
+
+
+if __name__ == "__main__":
+    main()
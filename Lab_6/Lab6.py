@@ -13,33 +13,50 @@ class TreeNode:
         self.left = left
         self.right = right
 
-def build_tree_recursive(height, root_value=12):
-    """Рекурсивное построение дерева"""
+def build_tree_recursive(height, root_value=12, index=None, position=1):
+    """
+    Рекурсивное построение дерева
+    
+    index - необязательный обратный индекс с методом add(value, key, level)
+    (например, TreeIndex из Lab_5); ключ узла - его номер в куче position
+    (корень 1, потомки 2i и 2i + 1), уровень вычисляется по номеру.
+    """
     if height == 0:
         return None
     
     node = TreeNode(root_value)
+    if index is not None:
+        index.add(root_value, position, position.bit_length() - 1)
     
     if height > 1:
         left_value = root_value ** 3
         right_value = (root_value * 2) - 1
         
-        node.left = build_tree_recursive(height - 1, left_value)
-        node.right = build_tree_recursive(height - 1, right_value)
+        node.left = build_tree_recursive(height - 1, left_value, index, 2 * position)
+        node.right = build_tree_recursive(height - 1, right_value, index, 2 * position + 1)
     
     return node
 
-def build_tree_iterative(height, root_value=12):
-    """Итеративное построение дерева с использованием очереди"""
+def build_tree_iterative(height, root_value=12, index=None):
+    """
+    Итеративное построение дерева с использованием очереди
+    
+    index - как в build_tree_recursive: узлы обходятся в ширину,
+    поэтому номер в куче равен порядковому номеру узла в обходе.
+    """
     if height == 0:
         return None
     
     root = TreeNode(root_value)
     queue = deque()
     queue.append((root, 1, root_value))
+    position = 0
     
     while queue:
         node, current_height, value = queue.popleft()
+        position += 1
+        if index is not None:
+            index.add(value, position, current_height - 1)
         
         if current_height < height:
             left_value = value ** 3
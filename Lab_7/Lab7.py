@@ -1,55 +1,412 @@
 import sys
+import atexit
 import logging
 import functools
-import io
-import requests
+import threading
+import queue
+import random
+import reprlib
+import inspect
+import time
+import traceback
 import json
 import math
-import unittest
-from unittest.mock import patch, Mock
-from typing import Any, Callable, Union, Optional, TextIO, List, Dict
+from typing import TYPE_CHECKING, Any, Callable, Collection, NamedTuple, Union, Optional, List, Dict, Tuple
 
-def logger(func: Optional[Callable] = None, *, handle=sys.stdout):
+from metrics import REGISTRY, MetricsRegistry
+
+# requests, logging.handlers и модули приёмников импортируются при первом использовании:
+# импорт Lab7 ради solve_quadratic или logger не должен стоить сотню миллисекунд
+if TYPE_CHECKING:
+    import requests
+
+_LEVELS = {
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+
+# Именованные приёмники: на одно имя логгера приходится один QueueHandler и один обработчик atexit
+_named_sinks: Dict[str, "QueueSink"] = {}
+_named_sinks_lock = threading.Lock()
+
+
+def _stop_named_sink(name: str) -> None:
+    sink = _named_sinks.get(name)
+    if sink is not None:
+        sink.stop()
+
+
+class QueueSink:
+    """
+    Фоновый приёмник логов на основе QueueHandler/QueueListener.
+    
+    Декорированная функция только кладёт запись в очередь,
+    а запись в handle выполняет поток QueueListener. Атрибут logger
+    (с QueueHandler) позволяет писать в тот же приёмник через logging.
+    
+    Повторное создание приёмника с тем же name заменяет QueueHandler
+    прежнего приёмника в логгере и останавливает прежний приёмник.
+    """
+    
+    def __init__(self, handle=sys.stdout, level: int = logging.INFO, name: Optional[str] = None,
+                 batch_size: int = 1):
+        """
+        Args:
+            handle: Поток (sys.stdout, файловый объект) или logging.Handler
+            level: Минимальный уровень записываемых сообщений
+            name: Имя логгера в logging; по умолчанию создаётся незарегистрированный логгер
+            batch_size: Максимальный размер пачки записей, передаваемой handle
+                (больше 1 - запись пачками через BatchQueueListener)
+        """
+        import logging.handlers
+        
+        self.queue = queue.SimpleQueue()
+        self.name = name
+        if name is None:
+            self.logger = logging.Logger(f"lab7.queue_sink.{id(self):x}", level)
+        else:
+            self.logger = logging.getLogger(name)
+            self.logger.setLevel(level)
+        self.queue_handler = logging.handlers.QueueHandler(self.queue)
+        
+        if isinstance(handle, logging.Handler):
+            self.handler = handle
+        else:
+            self.handler = logging.StreamHandler(handle)
+            self.handler.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
+        if batch_size > 1:
+            from log_pipeline import BatchQueueListener
+            self.listener = BatchQueueListener(self.queue, self.handler, batch_size=batch_size)
+        else:
+            self.listener = logging.handlers.QueueListener(self.queue, self.handler)
+        self.listener.start()
+        self._running = True
+        
+        if name is None:
+            self.logger.addHandler(self.queue_handler)
+            atexit.register(self.stop)
+            return
+        with _named_sinks_lock:
+            previous = _named_sinks.get(name)
+            if previous is None:
+                atexit.register(_stop_named_sink, name)
+            else:
+                self.logger.removeHandler(previous.queue_handler)
+            self.logger.addHandler(self.queue_handler)
+            _named_sinks[name] = self
+        if previous is not None:
+            previous.stop()
+    
+    def emit(self, level_name: str, message: str) -> None:
+        """Кладёт запись в очередь, не вызывая findCaller и форматирование в вызывающем потоке."""
+        self.queue.put_nowait(logging.makeLogRecord({
+            "name": self.logger.name,
+            "levelno": _LEVELS[level_name],
+            "levelname": level_name,
+            "msg": message,
+        }))
+    
+    def stop(self) -> None:
+        """Дописывает оставшиеся в очереди записи и останавливает фоновый поток."""
+        if self._running:
+            self._running = False
+            self.listener.stop()
+            if self.name is None:
+                atexit.unregister(self.stop)
+    
+    def __enter__(self) -> "QueueSink":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+class _BackgroundWriter:
+    """
+    Фоновый поток, выполняющий запись логов асинхронных функций.
+    
+    Поток запускается при первой записи; порядок записей сохраняется.
+    """
+    
+    def __init__(self):
+        self.queue = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+    
+    def submit(self, emit: Callable[[str, str], None], level_name: str, message: str) -> None:
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name="lab7-log-writer", daemon=True)
+                    self._thread.start()
+                    atexit.register(self.queue.join)
+        self.queue.put_nowait((emit, level_name, message))
+    
+    def _run(self) -> None:
+        while True:
+            emit, level_name, message = self.queue.get()
+            try:
+                emit(level_name, message)
+            except Exception:
+                # Как logging.Handler.handleError: ошибка приёмника не должна останавливать поток
+                traceback.print_exc(file=sys.stderr)
+            finally:
+                self.queue.task_done()
+
+
+_BACKGROUND_WRITER = _BackgroundWriter()
+
+
+def flush_async_logs() -> None:
+    """Дожидается записи всех логов асинхронных функций, поставленных в очередь."""
+    _BACKGROUND_WRITER.queue.join()
+
+
+def _resolve_sink(handle, level: int, flush: bool):
+    """
+    Один раз при декорировании определяет способ записи в handle.
+    
+    Returns:
+        Пара (is_enabled(levelno) -> bool, emit(level, message))
+    """
+    if handle is None:
+        return (lambda levelno: False), None
+    
+    if isinstance(handle, QueueSink):
+        return handle.logger.isEnabledFor, handle.emit
+    
+    if isinstance(handle, logging.Logger):
+        log = handle.log
+        
+        def emit(level_name: str, message: str) -> None:
+            log(_LEVELS[level_name], message)
+        
+        return handle.isEnabledFor, emit
+    
+    write = handle.write
+    flush_handle = getattr(handle, "flush", None) if flush else None
+    
+    def emit(level_name: str, message: str) -> None:
+        write(f"{level_name}: {message}\n")
+        if flush_handle is not None:
+            flush_handle()
+    
+    return (lambda levelno: levelno >= level), emit
+
+
+REDACTED = "'***'"
+
+_SCALAR_TYPES = frozenset({int, float, bool, complex, type(None)})
+
+
+def _make_value_formatter(max_repr: Optional[int], capture: str) -> Callable[[Any], str]:
+    """
+    Создаёт функцию форматирования значений для лога.
+    
+    Args:
+        max_repr: Максимальный размер представления одного значения в байтах UTF-8 (None - без ограничения)
+        capture: 'repr' - представление значения, 'type' - только тип и размер
+    
+    Returns:
+        Функция value -> str
+    """
+    if capture == "type":
+        def describe(value: Any) -> str:
+            type_name = type(value).__name__
+            try:
+                return f"<{type_name} len={len(value)}>"
+            except TypeError:
+                return f"<{type_name}>"
+        
+        return describe
+    
+    if capture != "repr":
+        raise ValueError(f"Неподдерживаемый режим capture: {capture}. Используйте 'repr' или 'type'.")
+    
+    if max_repr is None:
+        return repr
+    
+    # reprlib обходит только первые элементы контейнеров, поэтому
+    # огромный список не превращается целиком в строку
+    limited = reprlib.Repr()
+    items = max(1, max_repr // 4)
+    limited.maxlist = limited.maxtuple = limited.maxset = limited.maxfrozenset = items
+    limited.maxdeque = limited.maxarray = items
+    limited.maxdict = max(1, items // 2)
+    limited.maxstring = limited.maxlong = limited.maxother = max_repr
+    
+    def bounded(value: Any) -> str:
+        if type(value) in _SCALAR_TYPES or (type(value) is str and len(value) <= max_repr):
+            text = repr(value)
+        else:
+            text = limited.repr(value)
+        # Символ занимает от 1 до 4 байт, так что строка не длиннее max_repr / 4 символов точно укладывается
+        if len(text) * 4 <= max_repr or (text.isascii() and len(text) <= max_repr):
+            return text
+        encoded = text.encode("utf-8")
+        if len(encoded) > max_repr:
+            text = encoded[:max(0, max_repr - 3)].decode("utf-8", "ignore") + "..."
+        return text
+    
+    return bounded
+
+
+def logger(func: Optional[Callable] = None, *, handle=sys.stdout, level: int = logging.INFO,
+           sample_rate: float = 1.0, flush: bool = False,
+           max_repr: Optional[int] = None, capture: str = "repr", redact: Collection[str] = (),
+           metrics: Optional[MetricsRegistry] = None, profiler=None):
     """
     Параметризуемый декоратор для логирования вызовов функций.
     
+    Способ записи определяется один раз при декорировании, а repr аргументов
+    и результата строится только если уровень INFO включён. Корутины и асинхронные
+    генераторы ожидаются, а запись их логов выполняет фоновый поток
+    (см. flush_async_logs), чтобы не блокировать цикл событий.
+    
     Args:
         func: Декорируемая функция
-        handle: Куда производить логирование (sys.stdout, файловый объект, logging.Logger)
+        handle: Куда производить логирование (sys.stdout, файловый объект, logging.Logger, QueueSink);
+            None отключает запись, оставляя только сбор метрик
+        level: Минимальный уровень для потоков; для logging.Logger используется его собственный уровень
+        sample_rate: Доля вызовов (0..1), для которых пишутся INFO-сообщения; исключения логируются всегда
+        flush: Сбрасывать буфер handle после каждой строки
+        max_repr: Максимальный размер записи одного аргумента или результата в байтах UTF-8
+            (None - без ограничения); обрезанная запись заканчивается на '...'
+        capture: 'repr' - логировать значения, 'type' - только тип и размер
+        redact: Имена параметров, значения которых скрываются; 'return' скрывает результат
+        metrics: Реестр, в который записываются длительность, число вызовов и исключений
+        profiler: Профилировщик с методом runcall (profiling.StackSampler или CallProfiler),
+            под которым выполняется каждый вызов вместе с логированием. Длительности под
+            профилировщиком искажены, поэтому metrics для такой функции не собираются.
+            Только для обычных функций
+    
+    Raises:
+        TypeError: Если profiler передан для корутины, генератора или асинхронного генератора
     """
+    is_enabled, emit = _resolve_sink(handle, level, flush)
+    fmt = _make_value_formatter(max_repr, capture)
+    redact = frozenset(redact)
+    # Асинхронные функции не должны блокировать цикл событий записью в поток или файл
+    async_emit = emit if emit is None or isinstance(handle, QueueSink) else functools.partial(
+        _BACKGROUND_WRITER.submit, emit)
+    
     def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            is_logger = isinstance(handle, logging.Logger)
+        name = func.__name__
+        sampled = sample_rate < 1.0
+        
+        redacted_positions = frozenset()
+        if redact:
+            try:
+                parameters = list(inspect.signature(func).parameters.values())
+            except (TypeError, ValueError):
+                parameters = []
+            redacted_positions = frozenset(
+                i for i, p in enumerate(parameters)
+                if p.name in redact and p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD)
+            )
+        redact_result = "return" in redact
+        if profiler is not None and (inspect.iscoroutinefunction(func) or inspect.isasyncgenfunction(func)
+                                     or inspect.isgeneratorfunction(func)):
+            # Для генераторов под профилировщиком оказалось бы только создание объекта, а не обход
+            raise TypeError("Профилирование поддерживается только для обычных функций")
+        timed = metrics.get(func.__qualname__) if metrics is not None and profiler is None else None
+        
+        def format_call(args, kwargs) -> str:
+            if redact:
+                args_repr = [REDACTED if i in redacted_positions else fmt(a) for i, a in enumerate(args)]
+                kwargs_repr = [f"{k}={REDACTED if k in redact else fmt(v)}" for k, v in kwargs.items()]
+            else:
+                args_repr = [fmt(a) for a in args]
+                kwargs_repr = [f"{k}={fmt(v)}" for k, v in kwargs.items()]
+            return f"Вызов {name}({', '.join(args_repr + kwargs_repr)})"
+        
+        def format_error(e: Exception) -> str:
+            return f"Исключение в {name}: {type(e).__name__}: {e}"
+        
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                info = is_enabled(logging.INFO) and not (sampled and random.random() >= sample_rate)
+                if info:
+                    async_emit("INFO", format_call(args, kwargs))
+                
+                start = time.perf_counter() if timed is not None else 0.0
+                try:
+                    result = await func(*args, **kwargs)
+                except Exception as e:
+                    if timed is not None:
+                        timed.observe(time.perf_counter() - start, True)
+                    if is_enabled(logging.ERROR):
+                        async_emit("ERROR", format_error(e))
+                    raise
+                
+                if timed is not None:
+                    timed.observe(time.perf_counter() - start, False)
+                if info:
+                    async_emit("INFO", f"{name} вернула {REDACTED if redact_result else fmt(result)}")
+                return result
             
-            def log(level, message):
-                if is_logger:
-                    if level == "INFO":
-                        handle.info(message)
-                    elif level == "ERROR":
-                        handle.error(message)
-                    elif level == "WARNING":
-                        handle.warning(message)
-                    elif level == "CRITICAL":
-                        handle.critical(message)
-                else:
-                    handle.write(f"{level}: {message}\n")
-                    if hasattr(handle, 'flush'):
-                        handle.flush()
+            return async_wrapper
+        
+        if inspect.isasyncgenfunction(func):
+            @functools.wraps(func)
+            async def async_gen_wrapper(*args, **kwargs):
+                info = is_enabled(logging.INFO) and not (sampled and random.random() >= sample_rate)
+                if info:
+                    async_emit("INFO", format_call(args, kwargs))
+                
+                count = 0
+                start = time.perf_counter() if timed is not None else 0.0
+                try:
+                    async for item in func(*args, **kwargs):
+                        count += 1
+                        yield item
+                except Exception as e:
+                    if timed is not None:
+                        timed.observe(time.perf_counter() - start, True)
+                    if is_enabled(logging.ERROR):
+                        async_emit("ERROR", format_error(e))
+                    raise
+                
+                if timed is not None:
+                    timed.observe(time.perf_counter() - start, False)
+                if info:
+                    async_emit("INFO", f"{name} завершилась, выдано значений: {count}")
             
-            args_repr = [repr(a) for a in args]
-            kwargs_repr = [f"{k}={v!r}" for k, v in kwargs.items()]
-            signature = ", ".join(args_repr + kwargs_repr)
+            return async_gen_wrapper
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            info = is_enabled(logging.INFO) and not (sampled and random.random() >= sample_rate)
             
-            log("INFO", f"Вызов {func.__name__}({signature})")
+            if info:
+                emit("INFO", format_call(args, kwargs))
             
+            start = time.perf_counter() if timed is not None else 0.0
             try:
                 result = func(*args, **kwargs)
-                log("INFO", f"{func.__name__} вернула {result!r}")
-                return result
             except Exception as e:
-                log("ERROR", f"Исключение в {func.__name__}: {type(e).__name__}: {e}")
+                if timed is not None:
+                    timed.observe(time.perf_counter() - start, True)
+                if is_enabled(logging.ERROR):
+                    emit("ERROR", format_error(e))
                 raise
+            
+            if timed is not None:
+                timed.observe(time.perf_counter() - start, False)
+            if info:
+                emit("INFO", f"{name} вернула {REDACTED if redact_result else fmt(result)}")
+            return result
+        
+        if profiler is not None:
+            @functools.wraps(func)
+            def profiled_wrapper(*args, **kwargs):
+                return profiler.runcall(wrapper, *args, **kwargs)
+            
+            return profiled_wrapper
         
         return wrapper
     
@@ -59,13 +416,100 @@ def logger(func: Optional[Callable] = None, *, handle=sys.stdout):
     return decorator
 
 
-def get_currencies(currency_codes: List[str], url: str = "https://www.cbr-xml-daily.ru/daily_json.js") -> Dict[str, float]:
+DEFAULT_URL = "https://www.cbr-xml-daily.ru/daily_json.js"
+
+_shared_session = None
+
+
+def make_session(pool_maxsize: int = 10) -> "requests.Session":
+    """
+    Создаёт requests.Session с пулом постоянных соединений.
+    
+    Args:
+        pool_maxsize: Максимальное число соединений в пуле на один хост
+    
+    Returns:
+        Сессия, переиспользующая TCP/TLS соединения между запросами
+    """
+    import requests.adapters
+    
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_shared_session() -> "requests.Session":
+    """Возвращает общую для модуля сессию, создавая её при первом обращении."""
+    global _shared_session
+    if _shared_session is None:
+        _shared_session = make_session()
+    return _shared_session
+
+
+def parse_currencies(data: Any, currency_codes: List[str],
+                     errors: Optional[Dict[str, Exception]] = None) -> Dict[str, float]:
+    """
+    Извлекает курсы запрошенных валют из разобранного ответа API ЦБ РФ.
+    
+    Args:
+        data: Разобранный JSON-документ
+        currency_codes: Список кодов валют
+        errors: Если передан, ошибки отдельных валют записываются в него
+            ({код: исключение}), а остальные курсы возвращаются
+    
+    Returns:
+        Словарь вида {"USD": 93.25, "EUR": 101.7}
+    
+    Raises:
+        KeyError: Если отсутствует ключ "Valute" или запрошенная валюта
+        TypeError: Если курс валюты имеет неверный тип
+    """
+    if "Valute" not in data:
+        raise KeyError("В ответе API отсутствует ключ 'Valute'")
+    
+    valutes = data["Valute"]
+    result = {}
+    
+    for code in currency_codes:
+        try:
+            result[code] = _parse_rate(valutes, code)
+        except (KeyError, TypeError) as e:
+            if errors is None:
+                raise
+            errors[code] = e
+    
+    return result
+
+
+def _parse_rate(valutes: Dict[str, Any], code: str) -> float:
+    if code not in valutes:
+        raise KeyError(f"Валюта {code} отсутствует в данных")
+    
+    currency_data = valutes[code]
+    if "Value" not in currency_data:
+        raise KeyError(f"Для валюты {code} отсутствует поле Value")
+    
+    value = currency_data["Value"]
+    if not isinstance(value, (int, float)):
+        raise TypeError(f"Курс валюты {code} имеет неверный тип: {type(value).__name__}")
+    
+    return float(value)
+
+
+def get_currencies(currency_codes: List[str], url: str = DEFAULT_URL,
+                   session: Optional["requests.Session"] = None, timeout: float = 5,
+                   errors: Optional[Dict[str, Exception]] = None) -> Dict[str, float]:
     """
     Получает курсы валют с API ЦБ РФ.
     
     Args:
         currency_codes: Список кодов валют
         url: URL API ЦБ РФ
+        session: Сессия с пулом соединений; если не передана, используется requests.get
+        timeout: Таймаут запроса в секундах
+        errors: Словарь для ошибок отдельных валют (см. parse_currencies)
     
     Returns:
         Словарь вида {"USD": 93.25, "EUR": 101.7}
@@ -76,8 +520,11 @@ def get_currencies(currency_codes: List[str], url: str = "https://www.cbr-xml-da
         KeyError: Если отсутствует ключ "Valute" или запрошенная валюта
         TypeError: Если курс валюты имеет неверный тип
     """
+    import requests
+    
+    http = session if session is not None else requests
     try:
-        response = requests.get(url, timeout=5)
+        response = http.get(url, timeout=timeout)
         response.raise_for_status()
         
         try:
@@ -85,306 +532,177 @@ def get_currencies(currency_codes: List[str], url: str = "https://www.cbr-xml-da
         except json.JSONDecodeError:
             raise ValueError("Некорректный JSON ответ от API")
         
-        if "Valute" not in data:
-            raise KeyError("В ответе API отсутствует ключ 'Valute'")
-        
-        valutes = data["Valute"]
-        result = {}
-        
-        for code in currency_codes:
-            if code not in valutes:
-                raise KeyError(f"Валюта {code} отсутствует в данных")
-            
-            currency_data = valutes[code]
-            if "Value" not in currency_data:
-                raise KeyError(f"Для валюты {code} отсутствует поле Value")
-            
-            value = currency_data["Value"]
-            if not isinstance(value, (int, float)):
-                raise TypeError(f"Курс валюты {code} имеет неверный тип: {type(value).__name__}")
-            
-            result[code] = float(value)
-        
-        return result
+        return parse_currencies(data, currency_codes, errors)
         
     except requests.RequestException as e:
         raise ConnectionError(f"API недоступен: {e}")
 
 
-@logger
-def get_currencies_stdout(currency_codes: List[str], url: str = "https://www.cbr-xml-daily.ru/daily_json.js") -> Dict[str, float]:
-    return get_currencies(currency_codes, url)
+@logger(metrics=REGISTRY)
+def get_currencies_stdout(currency_codes: List[str], url: str = DEFAULT_URL) -> Dict[str, float]:
+    return get_currencies(currency_codes, url, session=get_shared_session())
 
 
-stream = io.StringIO()
-@logger(handle=stream)
-def get_currencies_stream(currency_codes: List[str], url: str = "https://www.cbr-xml-daily.ru/daily_json.js") -> Dict[str, float]:
-    return get_currencies(currency_codes, url)
+def _logged_fetch(name: str, handle) -> Callable[..., Dict[str, float]]:
+    """Создаёт get_currencies_<приёмник> с логированием в handle (имя задаётся для метрик)."""
+    def fetch(currency_codes: List[str], url: str = DEFAULT_URL) -> Dict[str, float]:
+        return get_currencies(currency_codes, url, session=get_shared_session())
+    
+    fetch.__name__ = fetch.__qualname__ = name
+    return logger(handle=handle, metrics=REGISTRY)(fetch)
 
 
-file_logger = logging.getLogger("currency_file")
-file_logger.setLevel(logging.INFO)
+def _init_stream_logging() -> Dict[str, Any]:
+    from ring_sink import RingBufferSink
+    
+    # Кольцевой буфер постоянного размера: старые строки вытесняются, потоки пишут без общей блокировки
+    stream = RingBufferSink(capacity=64 * 1024)
+    return {"stream": stream, "get_currencies_stream": _logged_fetch("get_currencies_stream", stream)}
 
-file_handler = logging.FileHandler("currency_log.txt", encoding='utf-8')
-file_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
 
-file_logger.addHandler(file_handler)
+def _init_file_logging() -> Dict[str, Any]:
+    from log_pipeline import make_file_handler
+    
+    # Запись в файл выполняет фоновый поток пачками; файл открывается при первой записи
+    # и ротируется по размеру (currency_log.txt.1 ... .3)
+    file_handler = make_file_handler("currency_log.txt", max_bytes=1024 * 1024, backup_count=3)
+    file_sink = QueueSink(file_handler, name="currency_file", batch_size=256)
+    return {
+        "file_handler": file_handler,
+        "file_sink": file_sink,
+        "file_logger": file_sink.logger,
+        "get_currencies_file": _logged_fetch("get_currencies_file", file_sink),
+    }
+
+
+# Коды состояния решения квадратного уравнения
+STATUS_TWO_ROOTS = 0       # D > 0
+STATUS_ONE_ROOT = 1        # D == 0
+STATUS_LINEAR = 2          # a == 0, b != 0
+STATUS_NO_REAL_ROOTS = 3   # D < 0
+STATUS_INFINITE = 4        # a == b == c == 0
+STATUS_NO_SOLUTION = 5     # a == b == 0, c != 0
+STATUS_COMPLEX_ROOTS = 6   # D < 0, возвращены комплексные корни
 
-@logger(handle=file_logger)
-def get_currencies_file(currency_codes: List[str], url: str = "https://www.cbr-xml-daily.ru/daily_json.js") -> Dict[str, float]:
-    return get_currencies(currency_codes, url)
+QUADRATIC_METHODS = ("classic", "stable")
 
 
-def solve_quadratic(a, b, c):
+class QuadraticSolution(NamedTuple):
+    """Результат решения квадратного уравнения: код состояния и кортеж корней."""
+    status: int
+    roots: Tuple[Union[float, complex], ...]
+
+
+def solve_quadratic_roots(a, b, c, method: str = "stable", complex_roots: bool = False) -> QuadraticSolution:
     """
-    Решает квадратное уравнение ax^2 + bx + c = 0
+    Решает квадратное уравнение ax^2 + bx + c = 0 и возвращает структурированный результат.
+    
+    Args:
+        a, b, c: Коэффициенты уравнения
+        method: 'classic' - формула (-b ± sqrt(D)) / 2a,
+            'stable' - формула Виета без катастрофического сокращения при b^2 >> 4ac
+        complex_roots: Возвращать комплексные корни при D < 0
+    
+    Returns:
+        QuadraticSolution; корни упорядочены как (-b + sqrt(D)) / 2a, (-b - sqrt(D)) / 2a
+    
+    Raises:
+        TypeError: Если коэффициенты не числовые
+        ValueError: Если передан неподдерживаемый метод
     """
     if not all(isinstance(x, (int, float)) for x in [a, b, c]):
         raise TypeError("Все коэффициенты должны быть числами")
+    if method not in QUADRATIC_METHODS:
+        raise ValueError(f"Неподдерживаемый метод: {method}. Используйте 'classic' или 'stable'.")
     
     if a == 0 and b == 0:
-        if c == 0:
-            return "Бесконечное множество решений"
-        else:
-            raise ValueError("Нет решений (противоречивое уравнение)")
+        return QuadraticSolution(STATUS_INFINITE if c == 0 else STATUS_NO_SOLUTION, ())
     
     if a == 0:
-        x = -c / b
-        return (x,)
+        return QuadraticSolution(STATUS_LINEAR, (-c / b,))
     
     discriminant = b**2 - 4*a*c
     
     if discriminant < 0:
-        return "WARNING: Дискриминант отрицательный, нет действительных корней"
+        if not complex_roots:
+            return QuadraticSolution(STATUS_NO_REAL_ROOTS, ())
+        real = -b / (2*a)
+        imag = math.sqrt(-discriminant) / (2*a)
+        return QuadraticSolution(STATUS_COMPLEX_ROOTS, (complex(real, imag), complex(real, -imag)))
     elif discriminant == 0:
-        x = -b / (2*a)
-        return (x,)
-    else:
-        x1 = (-b + math.sqrt(discriminant)) / (2*a)
-        x2 = (-b - math.sqrt(discriminant)) / (2*a)
-        return (x1, x2)
-
-
-@logger
-def solve_quadratic_logged(a, b, c):
-    return solve_quadratic(a, b, c)
-
-
-def demonstrate_quadratic():
-    print("Демонстрация solve_quadratic")
-    
-    print("\n1. Два корня:")
-    result = solve_quadratic_logged(1, -3, 2)
-    print(f"Результат: {result}")
+        return QuadraticSolution(STATUS_ONE_ROOT, (-b / (2*a),))
     
-    print("\n2. Дискриминант < 0:")
-    result = solve_quadratic_logged(1, 1, 1)
-    print(f"Результат: {result}")
+    sqrt_d = math.sqrt(discriminant)
+    if method == "classic":
+        return QuadraticSolution(STATUS_TWO_ROOTS, ((-b + sqrt_d) / (2*a), (-b - sqrt_d) / (2*a)))
     
-    print("\n3. Некорректные данные:")
-    try:
-        solve_quadratic_logged("abc", 2, 1)
-    except TypeError as e:
-        print(f"Поймано исключение: {e}")
-    
-    print("\n4. Невозможная ситуация:")
-    try:
-        solve_quadratic_logged(0, 0, 5)
-    except ValueError as e:
-        print(f"Поймано исключение: {e}")
+    # q берёт знак b, поэтому -b и sqrt(D) складываются без вычитания близких чисел
+    q = -(b + math.copysign(sqrt_d, b)) / 2
+    if math.copysign(1.0, b) > 0:
+        return QuadraticSolution(STATUS_TWO_ROOTS, (c / q, q / a))
+    return QuadraticSolution(STATUS_TWO_ROOTS, (q / a, c / q))
 
 
-def demonstrate_currencies():
-    print("Демонстрация get_currencies")
-    
-    try:
-        result = get_currencies_stdout(['USD', 'EUR'])
-        print(f"Курсы валют: {result}")
-    except Exception as e:
-        print(f"Ошибка при получении курсов: {e}")
+def solve_quadratic(a, b, c, method: str = "classic", complex_roots: bool = False):
+    """
+    Решает квадратное уравнение ax^2 + bx + c = 0
     
-    print("Демонстрация файлового логирования")
-    try:
-        result = get_currencies_file(['USD', 'EUR'])
-        print(f"Курсы валют: {result}")
-        print("Логи сохранены в файл currency_log.txt")
-    except Exception as e:
-        print(f"Ошибка: {e}")
-
-
-class TestGetCurrencies(unittest.TestCase):
-    
-    def setUp(self):
-        self.valid_response = {
-            "Valute": {
-                "USD": {"Value": 93.25},
-                "EUR": {"Value": 101.7}
-            }
-        }
-    
-    @patch('requests.get')
-    def test_correct_return(self, mock_get):
-        mock_response = Mock()
-        mock_response.json.return_value = self.valid_response
-        mock_get.return_value = mock_response
-        
-        result = get_currencies(['USD', 'EUR'])
-        self.assertEqual(result, {"USD": 93.25, "EUR": 101.7})
-    
-    @patch('requests.get')
-    def test_nonexistent_currency(self, mock_get):
-        mock_response = Mock()
-        mock_response.json.return_value = self.valid_response
-        mock_get.return_value = mock_response
-        
-        with self.assertRaises(KeyError) as context:
-            get_currencies(['GBP'])
-        
-        self.assertIn("Валюта GBP отсутствует", str(context.exception))
+    Args:
+        a, b, c: Коэффициенты уравнения
+        method: 'classic' или 'stable' (см. solve_quadratic_roots)
+        complex_roots: Возвращать комплексные корни вместо предупреждения при D < 0
+    """
+    status, roots = solve_quadratic_roots(a, b, c, method, complex_roots)
     
-    @patch('requests.get')
-    def test_connection_error(self, mock_get):
-        mock_get.side_effect = requests.RequestException("Connection failed")
-        
-        with self.assertRaises(ConnectionError):
-            get_currencies(['USD'])
-    
-    @patch('requests.get')
-    def test_invalid_json(self, mock_get):
-        mock_response = Mock()
-        mock_response.json.side_effect = ValueError("Invalid JSON")
-        mock_get.return_value = mock_response
-        
-        with self.assertRaises(ValueError):
-            get_currencies(['USD'])
-    
-    @patch('requests.get')
-    def test_missing_valute_key(self, mock_get):
-        mock_response = Mock()
-        mock_response.json.return_value = {}
-        mock_get.return_value = mock_response
-        
-        with self.assertRaises(KeyError) as context:
-            get_currencies(['USD'])
-        
-        self.assertIn("отсутствует ключ 'Valute'", str(context.exception))
-    
-    @patch('requests.get')
-    def test_type_error(self, mock_get):
-        invalid_response = {
-            "Valute": {
-                "USD": {"Value": "не число"}
-            }
-        }
-        mock_response = Mock()
-        mock_response.json.return_value = invalid_response
-        mock_get.return_value = mock_response
-        
-        with self.assertRaises(TypeError):
-            get_currencies(['USD'])
+    if status == STATUS_INFINITE:
+        return "Бесконечное множество решений"
+    if status == STATUS_NO_SOLUTION:
+        raise ValueError("Нет решений (противоречивое уравнение)")
+    if status == STATUS_NO_REAL_ROOTS:
+        return "WARNING: Дискриминант отрицательный, нет действительных корней"
+    return roots
 
 
-class TestLoggerDecorator(unittest.TestCase):
-    
-    def setUp(self):
-        self.stream = io.StringIO()
-        
-        @logger(handle=self.stream)
-        def test_function(x, y=2):
-            return x * y
-        
-        self.test_function = test_function
-        
-        @logger(handle=self.stream)
-        def error_function():
-            raise ValueError("Тестовая ошибка")
-        
-        self.error_function = error_function
-    
-    def test_success_logging(self):
-        result = self.test_function(3, y=4)
-        
-        self.assertEqual(result, 12)
-        
-        logs = self.stream.getvalue()
-        
-        self.assertIn("INFO: Вызов test_function(3, y=4)", logs)
-        
-        self.assertIn("INFO: test_function вернула 12", logs)
+def _init_quadratic_cache() -> Dict[str, Any]:
+    from memoize import memoize
     
-    def test_error_logging(self):
-        with self.assertRaises(ValueError):
-            self.error_function()
-        
-        logs = self.stream.getvalue()
-        
-        self.assertIn("ERROR: Исключение в error_function: ValueError: Тестовая ошибка", logs)
-        self.assertIn("INFO: Вызов error_function()", logs)
+    # Кэш для потоков с повторяющимися коэффициентами; typed различает 1 и 1.0
+    return {"solve_quadratic_cached": memoize(maxsize=4096, typed=True)(solve_quadratic)}
 
 
-class TestStreamWrite(unittest.TestCase):
-    
-    def setUp(self):
-        self.stream = io.StringIO()
-        
-        @logger(handle=self.stream)
-        def wrapped():
-            return get_currencies(['USD'], url="https://invalid")
-        
-        self.wrapped = wrapped
-    
-    def test_logging_error(self):
-        with self.assertRaises(ConnectionError):
-            self.wrapped()
-        
-        logs = self.stream.getvalue()
-        self.assertIn("ERROR", logs)
-        self.assertIn("ConnectionError", logs)
+@logger(metrics=REGISTRY)
+def solve_quadratic_logged(a, b, c):
+    return solve_quadratic(a, b, c)
 
 
-class TestFileLogging(unittest.TestCase):
-    
-    def test_file_logger_creation(self):
-        self.assertIsNotNone(file_logger)
-        self.assertEqual(len(file_logger.handlers), 1)
-        self.assertIsInstance(file_logger.handlers[0], logging.FileHandler)
+# Атрибуты модуля, создаваемые при первом обращении (PEP 562): приёмники логов
+# не запускают потоки и не создают файлы, пока ими не воспользовались
+_LAZY_ATTRIBUTES = {
+    "stream": _init_stream_logging,
+    "get_currencies_stream": _init_stream_logging,
+    "file_handler": _init_file_logging,
+    "file_sink": _init_file_logging,
+    "file_logger": _init_file_logging,
+    "get_currencies_file": _init_file_logging,
+    "solve_quadratic_cached": _init_quadratic_cache,
+}
+_lazy_lock = threading.Lock()
 
 
-class TestSolveQuadratic(unittest.TestCase):
-    
-    def test_two_roots(self):
-        result = solve_quadratic(1, -3, 2)
-        self.assertEqual(result, (2.0, 1.0))
-    
-    def test_one_root(self):
-        result = solve_quadratic(1, -2, 1)
-        self.assertEqual(result, (1.0,))
-    
-    def test_negative_discriminant(self):
-        result = solve_quadratic(1, 1, 1)
-        self.assertEqual(result, "WARNING: Дискриминант отрицательный, нет действительных корней")
-    
-    def test_linear_equation(self):
-        result = solve_quadratic(0, 2, -4)
-        self.assertEqual(result, (2.0,))
-    
-    def test_invalid_data(self):
-        with self.assertRaises(TypeError):
-            solve_quadratic("abc", 2, 1)
-    
-    def test_impossible_situation(self):
-        with self.assertRaises(ValueError):
-            solve_quadratic(0, 0, 5)
+def __getattr__(name: str) -> Any:
+    init = _LAZY_ATTRIBUTES.get(name)
+    if init is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    with _lazy_lock:
+        if name not in globals():
+            globals().update(init())
+    return globals()[name]
 
 
-if __name__ == '__main__':
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
 
-    print("ЗАПУСК ДЕМОНСТРАЦИИ")
-   
-    demonstrate_quadratic()
-    
-    demonstrate_currencies()
-    
-    print("ЗАПУСК ТЕСТОВ")
-    
-    unittest.main(argv=[''], verbosity=2, exit=False)
\ No newline at end of file
+
+if __name__ == '__main__':
+    from lab7_demo import main
+    main()
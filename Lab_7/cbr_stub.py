@@ -0,0 +1,274 @@
+import hashlib
+import json
+import socket
+import sys
+import threading
+import time
+from collections import deque
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Optional, Union
+
+
+def make_payload(rates: Dict[str, float], date: str = "2026-02-25T11:30:00+03:00") -> Dict[str, Any]:
+    """
+    Формирует документ в формате daily_json.js ЦБ РФ.
+
+    Args:
+        rates: Словарь вида {"USD": 93.25, "EUR": 101.7}
+        date: Дата котировок
+
+    Returns:
+        Словарь, повторяющий структуру ответа API ЦБ РФ
+    """
+    return {
+        "Date": date,
+        "Valute": {
+            code: {"CharCode": code, "Nominal": 1, "Value": value}
+            for code, value in rates.items()
+        }
+    }
+
+
+DEFAULT_PAYLOAD = make_payload({"USD": 76.4678, "EUR": 90.3211, "GBP": 103.0542, "CNY": 10.6218})
+
+# Виды отказов, которые умеет имитировать заглушка:
+# status - HTTP-ошибка, malformed - некорректный JSON,
+# no_valute - документ без ключа Valute, drop - разрыв соединения без ответа
+FAULTS = ("status", "malformed", "no_valute", "drop")
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """Обработчик запросов заглушки; отдаёт документ сервера по любому пути."""
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        with self.server.stats_lock:
+            self.server.connection_count += 1
+            self.server.active_connections.add(self.connection)
+
+    def finish(self):
+        with self.server.stats_lock:
+            self.server.active_connections.discard(self.connection)
+        super().finish()
+
+    def do_GET(self):
+        with self.server.stats_lock:
+            self.server.request_count += 1
+            fault = self.server.faults.popleft() if self.server.faults else None
+
+        delay = self.server.delay() if callable(self.server.delay) else self.server.delay
+        if delay > 0:
+            time.sleep(delay)
+
+        if fault is not None:
+            self._send_fault(*fault)
+            return
+
+        body, etag, last_modified = self.server.document
+        if_none_match = self.headers.get("If-None-Match")
+        if if_none_match is not None:
+            not_modified = if_none_match == etag
+        else:
+            not_modified = self.headers.get("If-Modified-Since") == last_modified
+
+        if not_modified:
+            with self.server.stats_lock:
+                self.server.not_modified_count += 1
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/javascript; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", last_modified)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_fault(self, kind: str, status: int) -> None:
+        if kind == "drop":
+            self.close_connection = True
+            self.connection.shutdown(socket.SHUT_RDWR)
+            return
+
+        if kind == "status":
+            body = b"Service Unavailable"
+        elif kind == "malformed":
+            status, body = 200, b'{"Valute": {"USD": '
+        else:
+            status, body = 200, b'{"Date": "2026-02-25T11:30:00+03:00"}'
+
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _StubHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # Клиент мог закрыть соединение по таймауту - это ожидаемая ситуация в тестах
+        if not isinstance(sys.exc_info()[1], OSError):
+            super().handle_error(request, client_address)
+
+
+class CBRStubServer:
+    """
+    Локальный HTTP-сервер, имитирующий API ЦБ РФ (daily_json.js).
+
+    Сервер работает в фоновом потоке и поддерживает keep-alive,
+    поэтому по счётчику connection_count можно проверить переиспользование соединений.
+    Задержка ответа и отказы (см. FAULTS) задаются для тестов без доступа к сети.
+    """
+
+    def __init__(self, payload: Optional[Dict[str, Any]] = None, host: str = "127.0.0.1", port: int = 0,
+                 delay: Union[float, Callable[[], float]] = 0.0):
+        self._httpd = _StubHTTPServer((host, port), _StubHandler)
+        self._httpd.stats_lock = threading.Lock()
+        self._httpd.request_count = 0
+        self._httpd.connection_count = 0
+        self._httpd.not_modified_count = 0
+        self._httpd.active_connections = set()
+        self._httpd.faults = deque()
+        self._httpd.delay = delay
+        self.set_payload(payload if payload is not None else DEFAULT_PAYLOAD)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/daily_json.js"
+
+    @property
+    def request_count(self) -> int:
+        return self._httpd.request_count
+
+    @property
+    def connection_count(self) -> int:
+        return self._httpd.connection_count
+
+    @property
+    def not_modified_count(self) -> int:
+        return self._httpd.not_modified_count
+
+    @property
+    def delay(self) -> Union[float, Callable[[], float]]:
+        """Задержка перед каждым ответом в секундах или функция, возвращающая её для каждого запроса."""
+        return self._httpd.delay
+
+    @delay.setter
+    def delay(self, seconds: Union[float, Callable[[], float]]) -> None:
+        self._httpd.delay = seconds
+
+    def inject_fault(self, kind: str, count: int = 1, status: int = 503) -> None:
+        """
+        Ставит в очередь отказы для следующих count запросов.
+
+        Args:
+            kind: Вид отказа из FAULTS
+            count: Сколько запросов подряд получат отказ
+            status: HTTP-код для отказа вида 'status'
+
+        Raises:
+            ValueError: Если передан неизвестный вид отказа
+        """
+        if kind not in FAULTS:
+            raise ValueError(f"Неизвестный вид отказа: {kind}. Используйте один из {FAULTS}.")
+        with self._httpd.stats_lock:
+            self._httpd.faults.extend([(kind, status)] * count)
+
+    def set_payload(self, payload: Any) -> None:
+        """
+        Заменяет отдаваемый документ (dict сериализуется в JSON, str/bytes отдаются как есть).
+
+        Вместе с документом обновляются ETag и Last-Modified, поэтому условные
+        запросы с прежними значениями после замены получают полный ответ.
+        """
+        if isinstance(payload, bytes):
+            body = payload
+        elif isinstance(payload, str):
+            body = payload.encode("utf-8")
+        else:
+            body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        etag = '"' + hashlib.md5(body).hexdigest() + '"'
+        self._httpd.document = (body, etag, formatdate(usegmt=True))
+
+    def start(self) -> "CBRStubServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, args=(0.05,),
+                                        name="cbr-stub", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Останавливает сервер и разрывает открытые keep-alive соединения."""
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+        with self._httpd.stats_lock:
+            connections = list(self._httpd.active_connections)
+        for connection in connections:
+            try:
+                connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+    def __enter__(self) -> "CBRStubServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+def benchmark_fetch(requests_count: int = 200, delays=(0.0, 0.001, 0.005)) -> Dict[float, Dict[str, float]]:
+    """
+    Замер пути получения курсов (запрос, разбор JSON, извлечение Valute) на заглушке.
+
+    Args:
+        requests_count: Количество запросов для каждой задержки
+        delays: Имитируемые задержки сервера в секундах
+
+    Returns:
+        Словарь {задержка: {вариант: среднее время вызова в секундах}}
+    """
+    from Lab7 import get_currencies, make_session
+
+    results = {}
+    for delay in delays:
+        with CBRStubServer(delay=delay) as server:
+            session = make_session()
+            timings = {}
+            for name, call in [("requests.get", lambda: get_currencies(["USD", "EUR"], server.url)),
+                               ("Session", lambda: get_currencies(["USD", "EUR"], server.url, session=session))]:
+                start = time.perf_counter()
+                for _ in range(requests_count):
+                    call()
+                timings[name] = (time.perf_counter() - start) / requests_count
+            session.close()
+        results[delay] = timings
+    return results
+
+
+def main():
+    print("Путь get_currencies на локальной заглушке API ЦБ РФ")
+    results = benchmark_fetch()
+
+    print(f"{'Задержка (мс)':<16} {'requests.get (мс)':<20} {'Session (мс)':<16}")
+    for delay, timings in results.items():
+        print(f"{delay * 1000:<16.1f} {timings['requests.get'] * 1000:<20.3f} {timings['Session'] * 1000:<16.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,245 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import requests
+
+from Lab7 import DEFAULT_URL, get_currencies, make_session, parse_currencies
+
+
+class _Flight:
+    """Один общий запрос: ожидающие вызовы видят ошибку именно своего запроса."""
+
+    __slots__ = ("done", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.error: Optional[BaseException] = None
+
+
+class CurrencyCache:
+    """
+    Кэш таблицы Valute из ежедневного документа ЦБ РФ.
+
+    Пока не истёк TTL, запросы обслуживаются из памяти. После истечения
+    выполняется условный запрос (If-None-Match / If-Modified-Since): ответ 304
+    лишь продлевает срок жизни записи. Одновременные вызовы ждут один общий
+    запрос, а при ошибке сети отдаётся устаревшее значение, если оно есть.
+    """
+
+    def __init__(self, url: str = DEFAULT_URL, ttl: float = 3600, cache_path: Optional[str] = None,
+                 session: Optional[requests.Session] = None, timeout: float = 5, stale_retry: float = 30,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            url: URL API ЦБ РФ
+            ttl: Время жизни записи в секундах
+            cache_path: Путь к JSON-файлу для сохранения кэша между запусками
+            session: Сессия с пулом соединений
+            timeout: Таймаут запроса в секундах
+            stale_retry: Через сколько секунд повторять запрос после ошибки, отдав устаревшие данные
+            clock: Монотонные часы (подменяются в тестах)
+        """
+        self.url = url
+        self.ttl = ttl
+        self.cache_path = cache_path
+        self.session = session if session is not None else make_session()
+        self.timeout = timeout
+        self.stale_retry = stale_retry
+        self._clock = clock
+
+        self._valutes: Optional[Dict[str, Any]] = None
+        self._etag: Optional[str] = None
+        self._last_modified: Optional[str] = None
+        self._expires = float("-inf")
+
+        self._lock = threading.Lock()
+        self._inflight: Optional[_Flight] = None
+
+        self.stats = {"hits": 0, "fetches": 0, "not_modified": 0, "stale": 0}
+
+        if cache_path is not None:
+            self._load()
+
+    def get_valutes(self) -> Dict[str, Any]:
+        """
+        Возвращает таблицу Valute, обновляя её только по истечении TTL.
+
+        Raises:
+            ConnectionError: Если API недоступен и в кэше нет данных
+            ValueError: Если получен некорректный JSON
+            KeyError: Если в ответе отсутствует ключ "Valute"
+        """
+        valutes = self._valutes
+        if valutes is not None and self._clock() < self._expires:
+            self.stats["hits"] += 1
+            return valutes
+
+        with self._lock:
+            if self._valutes is not None and self._clock() < self._expires:
+                self.stats["hits"] += 1
+                return self._valutes
+
+            flight = self._inflight
+            leader = flight is None
+            if leader:
+                flight = self._inflight = _Flight()
+
+        if not leader:
+            flight.done.wait()
+            valutes = self._valutes
+            if valutes is None and flight.error is not None:
+                raise flight.error
+            return valutes
+
+        try:
+            self._refresh()
+        except Exception as e:
+            if self._valutes is None:
+                flight.error = e
+                raise
+            self.stats["stale"] += 1
+            self._expires = self._clock() + self.stale_retry
+        finally:
+            with self._lock:
+                self._inflight = None
+            flight.done.set()
+
+        return self._valutes
+
+    def get_currencies(self, currency_codes: List[str]) -> Dict[str, float]:
+        """
+        Возвращает курсы запрошенных валют из кэша.
+
+        Args:
+            currency_codes: Список кодов валют
+
+        Returns:
+            Словарь вида {"USD": 93.25, "EUR": 101.7}
+        """
+        return parse_currencies({"Valute": self.get_valutes()}, currency_codes)
+
+    def invalidate(self) -> None:
+        """Помечает запись устаревшей; следующий вызов выполнит условный запрос."""
+        self._expires = float("-inf")
+
+    def _refresh(self) -> None:
+        headers = {}
+        if self._valutes is not None:
+            if self._etag:
+                headers["If-None-Match"] = self._etag
+            if self._last_modified:
+                headers["If-Modified-Since"] = self._last_modified
+
+        try:
+            response = self.session.get(self.url, headers=headers, timeout=self.timeout)
+            self.stats["fetches"] += 1
+
+            if response.status_code == 304 and self._valutes is not None:
+                self.stats["not_modified"] += 1
+                self._expires = self._clock() + self.ttl
+                self._save()
+                return
+
+            response.raise_for_status()
+            try:
+                data = response.json()
+            except json.JSONDecodeError:
+                raise ValueError("Некорректный JSON ответ от API")
+        except requests.RequestException as e:
+            raise ConnectionError(f"API недоступен: {e}")
+
+        if "Valute" not in data:
+            raise KeyError("В ответе API отсутствует ключ 'Valute'")
+
+        self._etag = response.headers.get("ETag")
+        self._last_modified = response.headers.get("Last-Modified")
+        self._valutes = data["Valute"]
+        self._expires = self._clock() + self.ttl
+        self._save()
+
+    def _save(self) -> None:
+        if self.cache_path is None:
+            return
+
+        state = {
+            "valutes": self._valutes,
+            "etag": self._etag,
+            "last_modified": self._last_modified,
+            "expires_at": time.time() + (self._expires - self._clock()),
+        }
+        directory = os.path.dirname(os.path.abspath(self.cache_path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False)
+        os.replace(tmp_path, self.cache_path)
+
+    def _load(self) -> None:
+        try:
+            with open(self.cache_path, encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        self._valutes = state.get("valutes")
+        self._etag = state.get("etag")
+        self._last_modified = state.get("last_modified")
+        self._expires = self._clock() + (state.get("expires_at", 0) - time.time())
+
+
+_caches: Dict[str, CurrencyCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_currencies_cached(currency_codes: List[str], url: str = DEFAULT_URL, ttl: float = 3600) -> Dict[str, float]:
+    """
+    Аналог get_currencies с общим кэшем на каждый URL.
+
+    Args:
+        currency_codes: Список кодов валют
+        url: URL API ЦБ РФ
+        ttl: Время жизни записи в секундах (учитывается при создании кэша для URL)
+
+    Returns:
+        Словарь вида {"USD": 93.25, "EUR": 101.7}
+    """
+    cache = _caches.get(url)
+    if cache is None:
+        with _caches_lock:
+            cache = _caches.get(url)
+            if cache is None:
+                cache = _caches[url] = CurrencyCache(url, ttl=ttl)
+    return cache.get_currencies(currency_codes)
+
+
+def main():
+    from cbr_stub import CBRStubServer
+
+    print("Сравнение get_currencies и CurrencyCache на локальной заглушке")
+    lookups = 1000
+    codes = ["USD", "EUR"]
+
+    with CBRStubServer() as server:
+        start = time.perf_counter()
+        for _ in range(lookups):
+            get_currencies(codes, server.url)
+        uncached = (time.perf_counter() - start) / lookups
+
+        cache = CurrencyCache(server.url)
+        cache.get_currencies(codes)
+        start = time.perf_counter()
+        for _ in range(lookups):
+            cache.get_currencies(codes)
+        cached = (time.perf_counter() - start) / lookups
+        cache.session.close()
+
+    print(f"{'Вариант':<16} {'Время вызова (мкс)':<20}")
+    print(f"{'get_currencies':<16} {uncached * 1e6:<20.2f}")
+    print(f"{'CurrencyCache':<16} {cached * 1e6:<20.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+import asyncio
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence, Union
+
+import requests
+
+from Lab7 import DEFAULT_URL, get_currencies, get_shared_session, logger, make_session
+from metrics import REGISTRY
+
+
+class CurrencyClient:
+    """
+    Синхронный клиент API ЦБ РФ поверх requests.Session.
+
+    Все запросы идут через одну сессию с пулом соединений,
+    поэтому повторные вызовы не платят за новое TCP/TLS рукопожатие.
+    """
+
+    def __init__(self, url: str = DEFAULT_URL, max_connections: int = 10, timeout: float = 5,
+                 session: Optional[requests.Session] = None):
+        self.url = url
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.session = session if session is not None else make_session(max_connections)
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def get_currencies(self, currency_codes: List[str], url: Optional[str] = None) -> Dict[str, float]:
+        """
+        Получает курсы валют, переиспользуя соединения сессии.
+
+        Args:
+            currency_codes: Список кодов валют
+            url: URL API; по умолчанию используется url клиента
+
+        Returns:
+            Словарь вида {"USD": 93.25, "EUR": 101.7}
+        """
+        return get_currencies(currency_codes, url or self.url, session=self.session, timeout=self.timeout)
+
+    def get_currencies_many(self, currency_codes: List[str], urls: Sequence[str],
+                            return_exceptions: bool = False) -> List[Union[Dict[str, float], Exception]]:
+        """
+        Параллельно запрашивает курсы с нескольких URL.
+
+        Args:
+            currency_codes: Список кодов валют
+            urls: Список URL API
+            return_exceptions: Возвращать исключения в списке результатов вместо их проброса
+
+        Returns:
+            Список результатов в порядке urls
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_connections,
+                                                thread_name_prefix="currency-client")
+        futures = [self._executor.submit(self.get_currencies, currency_codes, url) for url in urls]
+
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                results.append(e)
+        return results
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self.session.close()
+
+    def __enter__(self) -> "CurrencyClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class AsyncCurrencyClient:
+    """
+    Асинхронный клиент API ЦБ РФ.
+
+    Блокирующий ввод-вывод requests выполняется в собственном пуле потоков,
+    число одновременных запросов ограничено семафором по размеру пула соединений.
+    """
+
+    def __init__(self, url: str = DEFAULT_URL, max_connections: int = 10, timeout: float = 5,
+                 session: Optional[requests.Session] = None):
+        self.url = url
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.session = session if session is not None else make_session(max_connections)
+        self._executor = ThreadPoolExecutor(max_workers=max_connections, thread_name_prefix="currency-async")
+        self._semaphore = asyncio.Semaphore(max_connections)
+
+    async def get_currencies(self, currency_codes: List[str], url: Optional[str] = None) -> Dict[str, float]:
+        """
+        Получает курсы валют, не блокируя цикл событий.
+
+        Args:
+            currency_codes: Список кодов валют
+            url: URL API; по умолчанию используется url клиента
+
+        Returns:
+            Словарь вида {"USD": 93.25, "EUR": 101.7}
+        """
+        loop = asyncio.get_running_loop()
+        call = functools.partial(get_currencies, currency_codes, url or self.url,
+                                 session=self.session, timeout=self.timeout)
+        async with self._semaphore:
+            return await loop.run_in_executor(self._executor, call)
+
+    async def get_currencies_many(self, currency_codes: List[str], urls: Sequence[str],
+                                  return_exceptions: bool = False) -> List[Union[Dict[str, float], Exception]]:
+        """
+        Конкурентно запрашивает курсы с нескольких URL.
+
+        Args:
+            currency_codes: Список кодов валют
+            urls: Список URL API
+            return_exceptions: Возвращать исключения в списке результатов вместо их проброса
+
+        Returns:
+            Список результатов в порядке urls
+        """
+        tasks = [self.get_currencies(currency_codes, url) for url in urls]
+        return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+
+    async def aclose(self) -> None:
+        self._executor.shutdown(wait=True)
+        self.session.close()
+
+    async def __aenter__(self) -> "AsyncCurrencyClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+
+@logger(metrics=REGISTRY)
+async def get_currencies_async(currency_codes: List[str], url: str = DEFAULT_URL,
+                               client: Optional[AsyncCurrencyClient] = None) -> Dict[str, float]:
+    """
+    Асинхронно получает курсы валют, логируя вызов без блокировки цикла событий.
+
+    Args:
+        currency_codes: Список кодов валют
+        url: URL API ЦБ РФ
+        client: Асинхронный клиент; по умолчанию запрос выполняется
+            в пуле потоков цикла событий через общую сессию Lab7
+
+    Returns:
+        Словарь вида {"USD": 93.25, "EUR": 101.7}
+    """
+    if client is not None:
+        return await client.get_currencies(currency_codes, url)
+    loop = asyncio.get_running_loop()
+    call = functools.partial(get_currencies, currency_codes, url, session=get_shared_session())
+    return await loop.run_in_executor(None, call)
+
+
+def benchmark_clients(requests_count: int = 200, concurrency: int = 10) -> Dict[str, Dict[str, float]]:
+    """
+    Сравнивает задержку и пропускную способность клиентов на локальной заглушке API.
+
+    Args:
+        requests_count: Количество запросов для каждого варианта
+        concurrency: Размер пула соединений для конкурентного варианта
+
+    Returns:
+        Словарь {вариант: {"latency": средняя задержка, "throughput": запросов в секунду}}
+    """
+    from cbr_stub import CBRStubServer
+
+    codes = ["USD", "EUR"]
+    results = {}
+
+    with CBRStubServer() as server:
+        def measure(name, run):
+            start = time.perf_counter()
+            run()
+            elapsed = time.perf_counter() - start
+            results[name] = {"latency": elapsed / requests_count, "throughput": requests_count / elapsed}
+
+        measure("requests.get", lambda: [get_currencies(codes, server.url) for _ in range(requests_count)])
+
+        with CurrencyClient(server.url) as client:
+            measure("CurrencyClient", lambda: [client.get_currencies(codes) for _ in range(requests_count)])
+
+        with CurrencyClient(server.url, max_connections=concurrency) as client:
+            measure("CurrencyClient.many",
+                    lambda: client.get_currencies_many(codes, [server.url] * requests_count))
+
+        async def run_async():
+            async with AsyncCurrencyClient(server.url, max_connections=concurrency) as client:
+                await client.get_currencies_many(codes, [server.url] * requests_count)
+
+        measure("AsyncCurrencyClient.many", lambda: asyncio.run(run_async()))
+
+    return results
+
+
+def main():
+    print("Сравнение клиентов API ЦБ РФ на локальной заглушке")
+    results = benchmark_clients()
+
+    print(f"{'Вариант':<28} {'Задержка (мс)':<16} {'Запросов/с':<12}")
+    for name, stats in results.items():
+        print(f"{name:<28} {stats['latency'] * 1000:<16.3f} {stats['throughput']:<12.1f}")
+
+
+if __name__ == "__main__":
+    main()
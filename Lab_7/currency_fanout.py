@@ -0,0 +1,241 @@
+import random
+import statistics
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import requests
+
+from Lab7 import get_currencies, make_session
+
+
+class CodeError(NamedTuple):
+    """Ошибка получения курса одной валюты с одного зеркала."""
+    url: str
+    error: Exception
+
+
+class FanoutResult(NamedTuple):
+    """
+    Результат опроса зеркал.
+
+    rates - полученные курсы, sources - URL зеркала, давшего курс каждой валюты,
+    errors - ошибки по каждому зеркалу для валют, курс которых получить не удалось.
+    """
+    rates: Dict[str, float]
+    sources: Dict[str, str]
+    errors: Dict[str, List[CodeError]]
+
+    @property
+    def complete(self) -> bool:
+        return not self.errors
+
+
+class CurrencyFanout:
+    """
+    Опрос нескольких зеркал API ЦБ РФ с хеджированием медленных запросов.
+
+    Сначала запрашивается первое зеркало; если за hedge_delay ответ не пришёл
+    или зеркало вернуло не все валюты, запускается следующее. Для каждой валюты
+    берётся первый успешный курс, опоздавшие ответы отбрасываются.
+    """
+
+    def __init__(self, urls: Sequence[str], hedge_delay: float = 0.05, timeout: float = 5,
+                 max_connections: int = 10, session: Optional[requests.Session] = None):
+        """
+        Args:
+            urls: URL зеркал в порядке предпочтения
+            hedge_delay: Через сколько секунд без ответа запускать следующее зеркало
+                (0 - опрашивать все зеркала сразу)
+            timeout: Таймаут одного запроса в секундах
+            max_connections: Размер пула соединений и потоков
+            session: Сессия с пулом соединений; по умолчанию создаётся своя
+        """
+        if not urls:
+            raise ValueError("Список зеркал пуст")
+        self.urls = list(urls)
+        self.hedge_delay = hedge_delay
+        self.timeout = timeout
+        self.session = session if session is not None else make_session(max_connections)
+        self._executor = ThreadPoolExecutor(max_workers=max_connections, thread_name_prefix="currency-fanout")
+
+    def _fetch(self, url: str, currency_codes: List[str]) -> Tuple[Dict[str, float], Dict[str, Exception]]:
+        errors: Dict[str, Exception] = {}
+        rates = get_currencies(currency_codes, url, session=self.session, timeout=self.timeout, errors=errors)
+        return rates, errors
+
+    def get_currencies(self, currency_codes: List[str]) -> FanoutResult:
+        """
+        Получает курсы валют с зеркал, возвращая частичный результат вместо исключения.
+
+        Args:
+            currency_codes: Список кодов валют
+
+        Returns:
+            FanoutResult с курсами, источниками и ошибками по валютам без курса
+        """
+        codes = list(dict.fromkeys(currency_codes))
+        pending = set(codes)
+        rates: Dict[str, float] = {}
+        sources: Dict[str, str] = {}
+        errors: Dict[str, List[CodeError]] = {code: [] for code in codes}
+
+        mirrors = iter(self.urls)
+        remaining = len(self.urls)
+        in_flight: Dict[Future, str] = {}
+
+        def launch() -> None:
+            nonlocal remaining
+            url = next(mirrors, None)
+            if url is not None:
+                remaining -= 1
+                in_flight[self._executor.submit(self._fetch, url, codes)] = url
+
+        launch()
+        if self.hedge_delay <= 0:
+            while remaining:
+                launch()
+
+        while pending and in_flight:
+            done, _ = wait(in_flight, timeout=self.hedge_delay if remaining else None,
+                           return_when=FIRST_COMPLETED)
+            if not done:
+                launch()  # хеджирование медленного зеркала
+                continue
+
+            for future in done:
+                url = in_flight.pop(future)
+                try:
+                    mirror_rates, mirror_errors = future.result()
+                except Exception as e:
+                    mirror_rates, mirror_errors = {}, {code: e for code in pending}
+
+                for code, value in mirror_rates.items():
+                    if code in pending:
+                        rates[code] = value
+                        sources[code] = url
+                        pending.discard(code)
+                for code, error in mirror_errors.items():
+                    if code in pending:
+                        errors[code].append(CodeError(url, error))
+
+            if pending:
+                launch()  # зеркало не дало всех курсов - сразу пробуем следующее
+
+        return FanoutResult(
+            rates={code: rates[code] for code in codes if code in rates},
+            sources=sources,
+            errors={code: errors[code] for code in codes if code in pending},
+        )
+
+    def close(self, wait: bool = True) -> None:
+        """
+        Отменяет ещё не начатые запросы и закрывает сессию после завершения начатых.
+
+        Args:
+            wait: Ждать опоздавшие запросы (не дольше timeout); при False они
+                дорабатывают и закрывают сессию в фоновом потоке
+        """
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        if wait:
+            self._finish_close()
+        else:
+            threading.Thread(target=self._finish_close, name="currency-fanout-close", daemon=True).start()
+
+    def _finish_close(self) -> None:
+        # Сессию нельзя закрывать, пока ею пользуются потоки пула
+        self._executor.shutdown(wait=True)
+        self.session.close()
+
+    def __enter__(self) -> "CurrencyFanout":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def get_currencies_fanout(currency_codes: List[str], urls: Sequence[str], hedge_delay: float = 0.05,
+                          timeout: float = 5) -> FanoutResult:
+    """Однократный опрос зеркал (см. CurrencyFanout.get_currencies)."""
+    fanout = CurrencyFanout(urls, hedge_delay=hedge_delay, timeout=timeout)
+    try:
+        return fanout.get_currencies(currency_codes)
+    finally:
+        # Результаты опоздавших зеркал уже не нужны - не задерживаем ответ ради них
+        fanout.close(wait=False)
+
+
+def _percentile(samples: List[float], q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def benchmark_fanout(requests_count: int = 300, mirrors: int = 3, slow_share: float = 0.1,
+                     slow_delay: float = 0.2, fast_delay: float = 0.002, seed: int = 0) -> Dict[str, Dict[str, float]]:
+    """
+    Измеряет хвостовые задержки при опросе зеркал, часть ответов которых медленные.
+
+    Args:
+        requests_count: Количество запросов для каждого варианта
+        mirrors: Количество зеркал
+        slow_share: Доля медленных ответов каждого зеркала
+        slow_delay: Задержка медленного ответа в секундах
+        fast_delay: Задержка обычного ответа в секундах
+        seed: Зерно генератора задержек
+
+    Returns:
+        Словарь {вариант: {"p50", "p95", "p99": задержки в секундах, "requests": запросов к зеркалам на вызов}}
+    """
+    from cbr_stub import CBRStubServer
+
+    rng = random.Random(seed)
+
+    def delay() -> float:
+        return slow_delay if rng.random() < slow_share else fast_delay
+
+    servers = [CBRStubServer(delay=delay).start() for _ in range(mirrors)]
+    urls = [server.url for server in servers]
+    codes = ["USD", "EUR"]
+    variants = {
+        "одно зеркало": {"urls": urls[:1], "hedge_delay": 0.05},
+        "хеджирование 10 мс": {"urls": urls, "hedge_delay": 0.01},
+        "все зеркала сразу": {"urls": urls, "hedge_delay": 0},
+    }
+
+    results = {}
+    try:
+        for name, options in variants.items():
+            before = sum(server.request_count for server in servers)
+            with CurrencyFanout(options["urls"], hedge_delay=options["hedge_delay"]) as fanout:
+                fanout.get_currencies(codes)  # прогрев соединений
+                samples = []
+                for _ in range(requests_count):
+                    start = time.perf_counter()
+                    fanout.get_currencies(codes)
+                    samples.append(time.perf_counter() - start)
+            sent = sum(server.request_count for server in servers) - before
+            results[name] = {
+                "p50": statistics.median(samples),
+                "p95": _percentile(samples, 0.95),
+                "p99": _percentile(samples, 0.99),
+                "requests": sent / (requests_count + 1),
+            }
+    finally:
+        for server in servers:
+            server.stop()
+    return results
+
+
+def main():
+    print("Хвостовые задержки опроса зеркал (10% ответов каждого зеркала задержаны на 200 мс)")
+    results = benchmark_fanout()
+
+    print(f"{'Вариант':<22} {'p50 (мс)':<10} {'p95 (мс)':<10} {'p99 (мс)':<10} {'Запросов/вызов':<14}")
+    for name, stats in results.items():
+        print(f"{name:<22} {stats['p50'] * 1000:<10.2f} {stats['p95'] * 1000:<10.2f} "
+              f"{stats['p99'] * 1000:<10.2f} {stats['requests']:<14.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import unittest
+
+import Lab7
+from Lab7 import REGISTRY, get_currencies_stdout, solve_quadratic_logged
+
+
+def demonstrate_quadratic():
+    print("Демонстрация solve_quadratic")
+    
+    print("\n1. Два корня:")
+    result = solve_quadratic_logged(1, -3, 2)
+    print(f"Результат: {result}")
+    
+    print("\n2. Дискриминант < 0:")
+    result = solve_quadratic_logged(1, 1, 1)
+    print(f"Результат: {result}")
+    
+    print("\n3. Некорректные данные:")
+    try:
+        solve_quadratic_logged("abc", 2, 1)
+    except TypeError as e:
+        print(f"Поймано исключение: {e}")
+    
+    print("\n4. Невозможная ситуация:")
+    try:
+        solve_quadratic_logged(0, 0, 5)
+    except ValueError as e:
+        print(f"Поймано исключение: {e}")
+
+
+def demonstrate_currencies():
+    print("Демонстрация get_currencies")
+    
+    try:
+        result = get_currencies_stdout(['USD', 'EUR'])
+        print(f"Курсы валют: {result}")
+    except Exception as e:
+        print(f"Ошибка при получении курсов: {e}")
+    
+    print("Демонстрация файлового логирования")
+    try:
+        result = Lab7.get_currencies_file(['USD', 'EUR'])
+        print(f"Курсы валют: {result}")
+        print("Логи сохранены в файл currency_log.txt")
+    except Exception as e:
+        print(f"Ошибка: {e}")
+
+
+def main():
+    print("ЗАПУСК ДЕМОНСТРАЦИИ")
+    
+    demonstrate_quadratic()
+    
+    demonstrate_currencies()
+    
+    print("Метрики вызовов")
+    print(REGISTRY.to_prometheus())
+    
+    print("ЗАПУСК ТЕСТОВ")
+    
+    unittest.main(module="test_lab7", argv=[''], verbosity=2, exit=False)
+
+
+if __name__ == '__main__':
+    main()
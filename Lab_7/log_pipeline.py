@@ -0,0 +1,142 @@
+import json
+import logging
+import logging.handlers
+from typing import List
+
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+LOG_FORMATS = ("text", "jsonl")
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Форматирует запись в одну строку JSON: время, уровень, имя логгера и сообщение."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "ts": round(record.created, 6),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        if record.exc_info:
+            data["exc"] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False)
+
+
+class BatchRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    RotatingFileHandler, записывающий пачку записей одним вызовом write.
+
+    Ротация по размеру проверяется внутри пачки, поэтому ни один файл
+    не превышает max_bytes (кроме случая, когда больше max_bytes одна запись).
+    """
+
+    def __init__(self, filename: str, max_bytes: int = 1024 * 1024, backup_count: int = 3,
+                 encoding: str = "utf-8", delay: bool = True):
+        """
+        Args:
+            filename: Путь к файлу лога
+            max_bytes: Размер файла, после которого он ротируется (0 - без ротации)
+            backup_count: Сколько ротированных файлов (.1, .2, ...) хранить
+            encoding: Кодировка файла
+            delay: Открывать файл при первой записи, а не при создании обработчика
+        """
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, encoding=encoding, delay=delay)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.emit_batch([record])
+
+    def emit_batch(self, records: List[logging.LogRecord]) -> None:
+        """Форматирует записи и дописывает их в файл, при необходимости ротируя его."""
+        lines = []
+        pending = 0
+        self.acquire()
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            written = self.stream.tell()
+
+            for record in records:
+                if not self.filter(record):
+                    continue
+                try:
+                    line = self.format(record) + self.terminator
+                except Exception:
+                    self.handleError(record)
+                    continue
+                size = len(line.encode(self.encoding or "utf-8"))
+                if self.maxBytes > 0 and written + pending + size > self.maxBytes and written + pending > 0:
+                    self.stream.write("".join(lines))
+                    lines.clear()
+                    self.doRollover()
+                    if self.stream is None:
+                        self.stream = self._open()
+                    written = pending = 0
+                lines.append(line)
+                pending += size
+
+            if lines:
+                self.stream.write("".join(lines))
+            self.stream.flush()
+        except Exception:
+            self.handleError(records[-1])
+        finally:
+            self.release()
+
+
+class BatchQueueListener(logging.handlers.QueueListener):
+    """
+    QueueListener, передающий записи обработчикам пачками.
+
+    Пачка сбрасывается, когда очередь опустела или набралось batch_size записей;
+    обработчики с методом emit_batch получают её целиком, остальные - по одной записи.
+    """
+
+    def __init__(self, queue, *handlers: logging.Handler, batch_size: int = 256,
+                 respect_handler_level: bool = True):
+        super().__init__(queue, *handlers, respect_handler_level=respect_handler_level)
+        self.batch_size = batch_size
+        self._batch: List[logging.LogRecord] = []
+
+    def handle(self, record: logging.LogRecord) -> None:
+        self._batch.append(self.prepare(record))
+        if len(self._batch) >= self.batch_size or self.queue.empty():
+            self.flush()
+
+    def flush(self) -> None:
+        batch, self._batch = self._batch, []
+        if not batch:
+            return
+        for handler in self.handlers:
+            records = [r for r in batch if r.levelno >= handler.level] if self.respect_handler_level else batch
+            emit_batch = getattr(handler, "emit_batch", None)
+            if emit_batch is not None:
+                emit_batch(records)
+            else:
+                for record in records:
+                    handler.handle(record)
+
+    def stop(self) -> None:
+        """Останавливает поток и сбрасывает последнюю неполную пачку."""
+        super().stop()
+        self.flush()
+
+
+def make_file_handler(filename: str, max_bytes: int = 1024 * 1024, backup_count: int = 3,
+                      fmt: str = "text") -> BatchRotatingFileHandler:
+    """
+    Создаёт ротируемый файловый обработчик для фоновой записи логов.
+
+    Args:
+        filename: Путь к файлу лога
+        max_bytes: Размер файла, после которого он ротируется
+        backup_count: Сколько ротированных файлов хранить
+        fmt: 'text' (TEXT_FORMAT) или 'jsonl' (одна запись JSON на строку)
+
+    Raises:
+        ValueError: Если передан неизвестный формат
+    """
+    if fmt not in LOG_FORMATS:
+        raise ValueError(f"Неизвестный формат лога: {fmt}. Используйте 'text' или 'jsonl'.")
+    handler = BatchRotatingFileHandler(filename, max_bytes=max_bytes, backup_count=backup_count)
+    handler.setFormatter(JsonLinesFormatter() if fmt == "jsonl" else logging.Formatter(TEXT_FORMAT))
+    return handler
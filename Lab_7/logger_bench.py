@@ -0,0 +1,228 @@
+import functools
+import io
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+import timeit
+import tracemalloc
+from typing import Callable, Dict, Optional
+
+from Lab7 import QueueSink, logger
+from log_pipeline import TEXT_FORMAT, make_file_handler
+from metrics import MetricsRegistry
+
+
+def legacy_logger(func: Optional[Callable] = None, *, handle=sys.stdout):
+    """
+    Исходная версия декоратора logger, сохранённая для сравнения накладных расходов.
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            is_logger = isinstance(handle, logging.Logger)
+
+            def log(level, message):
+                if is_logger:
+                    if level == "INFO":
+                        handle.info(message)
+                    elif level == "ERROR":
+                        handle.error(message)
+                    elif level == "WARNING":
+                        handle.warning(message)
+                    elif level == "CRITICAL":
+                        handle.critical(message)
+                else:
+                    handle.write(f"{level}: {message}\n")
+                    if hasattr(handle, 'flush'):
+                        handle.flush()
+
+            args_repr = [repr(a) for a in args]
+            kwargs_repr = [f"{k}={v!r}" for k, v in kwargs.items()]
+            signature = ", ".join(args_repr + kwargs_repr)
+
+            log("INFO", f"Вызов {func.__name__}({signature})")
+
+            try:
+                result = func(*args, **kwargs)
+                log("INFO", f"{func.__name__} вернула {result!r}")
+                return result
+            except Exception as e:
+                log("ERROR", f"Исключение в {func.__name__}: {type(e).__name__}: {e}")
+                raise
+
+        return wrapper
+
+    if func is not None:
+        return decorator(func)
+
+    return decorator
+
+
+def target(a, b, c):
+    return a * b + c
+
+
+def benchmark_logger(number: int = 20000, repeat: int = 5) -> Dict[str, float]:
+    """
+    Замер накладных расходов декоратора на один вызов.
+
+    Args:
+        number: Количество вызовов в одном прогоне
+        repeat: Количество повторений
+
+    Returns:
+        Словарь {вариант: время одного вызова в секундах без учёта самой функции}
+    """
+    disabled = logging.Logger("bench.disabled", logging.WARNING)
+    enabled = logging.Logger("bench.enabled", logging.INFO)
+    enabled.addHandler(logging.StreamHandler(io.StringIO()))
+    sink = QueueSink(io.StringIO())
+
+    variants = {
+        "legacy, StringIO": legacy_logger(handle=io.StringIO())(target),
+        "new, StringIO": logger(handle=io.StringIO())(target),
+        "legacy, Logger INFO": legacy_logger(handle=enabled)(target),
+        "new, Logger INFO": logger(handle=enabled)(target),
+        "legacy, Logger WARNING": legacy_logger(handle=disabled)(target),
+        "new, Logger WARNING": logger(handle=disabled)(target),
+        "new, sample_rate=0.01": logger(handle=io.StringIO(), sample_rate=0.01)(target),
+        "new, QueueSink": logger(handle=sink)(target),
+        "new, handle=None, metrics": logger(handle=None, metrics=MetricsRegistry())(target),
+    }
+
+    def per_call(func):
+        return min(timeit.repeat(lambda: func(3, 4, c=5), number=number, repeat=repeat)) / number
+
+    baseline = per_call(target)
+    results = {name: per_call(func) - baseline for name, func in variants.items()}
+    sink.stop()
+    return results
+
+
+def benchmark_huge_payload(size: int = 1_000_000) -> Dict[str, Dict[str, float]]:
+    """
+    Замер времени и пикового объёма памяти логирования вызова с огромным аргументом.
+
+    Args:
+        size: Длина списка, передаваемого в декорированную функцию
+
+    Returns:
+        Словарь {вариант: {"time": секунды на вызов, "peak": пик памяти в байтах}}
+    """
+    payload = list(range(size))
+    variants = {
+        "legacy": legacy_logger(handle=io.StringIO())(len),
+        "new, max_repr=1000": logger(handle=io.StringIO(), max_repr=1000)(len),
+        "new, capture='type'": logger(handle=io.StringIO(), capture="type")(len),
+    }
+
+    results = {}
+    for name, func in variants.items():
+        elapsed = min(timeit.repeat(lambda: func(payload), number=1, repeat=3))
+        tracemalloc.start()
+        func(payload)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        results[name] = {"time": elapsed, "peak": peak}
+    return results
+
+
+def benchmark_file_logging(threads_counts=(1, 8), calls: int = 2000) -> Dict[str, Dict[int, Dict[str, float]]]:
+    """
+    Замер задержки декорированного вызова в вызывающем потоке при записи лога в файл.
+
+    Args:
+        threads_counts: Количество одновременно логирующих потоков
+        calls: Количество вызовов в каждом потоке
+
+    Returns:
+        Словарь {вариант: {потоков: {"mean", "p99": задержка вызова, "drain": дозапись очереди в секундах}}}
+    """
+    def file_handler(path):
+        handler = logging.FileHandler(path, encoding="utf-8")
+        handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+        return handler
+
+    def sync_logger(path):
+        log = logging.Logger("bench.file", logging.INFO)
+        log.addHandler(file_handler(path))
+        return log, log.handlers[0].close
+
+    def queue_sink(path, **options):
+        sink = QueueSink(options.pop("handler", None) or file_handler(path), **options)
+        return sink, lambda: (sink.stop(), sink.handler.close())
+
+    variants = {
+        "FileHandler": sync_logger,
+        "QueueSink + FileHandler": queue_sink,
+        "QueueSink, пачки": lambda path: queue_sink(path, handler=make_file_handler(path, max_bytes=1 << 20),
+                                                    batch_size=256),
+        "QueueSink, пачки, jsonl": lambda path: queue_sink(path, handler=make_file_handler(path, max_bytes=1 << 20,
+                                                                                           fmt="jsonl"),
+                                                           batch_size=256),
+    }
+
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for name, make in variants.items():
+            results[name] = {}
+            for threads_count in threads_counts:
+                path = os.path.join(directory, f"{len(results)}-{threads_count}.log")
+                handle, close = make(path)
+                decorated = logger(handle=handle)(target)
+                latencies = []
+                barrier = threading.Barrier(threads_count)
+
+                def worker():
+                    local = []
+                    barrier.wait()
+                    for i in range(calls):
+                        start = time.perf_counter()
+                        decorated(i, 2, c=3)
+                        local.append(time.perf_counter() - start)
+                    latencies.extend(local)
+
+                workers = [threading.Thread(target=worker) for _ in range(threads_count)]
+                for thread in workers:
+                    thread.start()
+                for thread in workers:
+                    thread.join()
+                start = time.perf_counter()
+                close()
+                drain = time.perf_counter() - start
+
+                latencies.sort()
+                results[name][threads_count] = {
+                    "mean": sum(latencies) / len(latencies),
+                    "p99": latencies[int(len(latencies) * 0.99)],
+                    "drain": drain,
+                }
+    return results
+
+
+def main():
+    print("Накладные расходы декоратора logger на один вызов")
+    results = benchmark_logger()
+
+    print(f"{'Вариант':<26} {'Накладные расходы (мкс)':<24}")
+    for name, overhead in results.items():
+        print(f"{name:<26} {overhead * 1e6:<24.3f}")
+
+    print("\nВызов со списком из 10^6 элементов")
+    print(f"{'Вариант':<26} {'Время (мс)':<14} {'Пик памяти (КБ)':<16}")
+    for name, stats in benchmark_huge_payload().items():
+        print(f"{name:<26} {stats['time'] * 1000:<14.3f} {stats['peak'] / 1024:<16.1f}")
+
+    print("\nЗадержка вызова при логировании в файл")
+    print(f"{'Вариант':<26} {'Потоков':<8} {'Среднее (мкс)':<14} {'p99 (мкс)':<12} {'Дозапись (мс)':<14}")
+    for name, by_threads in benchmark_file_logging().items():
+        for threads_count, stats in by_threads.items():
+            print(f"{name:<26} {threads_count:<8} {stats['mean'] * 1e6:<14.2f} {stats['p99'] * 1e6:<12.2f} "
+                  f"{stats['drain'] * 1000:<14.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,305 @@
+import functools
+import random
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+CACHE_POLICIES = ("lru", "lfu")
+
+_KWARGS_MARK = object()
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    currsize: int
+    currbytes: int
+    maxsize: Optional[int]
+    maxbytes: Optional[int]
+
+
+class _Entry:
+    __slots__ = ("value", "size", "expires", "freq")
+
+    def __init__(self, value: Any, size: int, expires: float):
+        self.value = value
+        self.size = size
+        self.expires = expires
+        self.freq = 1
+
+
+def _sizeof(value: Any) -> int:
+    """Приблизительный размер значения в байтах (кортежи и списки - с элементами)."""
+    size = sys.getsizeof(value)
+    if isinstance(value, (tuple, list)):
+        size += sum(sys.getsizeof(item) for item in value)
+    return size
+
+
+def _make_key(args: tuple, kwargs: dict, typed: bool) -> tuple:
+    key = args
+    if kwargs:
+        key += (_KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+    if typed:
+        key += tuple(type(v) for v in args)
+        if kwargs:
+            key += tuple(type(v) for _, v in sorted(kwargs.items()))
+    return key
+
+
+class _LRUStore:
+    """Записи в порядке последнего обращения; вытесняется самая давняя."""
+
+    def __init__(self):
+        self.data: "OrderedDict[tuple, _Entry]" = OrderedDict()
+
+    def get(self, key):
+        entry = self.data.get(key)
+        if entry is not None:
+            self.data.move_to_end(key)
+        return entry
+
+    def add(self, key, entry: _Entry) -> None:
+        self.data[key] = entry
+
+    def remove(self, key) -> _Entry:
+        return self.data.pop(key)
+
+    def victim(self):
+        return next(iter(self.data))
+
+
+class _FreqBucket:
+    """Ключи с одной частотой обращений в порядке добавления; звено списка по возрастанию частот."""
+
+    __slots__ = ("freq", "keys", "prev", "next")
+
+    def __init__(self, freq: int):
+        self.freq = freq
+        self.keys: "OrderedDict[tuple, None]" = OrderedDict()
+        self.prev = self.next = self
+
+
+class _LFUStore:
+    """
+    Записи, сгруппированные по частоте обращений; вытесняется самая редкая,
+    а среди равных по частоте - самая давняя. Все операции O(1): корзины частот
+    связаны в список по возрастанию, и запись переходит только в соседнюю корзину,
+    поэтому наименьшая частота - всегда первая корзина, даже после удаления произвольной записи.
+    """
+
+    def __init__(self):
+        self.data: Dict[tuple, _Entry] = {}
+        self.by_freq: Dict[int, _FreqBucket] = {}
+        self._head = _FreqBucket(0)
+
+    def _bucket_after(self, bucket: _FreqBucket, freq: int) -> _FreqBucket:
+        following = bucket.next
+        if following.freq == freq:
+            return following
+        new = self.by_freq[freq] = _FreqBucket(freq)
+        new.prev, new.next = bucket, following
+        bucket.next = following.prev = new
+        return new
+
+    def _discard(self, bucket: _FreqBucket, key) -> None:
+        del bucket.keys[key]
+        if not bucket.keys:
+            bucket.prev.next, bucket.next.prev = bucket.next, bucket.prev
+            del self.by_freq[bucket.freq]
+
+    def get(self, key):
+        entry = self.data.get(key)
+        if entry is not None:
+            bucket = self.by_freq[entry.freq]
+            entry.freq += 1
+            self._bucket_after(bucket, entry.freq).keys[key] = None
+            self._discard(bucket, key)
+        return entry
+
+    def add(self, key, entry: _Entry) -> None:
+        self.data[key] = entry
+        self._bucket_after(self._head, entry.freq).keys[key] = None
+
+    def remove(self, key) -> _Entry:
+        entry = self.data.pop(key)
+        self._discard(self.by_freq[entry.freq], key)
+        return entry
+
+    def victim(self):
+        return next(iter(self._head.next.keys))
+
+
+def memoize(func: Optional[Callable] = None, *, maxsize: Optional[int] = 128, maxbytes: Optional[int] = None,
+            policy: str = "lru", ttl: Optional[float] = None, typed: bool = False,
+            clock: Callable[[], float] = time.monotonic):
+    """
+    Параметризуемый декоратор мемоизации для чистых функций.
+
+    В отличие от functools.lru_cache ограничивает кэш по числу записей и/или
+    по суммарному размеру значений, поддерживает вытеснение LRU и LFU
+    и время жизни записей. Вычисление выполняется вне блокировки, исключения не кэшируются.
+    Совместим с logger: @logger над @memoize логирует все вызовы, под ним - только промахи.
+
+    Args:
+        func: Декорируемая функция
+        maxsize: Максимальное число записей (None - без ограничения)
+        maxbytes: Максимальный суммарный размер значений в байтах (None - без ограничения)
+        policy: 'lru' - вытеснять давно не использованные, 'lfu' - редко используемые
+        ttl: Время жизни записи в секундах (None - бессрочно)
+        typed: Различать аргументы разных типов (1 и 1.0)
+        clock: Монотонные часы для TTL (подменяются в тестах)
+
+    Returns:
+        Обёртка с методами cache_info() и cache_clear()
+
+    Raises:
+        ValueError: Если передана неподдерживаемая политика вытеснения
+    """
+    if policy not in CACHE_POLICIES:
+        raise ValueError(f"Неподдерживаемая политика: {policy}. Используйте 'lru' или 'lfu'.")
+
+    def decorator(func: Callable) -> Callable:
+        store = _LRUStore() if policy == "lru" else _LFUStore()
+        lock = threading.Lock()
+        stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0, "bytes": 0}
+
+        def evict(key) -> None:
+            entry = store.remove(key)
+            stats["bytes"] -= entry.size
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = args if not kwargs and not typed else _make_key(args, kwargs, typed)
+
+            with lock:
+                try:
+                    entry = store.get(key)
+                except TypeError:
+                    # Нехэшируемые аргументы не кэшируются
+                    key = entry = None
+                if entry is not None and ttl is not None and clock() >= entry.expires:
+                    evict(key)
+                    stats["expirations"] += 1
+                    entry = None
+                if entry is not None:
+                    stats["hits"] += 1
+                    return entry.value
+                stats["misses"] += 1
+
+            value = func(*args, **kwargs)
+            if key is None:
+                return value
+            size = _sizeof(value) if maxbytes is not None else 0
+            if maxbytes is not None and size > maxbytes:
+                return value
+
+            with lock:
+                if key in store.data:
+                    evict(key)
+
+                # Место освобождается до вставки, иначе LFU сразу вытеснил бы новую запись
+                while store.data and ((maxsize is not None and len(store.data) >= maxsize)
+                                      or (maxbytes is not None and stats["bytes"] + size > maxbytes)):
+                    evict(store.victim())
+                    stats["evictions"] += 1
+
+                if maxsize is None or maxsize > 0:
+                    store.add(key, _Entry(value, size, clock() + ttl if ttl is not None else 0.0))
+                    stats["bytes"] += size
+
+            return value
+
+        def cache_info() -> CacheInfo:
+            with lock:
+                return CacheInfo(stats["hits"], stats["misses"], stats["evictions"], stats["expirations"],
+                                 len(store.data), stats["bytes"], maxsize, maxbytes)
+
+        def cache_clear() -> None:
+            nonlocal store
+            with lock:
+                store = _LRUStore() if policy == "lru" else _LFUStore()
+                for name in stats:
+                    stats[name] = 0
+
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    if func is not None:
+        return decorator(func)
+
+    return decorator
+
+
+def benchmark_memoize(calls: int = 200_000, distinct: int = 1000, seed: int = 0) -> Dict[str, Dict[str, float]]:
+    """
+    Замер на повторяющейся нагрузке: аргументы выбираются из небольшого
+    набора по закону Ципфа, как в реальных потоках коэффициентов.
+
+    Args:
+        calls: Количество вызовов
+        distinct: Количество различных наборов аргументов
+        seed: Зерно генератора
+
+    Returns:
+        Словарь {вариант: {"time": секунды на вызов, "hit_ratio": доля попаданий}}
+    """
+    import timeit
+
+    from Lab7 import solve_quadratic
+
+    rng = random.Random(seed)
+    coefficients = [(rng.randint(1, 9), rng.randint(-50, 50), rng.randint(-9, 9)) for _ in range(distinct)]
+    weights = [1 / (rank + 1) for rank in range(distinct)]
+    workload = rng.choices(coefficients, weights, k=calls)
+    factorial_workload = rng.choices(range(300, 600), weights[:300], k=calls // 10)
+
+    def fact(n: int) -> int:
+        result = 1
+        for i in range(2, n + 1):
+            result *= i
+        return result
+
+    variants = {
+        "solve_quadratic": (solve_quadratic, workload),
+        "solve_quadratic, lru_cache(256)": (functools.lru_cache(maxsize=256)(solve_quadratic), workload),
+        "solve_quadratic, memoize lru 256": (memoize(maxsize=256)(solve_quadratic), workload),
+        "solve_quadratic, memoize lfu 256": (memoize(maxsize=256, policy="lfu")(solve_quadratic), workload),
+        "fact": (fact, factorial_workload),
+        "fact, memoize lru 64 КБ": (memoize(maxsize=None, maxbytes=64 * 1024)(fact), factorial_workload),
+        "fact, memoize lfu 64 КБ": (memoize(maxsize=None, maxbytes=64 * 1024, policy="lfu")(fact),
+                                    factorial_workload),
+    }
+
+    results = {}
+    for name, (func, args_list) in variants.items():
+        if isinstance(args_list[0], tuple):
+            run = lambda: [func(*args) for args in args_list]
+        else:
+            run = lambda: [func(n) for n in args_list]
+        elapsed = timeit.timeit(run, number=1)
+
+        hit_ratio = 0.0
+        if hasattr(func, "cache_info"):
+            info = func.cache_info()
+            hit_ratio = info.hits / max(1, info.hits + info.misses)
+        results[name] = {"time": elapsed / len(args_list), "hit_ratio": hit_ratio}
+    return results
+
+
+def main():
+    print("Мемоизация на повторяющейся нагрузке")
+    results = benchmark_memoize()
+
+    print(f"{'Вариант':<36} {'Время вызова (мкс)':<20} {'Доля попаданий':<16}")
+    for name, stats in results.items():
+        print(f"{name:<36} {stats['time'] * 1e6:<20.3f} {stats['hit_ratio']:<16.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+import bisect
+import json
+import threading
+from typing import Dict, Sequence
+
+# Границы корзин гистограммы задержек в секундах
+DEFAULT_BUCKETS = (0.00001, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0)
+
+
+def _escape_label(value: str) -> str:
+    """Экранирует значение метки по правилам текстового формата Prometheus."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class FunctionMetrics:
+    """Счётчики и гистограмма задержек одной функции."""
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        self.bucket_counts = [0] * (len(self.buckets) + 1)  # последняя корзина - +Inf
+        self.calls = 0
+        self.exceptions = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.lock = threading.Lock()
+
+    def observe(self, seconds: float, failed: bool) -> None:
+        index = bisect.bisect_left(self.buckets, seconds)
+        with self.lock:
+            self.calls += 1
+            if failed:
+                self.exceptions += 1
+            self.total_seconds += seconds
+            if seconds > self.max_seconds:
+                self.max_seconds = seconds
+            self.bucket_counts[index] += 1
+
+    def snapshot(self) -> Dict:
+        with self.lock:
+            return {
+                "calls": self.calls,
+                "exceptions": self.exceptions,
+                "sum_seconds": self.total_seconds,
+                "max_seconds": self.max_seconds,
+                "buckets": dict(zip([*map(str, self.buckets), "+Inf"], self.bucket_counts)),
+            }
+
+
+class MetricsRegistry:
+    """
+    Потокобезопасный реестр метрик вызовов функций внутри процесса.
+
+    Для каждой функции хранит число вызовов, число исключений
+    и гистограмму длительностей; выгружается в JSON или текстовый формат Prometheus.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS, prefix: str = "lab7"):
+        """
+        Args:
+            buckets: Возрастающие границы корзин гистограммы в секундах
+            prefix: Префикс имён метрик Prometheus
+        """
+        self.buckets = tuple(sorted(buckets))
+        self.prefix = prefix
+        self._functions: Dict[str, FunctionMetrics] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> FunctionMetrics:
+        """Возвращает метрики функции name, создавая их при первом обращении."""
+        metrics = self._functions.get(name)
+        if metrics is None:
+            with self._lock:
+                metrics = self._functions.setdefault(name, FunctionMetrics(self.buckets))
+        return metrics
+
+    def observe(self, name: str, seconds: float, failed: bool = False) -> None:
+        """
+        Регистрирует один вызов функции.
+
+        Args:
+            name: Имя функции
+            seconds: Длительность вызова в секундах
+            failed: Завершился ли вызов исключением
+        """
+        self.get(name).observe(seconds, failed)
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """Возвращает копию всех метрик в виде словаря."""
+        with self._lock:
+            items = list(self._functions.items())
+        return {name: metrics.snapshot() for name, metrics in sorted(items)}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._functions.clear()
+
+    def to_json(self, **kwargs) -> str:
+        """Выгружает метрики в JSON."""
+        return json.dumps(self.snapshot(), ensure_ascii=False, **kwargs)
+
+    def to_prometheus(self) -> str:
+        """Выгружает метрики в текстовом формате экспозиции Prometheus."""
+        calls = f"{self.prefix}_function_calls_total"
+        errors = f"{self.prefix}_function_exceptions_total"
+        duration = f"{self.prefix}_function_duration_seconds"
+        snapshot = {_escape_label(name): m for name, m in self.snapshot().items()}
+
+        lines = [
+            f"# HELP {calls} Количество вызовов функции.",
+            f"# TYPE {calls} counter",
+        ]
+        lines += [f'{calls}{{function="{name}"}} {m["calls"]}' for name, m in snapshot.items()]
+        lines += [
+            f"# HELP {errors} Количество вызовов, завершившихся исключением.",
+            f"# TYPE {errors} counter",
+        ]
+        lines += [f'{errors}{{function="{name}"}} {m["exceptions"]}' for name, m in snapshot.items()]
+        lines += [
+            f"# HELP {duration} Длительность вызова функции.",
+            f"# TYPE {duration} histogram",
+        ]
+        for name, m in snapshot.items():
+            cumulative = 0
+            for bound, count in m["buckets"].items():
+                cumulative += count
+                lines.append(f'{duration}_bucket{{function="{name}",le="{bound}"}} {cumulative}')
+            lines.append(f'{duration}_sum{{function="{name}"}} {m["sum_seconds"]!r}')
+            lines.append(f'{duration}_count{{function="{name}"}} {m["calls"]}')
+
+        return "\n".join(lines) + "\n"
+
+
+# Общий реестр, в который пишут декорированные функции Lab7
+REGISTRY = MetricsRegistry()
@@ -0,0 +1,332 @@
+import cProfile
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# Запись свёрнутых стеков: кадры от внешнего к внутреннему через ';', затем вес - число
+# выборок или микросекунды. Такие файлы читают flamegraph.pl, speedscope и inferno
+_PROFILER_FRAMES = ("<method 'disable' of '_lsprof.Profiler' objects>",)
+
+
+def _label(filename: str, lineno: int, name: str) -> str:
+    if filename == "~":
+        return name
+    return f"{name} ({os.path.basename(filename)}:{lineno})"
+
+
+def write_collapsed(stacks: Dict[str, int], filename: str) -> None:
+    """
+    Записывает свёрнутые стеки в файл, по строке 'кадр1;кадр2;... вес' на стек.
+
+    Args:
+        stacks: Словарь {стек: вес}
+        filename: Имя файла
+    """
+    with open(filename, "w", encoding="utf-8") as f:
+        for stack, weight in sorted(stacks.items()):
+            if weight > 0:
+                f.write(f"{stack} {weight}\n")
+
+
+class StackSampler:
+    """
+    Выборочный профилировщик: фоновый поток через равные интервалы снимает стек
+    профилируемого потока (sys._current_frames) и считает одинаковые стеки.
+
+    Профилируются только вызовы через runcall, начиная с вызванной функции. Выборки
+    делаются только во время внешнего runcall: фоновый поток создаётся первым вызовом,
+    а между вызовами спит на событии, не просыпаясь по интервалу, и интервал
+    переключения потоков (sys.setswitchinterval) уменьшен тоже только на время вызова.
+    Поэтому профилировщик можно оставить в logger(profiler=...) без вызова stop.
+    Накладные расходы почти не зависят от числа вызовов функций, но короткие функции
+    видны только статистически - их нужно вызывать многократно.
+    """
+
+    def __init__(self, interval: float = 0.001):
+        """
+        Args:
+            interval: Интервал между выборками в секундах
+
+        Raises:
+            ValueError: Если интервал не положителен
+        """
+        if interval <= 0:
+            raise ValueError("Интервал выборки должен быть положительным")
+        self.interval = interval
+        self.samples = 0
+        self._stacks: Counter = Counter()
+        self._thread_id: Optional[int] = None
+        self._thread: Optional[threading.Thread] = None
+        self._active = threading.Event()
+        self._stopped = threading.Event()
+        self._switch_interval = 0.0
+        self._depth = 0
+        self._base = None
+
+    def runcall(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Вызывает func(*args, **kwargs) под профилировщиком и возвращает её результат.
+
+        Вложенные вызовы (например, рекурсия декорированной функции) учитываются
+        в стеке внешнего. Вызовы из других потоков выполняются без профилирования.
+        """
+        if self._thread is None:
+            self._start()
+        elif threading.get_ident() != self._thread_id:
+            return func(*args, **kwargs)
+        if self._depth == 0:
+            self._base = sys._getframe()
+            # Поток выборки получает GIL не раньше, чем профилируемый поток его отдаст
+            self._switch_interval = sys.getswitchinterval()
+            sys.setswitchinterval(min(self._switch_interval, self.interval))
+            self._active.set()
+        self._depth += 1
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self._depth -= 1
+            if self._depth == 0:
+                self._active.clear()
+                sys.setswitchinterval(self._switch_interval)
+
+    def _start(self) -> None:
+        self._thread_id = threading.get_ident()
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="StackSampler", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            self._active.wait()
+            if self._stopped.wait(self.interval):
+                return
+            if self._depth == 0:
+                continue
+            frame = sys._current_frames().get(self._thread_id)
+            base = self._base
+            labels = []
+            while frame is not None and frame is not base:
+                code = frame.f_code
+                labels.append(_label(code.co_filename, code.co_firstlineno, code.co_name))
+                frame = frame.f_back
+            if frame is None or not labels:
+                continue
+            self._stacks[";".join(reversed(labels))] += 1
+            self.samples += 1
+
+    def stop(self) -> None:
+        """Останавливает фоновый поток; следующий runcall запустит его снова."""
+        if self._thread is not None:
+            self._stopped.set()
+            self._active.set()
+            self._thread.join()
+            self._thread = None
+            if self._depth == 0:
+                self._active.clear()
+
+    def __enter__(self) -> "StackSampler":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def collapsed(self) -> Dict[str, int]:
+        """Свёрнутые стеки {стек: число выборок}."""
+        return dict(self._stacks)
+
+    def write(self, filename: str) -> None:
+        """Записывает свёрнутые стеки в файл (см. write_collapsed)."""
+        write_collapsed(self.collapsed(), filename)
+
+
+class CallProfiler:
+    """
+    Детерминированный профилировщик на cProfile с выгрузкой в свёрнутые стеки.
+
+    cProfile хранит не полные стеки, а время функций и рёбра вызовов между ними,
+    поэтому collapsed восстанавливает стеки приближённо: время функции делится между
+    вызвавшими её функциями пропорционально времени по каждому ребру (как у flameprof).
+    Точные числа по функциям сохраняет dump в формате pstats. Накладные расходы растут
+    с числом вызовов функций Python и для мелких функций превышают их собственное время.
+    """
+
+    def __init__(self):
+        self._profile = cProfile.Profile()
+        self._thread_id: Optional[int] = None
+        self._depth = 0
+        self._calls = 0
+
+    def runcall(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Вызывает func(*args, **kwargs) под профилировщиком и возвращает её результат.
+
+        Вложенные вызовы не включают профилировщик повторно. cProfile видит только
+        поток, в котором включён, поэтому вызовы из других потоков выполняются без профилирования.
+        """
+        if self._thread_id is None:
+            self._thread_id = threading.get_ident()
+        elif threading.get_ident() != self._thread_id:
+            return func(*args, **kwargs)
+        if self._depth > 0:
+            return func(*args, **kwargs)
+        self._depth = 1
+        self._calls += 1
+        self._profile.enable()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self._profile.disable()
+            self._depth = 0
+
+    def stop(self) -> None:
+        """Для совместимости со StackSampler: cProfile выключается после каждого runcall."""
+
+    def __enter__(self) -> "CallProfiler":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def stats(self) -> Optional[pstats.Stats]:
+        """Статистика pstats или None, если ни одного вызова не было."""
+        if not self._calls:
+            return None
+        return pstats.Stats(self._profile)
+
+    def dump(self, filename: str) -> None:
+        """Сохраняет статистику в формате pstats (snakeviz, gprof2dot, pstats.Stats(filename))."""
+        self._profile.dump_stats(filename)
+
+    def collapsed(self, min_weight: int = 1) -> Dict[str, int]:
+        """
+        Приближённые свёрнутые стеки {стек: собственное время в микросекундах}.
+
+        Args:
+            min_weight: Ветви легче стольких микросекунд не раскрываются
+        """
+        stats = self.stats()
+        return stats_to_collapsed(stats, min_weight) if stats is not None else {}
+
+    def write(self, filename: str) -> None:
+        """Записывает свёрнутые стеки в файл (см. write_collapsed)."""
+        write_collapsed(self.collapsed(), filename)
+
+
+def stats_to_collapsed(stats: pstats.Stats, min_weight: int = 1) -> Dict[str, int]:
+    """
+    Строит свёрнутые стеки по графу вызовов pstats.
+
+    Обход идёт от функций без вызывающих; на каждом шаге время ребра масштабируется
+    долей, которую путь составляет от полного времени функции. Рекурсивные рёбра не
+    раскрываются - их время уже входит во время внешнего вызова.
+
+    Args:
+        stats: Статистика cProfile
+        min_weight: Ветви легче стольких микросекунд не раскрываются
+
+    Returns:
+        Словарь {стек: собственное время в микросекундах}
+    """
+    table = stats.stats
+    children: Dict[Tuple, list] = defaultdict(list)
+    roots = []
+    for func, (_, _, _, _, callers) in table.items():
+        if func[2] in _PROFILER_FRAMES:
+            continue
+        callers = {caller: edge for caller, edge in callers.items() if caller != func}
+        if not callers:
+            roots.append(func)
+        for caller, edge in callers.items():
+            children[caller].append((func, edge[3]))
+
+    result: Counter = Counter()
+
+    def walk(func: Tuple, weight: float, path: Tuple[str, ...], seen: frozenset) -> None:
+        total = table[func][3]
+        share = weight / total if total > 0 else 0.0
+        result[";".join(path)] += table[func][2] * share * 1e6
+        for child, edge in children.get(func, ()):
+            child_weight = edge * share
+            if child in seen or child_weight * 1e6 < min_weight:
+                continue
+            walk(child, child_weight, path + (_label(*child),), seen | {child})
+
+    for root in roots:
+        walk(root, table[root][3], (_label(*root),), frozenset((root,)))
+    return {stack: round(weight) for stack, weight in result.items() if round(weight) > 0}
+
+
+PROFILERS = {"sample": StackSampler, "cprofile": CallProfiler}
+
+
+def make_profiler(kind: str = "sample"):
+    """
+    Создаёт профилировщик по имени: 'sample' - StackSampler, 'cprofile' - CallProfiler.
+
+    Raises:
+        ValueError: Если имя неизвестно
+    """
+    if kind not in PROFILERS:
+        raise ValueError(f"Неизвестный профилировщик: {kind}. Используйте один из {tuple(PROFILERS)}.")
+    return PROFILERS[kind]()
+
+
+def profile_for(func: Callable[[], object], profiler, seconds: float = 1.0, min_calls: int = 1) -> int:
+    """
+    Многократно вызывает func под профилировщиком в течение seconds секунд.
+
+    Args:
+        func: Функция без аргументов
+        profiler: StackSampler или CallProfiler
+        seconds: Длительность профилирования
+        min_calls: Минимальное число вызовов
+
+    Returns:
+        Число вызовов
+    """
+    calls = 0
+    deadline = time.perf_counter() + seconds
+    while calls < min_calls or time.perf_counter() < deadline:
+        profiler.runcall(func)
+        calls += 1
+    profiler.stop()
+    return calls
+
+
+def benchmark_overhead(calls: int = 20000) -> Dict[str, float]:
+    """
+    Сравнивает время вызовов функции, декорированной logger, без профилировщика и под ним.
+
+    Returns:
+        Словарь {вариант: среднее время вызова в секундах}
+    """
+    from Lab7 import logger
+
+    def target(a, b):
+        return sum(range(a)) * b
+
+    results = {}
+    for name in ("без профилировщика", *PROFILERS):
+        profiler = make_profiler(name) if name in PROFILERS else None
+        decorated = logger(handle=None, profiler=profiler)(target)
+        start = time.perf_counter()
+        for i in range(calls):
+            decorated(50, i)
+        results[name] = (time.perf_counter() - start) / calls
+        if profiler is not None:
+            profiler.stop()
+    return results
+
+
+def main():
+    print("Вызов функции с logger(handle=None) под профилировщиками (среднее время)")
+    for name, seconds in benchmark_overhead().items():
+        print(f"{name:<20} {seconds * 1e6:>10.2f} мкс")
+
+
+if __name__ == "__main__":
+    main()
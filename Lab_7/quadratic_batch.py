@@ -0,0 +1,188 @@
+import time
+
+import numpy as np
+
+from Lab7 import (QUADRATIC_METHODS, STATUS_COMPLEX_ROOTS, STATUS_INFINITE, STATUS_LINEAR,
+                  STATUS_NO_REAL_ROOTS, STATUS_NO_SOLUTION, STATUS_ONE_ROOT, STATUS_TWO_ROOTS, solve_quadratic)
+
+ROOTS_DTYPE = np.dtype([
+    ("x1", np.float64),
+    ("x2", np.float64),
+    ("n_roots", np.int8),   # -1 - бесконечно много решений
+    ("status", np.int8),
+])
+
+COMPLEX_ROOTS_DTYPE = np.dtype([
+    ("x1", np.complex128),
+    ("x2", np.complex128),
+    ("n_roots", np.int8),
+    ("status", np.int8),
+])
+
+
+# Целый дискриминант считается в int64, если оценка b^2 + 4|ac| во float64 меньше этого
+# порога; запас в 2 раза до 2^63 покрывает погрешность оценки
+_INT64_SAFE = float(2 ** 62)
+
+
+def _integer_discriminant(a: np.ndarray, b: np.ndarray, c: np.ndarray) -> np.ndarray:
+    """
+    Точный дискриминант b^2 - 4ac целых коэффициентов, как у solve_quadratic с int.
+
+    Если результат мог не поместиться в int64, он считается на целых Python (dtype=object).
+    """
+    with np.errstate(over="ignore", invalid="ignore"):
+        fa, fb, fc = (x.astype(np.float64) for x in (a, b, c))
+        safe = bool(np.all(fb * fb + 4 * np.abs(fa * fc) < _INT64_SAFE))
+    if safe:
+        a, b, c = (x.astype(np.int64) for x in (a, b, c))
+    else:
+        a, b, c = (x.astype(object) for x in (a, b, c))
+    return b * b - 4 * a * c
+
+
+def _complex(real: np.ndarray, imag: np.ndarray) -> np.ndarray:
+    """Собирает комплексный массив, как complex(real, imag), без умножения на 1j."""
+    out = np.empty(real.shape, dtype=np.complex128)
+    out.real = real
+    out.imag = imag
+    return out
+
+
+def solve_quadratic_batch(a, b, c, method: str = "classic", complex_roots: bool = False) -> np.ndarray:
+    """
+    Решает массив квадратных уравнений ax^2 + bx + c = 0 без цикла на Python.
+
+    Ветви solve_quadratic заменены масками, а корни вычисляются по тем же
+    формулам, поэтому строки совпадают со скалярной функцией. Для целых
+    коэффициентов дискриминант, как и в solve_quadratic, вычисляется точно.
+
+    Args:
+        a, b, c: Массивы коэффициентов (или скаляры) совместимой формы
+        method: 'classic' или 'stable' (см. solve_quadratic_roots)
+        complex_roots: Вычислять комплексные корни при D < 0 (поля x1, x2 типа complex128)
+
+    Returns:
+        Структурированный массив ROOTS_DTYPE или COMPLEX_ROOTS_DTYPE; отсутствующие корни равны NaN
+
+    Raises:
+        TypeError: Если коэффициенты не действительные числа: строки, комплексные числа
+            (как и в solve_quadratic) или массив dtype=object. В отличие от solve_quadratic,
+            целые вне диапазона int64 тоже отклоняются - NumPy хранит их как object
+        ValueError: Если передан неподдерживаемый метод
+    """
+    if method not in QUADRATIC_METHODS:
+        raise ValueError(f"Неподдерживаемый метод: {method}. Используйте 'classic' или 'stable'.")
+    arrays = [np.asarray(x) for x in (a, b, c)]
+    # Комплексные коэффициенты astype(float64) молча обрезал бы до действительной части,
+    # а dtype=object (строки, целые вне int64) не проверить без цикла на Python
+    if not all((np.issubdtype(x.dtype, np.number) and not np.issubdtype(x.dtype, np.complexfloating))
+               or x.dtype == np.bool_ for x in arrays):
+        raise TypeError("Все коэффициенты должны быть числами")
+    # Как и solve_quadratic с int, для целых коэффициентов знак дискриминанта определяется
+    # точно: во float64 b^2 и 4ac могут округлиться к одному числу
+    exact = np.broadcast_arrays(*arrays) if all(x.dtype.kind in "iub" for x in arrays) else None
+    a, b, c = np.broadcast_arrays(*(x.astype(np.float64, copy=False) for x in arrays))
+
+    out = np.empty(a.shape, dtype=COMPLEX_ROOTS_DTYPE if complex_roots else ROOTS_DTYPE)
+    out["x1"] = np.nan
+    out["x2"] = np.nan
+
+    linear_or_degenerate = a == 0
+    degenerate = linear_or_degenerate & (b == 0)
+    infinite = degenerate & (c == 0)
+    linear = linear_or_degenerate & ~degenerate
+    quadratic = ~linear_or_degenerate
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        if exact is not None:
+            exact_discriminant = _integer_discriminant(*exact)
+            negative = quadratic & (exact_discriminant < 0)
+            one = quadratic & (exact_discriminant == 0)
+            discriminant = exact_discriminant.astype(np.float64)
+        else:
+            discriminant = b ** 2 - 4 * a * c
+            negative = quadratic & (discriminant < 0)
+            one = quadratic & (discriminant == 0)
+        two = quadratic & ~negative & ~one
+
+        sqrt_d = np.sqrt(np.where(two, discriminant, 0.0))
+        denominator = 2 * a
+
+        if method == "classic":
+            x1 = (-b + sqrt_d) / denominator
+            x2 = (-b - sqrt_d) / denominator
+        else:
+            q = -(b + np.copysign(sqrt_d, b)) / 2
+            positive_b = np.signbit(b) == 0
+            x1 = np.where(positive_b, c / q, q / a)
+            x2 = np.where(positive_b, q / a, c / q)
+
+        out["x1"][two] = x1[two]
+        out["x2"][two] = x2[two]
+        out["x1"][one] = (-b / denominator)[one]
+        out["x1"][linear] = (-c / b)[linear]
+
+        if complex_roots:
+            real = -b / denominator
+            imag = np.sqrt(np.where(negative, -discriminant, 0.0)) / denominator
+            out["x1"][negative] = _complex(real, imag)[negative]
+            out["x2"][negative] = _complex(real, -imag)[negative]
+
+    out["status"] = STATUS_NO_SOLUTION
+    out["status"][infinite] = STATUS_INFINITE
+    out["status"][linear] = STATUS_LINEAR
+    out["status"][negative] = STATUS_COMPLEX_ROOTS if complex_roots else STATUS_NO_REAL_ROOTS
+    out["status"][one] = STATUS_ONE_ROOT
+    out["status"][two] = STATUS_TWO_ROOTS
+
+    out["n_roots"] = 0
+    out["n_roots"][infinite] = -1
+    out["n_roots"][linear | one] = 1
+    out["n_roots"][two] = 2
+    if complex_roots:
+        out["n_roots"][negative] = 2
+
+    return out
+
+
+def benchmark_batch(size: int = 1_000_000, seed: int = 0) -> dict:
+    """
+    Сравнивает пропускную способность solve_quadratic и solve_quadratic_batch.
+
+    Args:
+        size: Количество уравнений
+        seed: Зерно генератора коэффициентов
+
+    Returns:
+        Словарь {вариант: уравнений в секунду}
+    """
+    rng = np.random.default_rng(seed)
+    a, b, c = (rng.uniform(-10, 10, size) for _ in range(3))
+
+    start = time.perf_counter()
+    for x, y, z in zip(a.tolist(), b.tolist(), c.tolist()):
+        solve_quadratic(x, y, z)
+    scalar = time.perf_counter() - start
+
+    results = {"solve_quadratic": size / scalar}
+    for name, options in [("batch, classic", {}),
+                          ("batch, stable", {"method": "stable"}),
+                          ("batch, stable + complex", {"method": "stable", "complex_roots": True})]:
+        start = time.perf_counter()
+        solve_quadratic_batch(a, b, c, **options)
+        results[name] = size / (time.perf_counter() - start)
+    return results
+
+
+def main():
+    print("Пропускная способность решения квадратных уравнений")
+    results = benchmark_batch()
+
+    print(f"{'Вариант':<24} {'Уравнений/с':<16}")
+    for name, throughput in results.items():
+        print(f"{name:<24} {throughput:<16.0f}")
+
+
+if __name__ == "__main__":
+    main()
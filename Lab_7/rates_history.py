@@ -0,0 +1,457 @@
+import bisect
+import codecs
+import datetime
+import glob
+import json
+import math
+import mmap
+import os
+import random
+import re
+import struct
+import tempfile
+import time
+import tracemalloc
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import requests
+
+CHUNK_SIZE = 64 * 1024
+
+# Один токен JSON после пробелов: 1 - знак пунктуации, 2 - строка, 3 - число, 4 - литерал
+_TOKEN = re.compile(r'[ \t\n\r]*(?:([{}\[\],:])|"((?:[^"\\]|\\.)*)"|([-+0-9.eE]+)|(true|false|null))', re.DOTALL)
+_NUMBER = re.compile(r"-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?")
+_LITERALS = {"true": ("boolean", True), "false": ("boolean", False), "null": ("null", None)}
+_PUNCTUATION, _STRING, _NUMBER_TOKEN = 1, 2, 3
+
+
+def _iter_tokens(chunks: Iterable[bytes]) -> Iterator[Tuple[int, str]]:
+    """
+    Разбивает поток байтов на токены JSON.
+
+    Токен, который упирается в конец прочитанных данных, откладывается
+    до следующего фрагмента: он может продолжаться за границей фрагмента.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    chunks = iter(chunks)
+    buffer = ""
+    pos = 0
+    eof = False
+
+    while True:
+        match = _TOKEN.match(buffer, pos)
+        if match is None or (not eof and match.end() == len(buffer) and match.lastindex != _PUNCTUATION):
+            if eof:
+                if buffer[pos:].strip(" \t\n\r"):
+                    raise ValueError(f"Некорректный JSON: {buffer[pos:pos + 20]!r}")
+                return
+            chunk = next(chunks, None)
+            if chunk is None:
+                text = decoder.decode(b"", final=True)
+                eof = True
+            else:
+                text = decoder.decode(chunk)
+            buffer = buffer[pos:] + text
+            pos = 0
+            continue
+        pos = match.end()
+        yield match.lastindex, match.group(match.lastindex)
+
+
+def _decode_string(raw: str) -> str:
+    return json.loads(f'"{raw}"') if "\\" in raw else raw
+
+
+def iter_json_events(chunks: Iterable[bytes]) -> Iterator[Tuple[str, str, Any]]:
+    """
+    Потоковый разбор JSON без загрузки документа в память (в стиле ijson).
+
+    Args:
+        chunks: Фрагменты документа в кодировке UTF-8 произвольной длины
+
+    Yields:
+        Тройки (prefix, event, value), где prefix - путь вида "Valute.USD.Value"
+        (элементы массивов обозначаются "item"), event - одно из start_map, map_key,
+        end_map, start_array, end_array, string, number, boolean, null
+
+    Raises:
+        ValueError: Если документ не является корректным JSON
+    """
+    # Стек открытых контейнеров: (тип, префикс контейнера)
+    stack: List[Tuple[str, str]] = []
+    prefix = ""
+    expect = "value"
+
+    for kind, text in _iter_tokens(chunks):
+        if expect == "colon":
+            if text != ":" or kind != _PUNCTUATION:
+                raise ValueError(f"Ожидалось ':', получено {text!r}")
+            expect = "value"
+            continue
+
+        if expect in ("key", "key_or_end"):
+            if kind == _STRING:
+                key = _decode_string(text)
+                parent = stack[-1][1]
+                yield parent, "map_key", key
+                prefix = f"{parent}.{key}" if parent else key
+                expect = "colon"
+                continue
+            if expect != "key_or_end" or text != "}" or kind != _PUNCTUATION:
+                raise ValueError(f"Ожидался ключ, получено {text!r}")
+
+        elif expect == "comma_or_end":
+            if kind == _PUNCTUATION and text == ",":
+                container, parent = stack[-1]
+                if container == "map":
+                    expect = "key"
+                else:
+                    prefix = f"{parent}.item" if parent else "item"
+                    expect = "value"
+                continue
+            if kind != _PUNCTUATION or text != ("}" if stack[-1][0] == "map" else "]"):
+                raise ValueError(f"Ожидалось ',' или конец контейнера, получено {text!r}")
+
+        elif expect == "done":
+            raise ValueError(f"Лишние данные после конца документа: {text!r}")
+
+        if kind == _PUNCTUATION:
+            if text == "{" and expect != "key_or_end" and expect != "comma_or_end":
+                yield prefix, "start_map", None
+                stack.append(("map", prefix))
+                expect = "key_or_end"
+                continue
+            if text == "[" and expect != "key_or_end" and expect != "comma_or_end":
+                yield prefix, "start_array", None
+                stack.append(("array", prefix))
+                prefix = f"{prefix}.item" if prefix else "item"
+                expect = "value_or_end"
+                continue
+            if (text == "}" and expect in ("key_or_end", "comma_or_end")) or \
+                    (text == "]" and expect in ("value_or_end", "comma_or_end")):
+                container, prefix = stack.pop()
+                yield prefix, "end_map" if container == "map" else "end_array", None
+            else:
+                raise ValueError(f"Неожиданный символ {text!r}")
+        elif kind == _STRING:
+            yield prefix, "string", _decode_string(text)
+        elif kind == _NUMBER_TOKEN:
+            if _NUMBER.fullmatch(text) is None:
+                raise ValueError(f"Некорректное число {text!r}")
+            number = float(text) if "." in text or "e" in text or "E" in text else int(text)
+            yield prefix, "number", number
+        else:
+            event, value = _LITERALS[text]
+            yield prefix, event, value
+        expect = "comma_or_end" if stack else "done"
+
+    if expect != "done":
+        raise ValueError("Документ обрывается до конца")
+
+
+def extract_rates(chunks: Iterable[bytes], currency_codes: Sequence[str]) -> Tuple[Optional[datetime.date], Dict[str, float]]:
+    """
+    Извлекает из документа формата daily_json.js дату и курсы только запрошенных валют.
+
+    Разбор прекращается, как только найдены дата и все запрошенные валюты.
+
+    Args:
+        chunks: Фрагменты документа
+        currency_codes: Коды нужных валют
+
+    Returns:
+        Пара (дата котировок или None, {код: курс}); отсутствующие валюты пропускаются
+    """
+    wanted = {f"Valute.{code}.Value": code for code in currency_codes}
+    date = None
+    rates: Dict[str, float] = {}
+
+    for prefix, event, value in iter_json_events(chunks):
+        if prefix == "Date" and event == "string":
+            date = datetime.date.fromisoformat(value[:10])
+        elif event == "number" and prefix in wanted:
+            rates[wanted[prefix]] = float(value)
+        else:
+            continue
+        if date is not None and len(rates) == len(wanted):
+            break
+
+    return date, rates
+
+
+def iter_file_chunks(path: str, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+
+def iter_url_chunks(url: str, session: Optional[requests.Session] = None, timeout: float = 5,
+                    chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    http = session if session is not None else requests
+    try:
+        with http.get(url, timeout=timeout, stream=True) as response:
+            response.raise_for_status()
+            yield from response.iter_content(chunk_size)
+    except requests.RequestException as e:
+        raise ConnectionError(f"API недоступен: {e}")
+
+
+class RatesStore:
+    """
+    Колоночное хранилище курсов: массив дат и по одному array('d') на валюту.
+
+    Пропуски заполняются NaN. Сохраняется в файл, который MappedRates
+    открывает через mmap без чтения в память.
+    """
+
+    MAGIC = b"CBRR"
+
+    def __init__(self, currency_codes: Sequence[str]):
+        self.codes = list(currency_codes)
+        self._rows: Dict[int, int] = {}
+        self.dates = array("q")
+        self.columns = {code: array("d") for code in self.codes}
+
+    def add(self, date: datetime.date, rates: Dict[str, float]) -> None:
+        """Добавляет (или заменяет) снимок курсов на дату."""
+        ordinal = date.toordinal()
+        row = self._rows.get(ordinal)
+        if row is None:
+            row = self._rows[ordinal] = len(self.dates)
+            self.dates.append(ordinal)
+            for column in self.columns.values():
+                column.append(math.nan)
+        for code, value in rates.items():
+            if code in self.columns:
+                self.columns[code][row] = value
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def save(self, path: str) -> None:
+        """
+        Сохраняет хранилище, упорядочив строки по дате.
+
+        Формат: MAGIC, длина JSON-заголовка (uint32), заголовок с кодами валют,
+        выравнивание до 8 байт, затем даты (int64, порядковые номера) и колонки (float64).
+        """
+        order = sorted(range(len(self.dates)), key=self.dates.__getitem__)
+        header = json.dumps({"codes": self.codes, "rows": len(order)}).encode("utf-8")
+        offset = len(self.MAGIC) + 4 + len(header)
+        padding = b"\0" * (-offset % 8)
+
+        with open(path, "wb") as f:
+            f.write(self.MAGIC)
+            f.write(struct.pack("<I", len(header)))
+            f.write(header)
+            f.write(padding)
+            array("q", (self.dates[i] for i in order)).tofile(f)
+            for code in self.codes:
+                column = self.columns[code]
+                array("d", (column[i] for i in order)).tofile(f)
+
+
+class MappedRates:
+    """Хранилище курсов, отображённое в память; запросы по диапазону дат через бинарный поиск."""
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: Файл, сохранённый RatesStore.save
+
+        Raises:
+            ValueError: Если файл пустой, не является файлом RatesStore или обрезан
+        """
+        self._mmap: Optional[mmap.mmap] = None
+        self._columns: Optional[Dict[str, memoryview]] = None
+        self._file = open(path, "rb")
+        try:
+            self._map(path)
+        except BaseException:
+            self.close()
+            raise
+
+    def _map(self, path: str) -> None:
+        size = os.fstat(self._file.fileno()).st_size
+        # mmap не отображает пустой файл, а заголовок занимает не меньше 8 байт
+        if size < 8:
+            raise ValueError(f"{path} не является файлом RatesStore")
+        self._mmap = data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if data[:4] != RatesStore.MAGIC:
+            raise ValueError(f"{path} не является файлом RatesStore")
+        header_length = struct.unpack_from("<I", data, 4)[0]
+        header = json.loads(data[8:8 + header_length])
+        offset = 8 + header_length
+        offset += -offset % 8
+
+        codes: List[str] = header["codes"]
+        rows = header["rows"]
+        if offset + 8 * rows * (1 + len(codes)) > size:
+            raise ValueError(f"{path} обрезан: данных меньше, чем указано в заголовке")
+        self.codes = codes
+        # Срезы-колонки держат отображение сами, общий view можно сразу освободить
+        with memoryview(data) as view:
+            self.dates = view[offset:offset + 8 * rows].cast("q")
+            offset += 8 * rows
+            self._columns = {}
+            for code in codes:
+                self._columns[code] = view[offset:offset + 8 * rows].cast("d")
+                offset += 8 * rows
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def column(self, code: str) -> memoryview:
+        """Колонка курсов валюты без копирования."""
+        return self._columns[code]
+
+    def query(self, code: str, start: datetime.date, end: datetime.date) -> List[Tuple[datetime.date, float]]:
+        """
+        Возвращает курсы валюты за период [start, end], пропуская отсутствующие значения.
+
+        Raises:
+            KeyError: Если валюта отсутствует в хранилище
+        """
+        if code not in self._columns:
+            raise KeyError(f"Валюта {code} отсутствует в хранилище")
+        lo = bisect.bisect_left(self.dates, start.toordinal())
+        hi = bisect.bisect_right(self.dates, end.toordinal())
+        column = self._columns[code]
+        return [(datetime.date.fromordinal(self.dates[i]), column[i])
+                for i in range(lo, hi) if not math.isnan(column[i])]
+
+    def close(self) -> None:
+        if self._columns is not None:
+            for column in self._columns.values():
+                column.release()
+            self.dates.release()
+            self._columns = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+    def __enter__(self) -> "MappedRates":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def load_history(sources: Iterable[str], currency_codes: Sequence[str],
+                 store: Optional[RatesStore] = None, session: Optional[requests.Session] = None) -> RatesStore:
+    """
+    Загружает ежедневные снимки ЦБ РФ из файлов и/или URL в колоночное хранилище.
+
+    Args:
+        sources: Пути к файлам или URL (http/https)
+        currency_codes: Коды валют, которые нужно сохранить
+        store: Хранилище для дозагрузки; по умолчанию создаётся новое
+        session: Сессия для загрузки по URL
+
+    Returns:
+        Заполненное хранилище
+
+    Raises:
+        ValueError: Если в документе нет даты или он некорректен
+    """
+    if store is None:
+        store = RatesStore(currency_codes)
+
+    for source in sources:
+        if source.startswith(("http://", "https://")):
+            chunks = iter_url_chunks(source, session=session)
+        else:
+            chunks = iter_file_chunks(source)
+        date, rates = extract_rates(chunks, currency_codes)
+        if date is None:
+            raise ValueError(f"В документе {source} отсутствует ключ 'Date'")
+        store.add(date, rates)
+
+    return store
+
+
+def load_history_dir(directory: str, currency_codes: Sequence[str], pattern: str = "*.json") -> RatesStore:
+    """Загружает все снимки из каталога (см. load_history)."""
+    return load_history(sorted(glob.glob(os.path.join(directory, pattern))), currency_codes)
+
+
+def _write_snapshots(directory: str, days: int, codes: Sequence[str], seed: int = 0) -> List[str]:
+    from cbr_stub import make_payload
+
+    rng = random.Random(seed)
+    start = datetime.date(2016, 1, 1)
+    paths = []
+    for day in range(days):
+        date = start + datetime.timedelta(days=day)
+        payload = make_payload({code: round(rng.uniform(1, 150), 4) for code in codes},
+                               date=f"{date.isoformat()}T11:30:00+03:00")
+        path = os.path.join(directory, f"{date.isoformat()}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, indent=1)
+        paths.append(path)
+    return paths
+
+
+def main():
+    from cbr_stub import make_payload
+
+    print("Загрузка истории курсов ЦБ РФ")
+    codes = [f"C{i:02d}" for i in range(40)]
+    wanted = ["C01", "C17", "C33"]
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = _write_snapshots(directory, 3650, codes)
+
+        start = time.perf_counter()
+        for path in paths:
+            with open(path, encoding="utf-8") as f:
+                document = json.load(f)
+            {code: document["Valute"][code]["Value"] for code in wanted}
+        full = time.perf_counter() - start
+
+        start = time.perf_counter()
+        store = load_history(paths, wanted)
+        streaming = time.perf_counter() - start
+
+        store_path = os.path.join(directory, "rates.bin")
+        store.save(store_path)
+        with MappedRates(store_path) as rates:
+            first, last = datetime.date(2018, 1, 1), datetime.date(2018, 12, 31)
+            start = time.perf_counter()
+            for _ in range(1000):
+                rates.query("C17", first, last)
+            query = (time.perf_counter() - start) / 1000
+
+    print(f"Снимков: {len(paths)}, валют в снимке: {len(codes)}, извлекается: {len(wanted)}")
+    print(f"json.load целиком:      {full:.3f} с")
+    print(f"Потоковый разбор:       {streaming:.3f} с")
+    print(f"Запрос за год (mmap):   {query * 1e6:.1f} мкс")
+
+    print("\nПиковая память на документе с 100 000 валют")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "huge.json")
+        payload = make_payload({f"X{i:05d}": float(i) for i in range(100_000)}, date="2024-01-01T11:30:00+03:00")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(payload, f)
+        del payload
+
+        def load_full():
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+
+        for name, load in [("json.load", load_full),
+                           ("extract_rates", lambda: extract_rates(iter_file_chunks(path), ["X99999"]))]:
+            tracemalloc.start()
+            load()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"{name:<22}  {peak / 1024 / 1024:.1f} МБ")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+import heapq
+import io
+import itertools
+import threading
+import time
+from collections import deque
+from typing import Deque, List, Tuple
+
+
+class _ThreadBuffer:
+    """Буфер записей одного потока: (порядковый номер, строка, размер) и их общий размер."""
+
+    __slots__ = ("thread", "entries", "size", "dropped", "lock")
+
+    def __init__(self, thread: threading.Thread):
+        self.thread = thread
+        self.entries: Deque[Tuple[int, str, int]] = deque()
+        self.size = 0
+        self.dropped = 0
+        # Берут только поток-владелец и читатели, поэтому при записи блокировка почти всегда свободна
+        self.lock = threading.Lock()
+
+
+class RingBufferSink:
+    """
+    Кольцевой буфер логов в памяти для logger(handle=...).
+
+    Каждый поток пишет в собственный буфер под собственной блокировкой, без общих
+    блокировок, поэтому потоки не мешают друг другу. Буфер потока сам не превышает
+    capacity байт; общий объём приводится к capacity при чтении (snapshot, drain,
+    size) и при появлении нового потока: удаляются самые старые строки по глобальным
+    номерам записей, из какого бы потока они ни были.
+
+    Цена отсутствия общей блокировки: между чтениями буферы занимают до capacity
+    байт на каждый пишущий поток, а не capacity на все вместе. Если нужен строгий
+    общий предел, буфер нужно читать (например, size) или использовать один общий
+    буфер под блокировкой.
+    """
+
+    def __init__(self, capacity: int = 64 * 1024):
+        """
+        Args:
+            capacity: Общая ёмкость буфера в байтах UTF-8
+
+        Raises:
+            ValueError: Если ёмкость не положительна
+        """
+        if capacity <= 0:
+            raise ValueError("Ёмкость буфера должна быть положительной")
+        self.capacity = capacity
+        self._dropped = 0
+        self._buffers: List[_ThreadBuffer] = []
+        # Защищает список буферов; запись в буфер её не берёт
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._sequence = itertools.count()
+
+    def _register(self) -> _ThreadBuffer:
+        buffer = _ThreadBuffer(threading.current_thread())
+        with self._lock:
+            # Новый поток - редкое событие: заодно ограничиваем объём строк завершившихся потоков
+            self._trim()
+            self._buffers.append(buffer)
+        self._local.buffer = buffer
+        return buffer
+
+    def write(self, text: str) -> int:
+        """Добавляет строку в буфер текущего потока; строка не разбивается при вытеснении."""
+        try:
+            buffer = self._local.buffer
+        except AttributeError:
+            buffer = self._register()
+        size = len(text) if text.isascii() else len(text.encode("utf-8"))
+        entry = (next(self._sequence), text, size)
+        with buffer.lock:
+            entries = buffer.entries
+            entries.append(entry)
+            buffer.size += size
+            while buffer.size > self.capacity:
+                buffer.size -= entries.popleft()[2]
+                buffer.dropped += 1
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+    def _copy(self) -> List[List[Tuple[int, str, int]]]:
+        # Вызывается под self._lock
+        parts = []
+        for buffer in self._buffers:
+            with buffer.lock:
+                parts.append(list(buffer.entries))
+        return parts
+
+    def _trim(self) -> None:
+        """
+        Вызывается под self._lock: удаляет глобально самые старые строки сверх capacity
+        и пустые буферы завершившихся потоков.
+        """
+        total = 0
+        for buffer in self._buffers:
+            total += buffer.size
+        if total > self.capacity:
+            # Номер самой старой строки, которая ещё помещается в ёмкость
+            cutoff = None
+            remaining = self.capacity
+            for sequence, _, size in heapq.merge(*(reversed(part) for part in self._copy()), reverse=True):
+                if size > remaining:
+                    break
+                remaining -= size
+                cutoff = sequence
+            for buffer in self._buffers:
+                with buffer.lock:
+                    entries = buffer.entries
+                    while entries and (cutoff is None or entries[0][0] < cutoff):
+                        buffer.size -= entries.popleft()[2]
+                        self._dropped += 1
+        self._prune()
+
+    def _prune(self) -> None:
+        # Вызывается под self._lock: пустые буферы завершившихся потоков больше не нужны
+        alive = []
+        for buffer in self._buffers:
+            if buffer.entries or buffer.thread.is_alive():
+                alive.append(buffer)
+            else:
+                self._dropped += buffer.dropped
+        self._buffers = alive
+
+    def _collect(self, drain: bool) -> str:
+        with self._lock:
+            self._trim()
+            if drain:
+                parts = []
+                for buffer in self._buffers:
+                    with buffer.lock:
+                        parts.append(buffer.entries)
+                        buffer.entries = deque()
+                        buffer.size = 0
+                self._prune()
+            else:
+                parts = self._copy()
+        return "".join(entry[1] for entry in heapq.merge(*parts))
+
+    def snapshot(self) -> str:
+        """Возвращает содержимое всех буферов в порядке записи, не очищая их."""
+        return self._collect(drain=False)
+
+    def drain(self) -> str:
+        """Возвращает содержимое всех буферов в порядке записи и очищает их."""
+        return self._collect(drain=True)
+
+    getvalue = snapshot
+
+    @property
+    def size(self) -> int:
+        """Объём хранимых строк в байтах (после приведения к ёмкости)."""
+        with self._lock:
+            self._trim()
+            return sum(buffer.size for buffer in self._buffers)
+
+    @property
+    def dropped(self) -> int:
+        """Количество строк, вытесненных при переполнении."""
+        with self._lock:
+            return self._dropped + sum(buffer.dropped for buffer in self._buffers)
+
+
+def benchmark_sinks(threads_count: int = 8, calls: int = 20000) -> dict:
+    """
+    Сравнивает io.StringIO и RingBufferSink при записи из нескольких потоков.
+
+    Args:
+        threads_count: Количество пишущих потоков
+        calls: Количество строк от каждого потока
+
+    Returns:
+        Словарь {вариант: {"time": секунды, "size": итоговый объём в символах}}
+    """
+    from Lab7 import logger
+
+    def target(x):
+        return x
+
+    results = {}
+    for name, sink in [("io.StringIO", io.StringIO()), ("RingBufferSink 64 КБ", RingBufferSink())]:
+        decorated = logger(handle=sink)(target)
+
+        def worker():
+            for i in range(calls):
+                decorated(i)
+
+        workers = [threading.Thread(target=worker) for _ in range(threads_count)]
+        start = time.perf_counter()
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+        results[name] = {"time": time.perf_counter() - start, "size": len(sink.getvalue())}
+    return results
+
+
+def main():
+    print("Запись логов из 8 потоков: io.StringIO и RingBufferSink")
+    results = benchmark_sinks()
+
+    print(f"{'Приёмник':<22} {'Время (с)':<12} {'Объём (символов)':<18}")
+    for name, stats in results.items():
+        print(f"{name:<22} {stats['time']:<12.3f} {stats['size']:<18}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+import asyncio
+import inspect
+import io
+import time
+import unittest
+
+from Lab7 import flush_async_logs, logger
+from metrics import MetricsRegistry
+
+
+class TestAsyncLogger(unittest.TestCase):
+
+    def setUp(self):
+        self.stream = io.StringIO()
+
+    def test_async_function(self):
+        @logger(handle=self.stream)
+        async def add(a, b):
+            await asyncio.sleep(0)
+            return a + b
+
+        self.assertTrue(inspect.iscoroutinefunction(add))
+        self.assertEqual(asyncio.run(add(2, 3)), 5)
+        flush_async_logs()
+
+        self.assertEqual(self.stream.getvalue(), "INFO: Вызов add(2, 3)\nINFO: add вернула 5\n")
+
+    def test_async_exception(self):
+        registry = MetricsRegistry()
+
+        @logger(handle=self.stream, metrics=registry)
+        async def fail():
+            raise ValueError("ошибка")
+
+        with self.assertRaises(ValueError):
+            asyncio.run(fail())
+        flush_async_logs()
+
+        self.assertIn("ERROR: Исключение в fail: ValueError: ошибка", self.stream.getvalue())
+        self.assertEqual(registry.get(fail.__qualname__).exceptions, 1)
+
+    def test_async_generator(self):
+        @logger(handle=self.stream)
+        async def countdown(n):
+            for i in range(n, 0, -1):
+                yield i
+
+        async def collect():
+            return [i async for i in countdown(3)]
+
+        self.assertEqual(asyncio.run(collect()), [3, 2, 1])
+        flush_async_logs()
+
+        self.assertIn("INFO: countdown завершилась, выдано значений: 3", self.stream.getvalue())
+
+    def test_async_does_not_block_loop(self):
+        class SlowStream:
+            def __init__(self):
+                self.lines = []
+
+            def write(self, text):
+                time.sleep(0.02)
+                self.lines.append(text)
+
+        slow = SlowStream()
+
+        @logger(handle=slow)
+        async def noop(i):
+            await asyncio.sleep(0.01)
+            return i
+
+        async def run():
+            return await asyncio.gather(*(noop(i) for i in range(10)))
+
+        start = time.perf_counter()
+        self.assertEqual(asyncio.run(run()), list(range(10)))
+        self.assertLess(time.perf_counter() - start, 0.2)
+        flush_async_logs()
+        self.assertEqual(len(slow.lines), 20)
@@ -0,0 +1,79 @@
+import io
+import unittest
+
+from Lab7 import get_currencies, logger, make_session
+from cbr_stub import CBRStubServer
+
+
+class TestGetCurrenciesStub(unittest.TestCase):
+
+    def setUp(self):
+        self.server = CBRStubServer().start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_correct_return(self):
+        self.assertEqual(get_currencies(['USD', 'EUR'], self.server.url), {"USD": 76.4678, "EUR": 90.3211})
+
+    def test_http_error(self):
+        self.server.inject_fault("status", status=500)
+        with self.assertRaises(ConnectionError):
+            get_currencies(['USD'], self.server.url)
+
+    def test_dropped_connection(self):
+        self.server.inject_fault("drop")
+        with self.assertRaises(ConnectionError):
+            get_currencies(['USD'], self.server.url)
+
+    def test_malformed_json(self):
+        self.server.inject_fault("malformed")
+        with self.assertRaises(ValueError):
+            get_currencies(['USD'], self.server.url)
+
+    def test_missing_valute_key(self):
+        self.server.inject_fault("no_valute")
+        with self.assertRaises(KeyError):
+            get_currencies(['USD'], self.server.url)
+
+    def test_timeout(self):
+        self.server.delay = 0.1
+        with self.assertRaises(ConnectionError):
+            get_currencies(['USD'], self.server.url, timeout=0.02)
+
+    def test_unknown_fault(self):
+        with self.assertRaises(ValueError):
+            self.server.inject_fault("slow")
+
+    def test_fault_is_consumed(self):
+        self.server.inject_fault("status")
+        session = make_session()
+        with self.assertRaises(ConnectionError):
+            get_currencies(['USD'], self.server.url, session=session)
+        self.assertEqual(get_currencies(['USD'], self.server.url, session=session), {"USD": 76.4678})
+        session.close()
+
+
+class TestStreamWrite(unittest.TestCase):
+
+    def setUp(self):
+        self.stream = io.StringIO()
+        self.server = CBRStubServer().start()
+        self.server.inject_fault("status")
+
+        @logger(handle=self.stream)
+        def wrapped():
+            return get_currencies(['USD'], url=self.server.url)
+
+        self.wrapped = wrapped
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_logging_error(self):
+        with self.assertRaises(ConnectionError):
+            self.wrapped()
+
+        logs = self.stream.getvalue()
+        self.assertIn("ERROR", logs)
+        self.assertIn("ConnectionError", logs)
@@ -0,0 +1,187 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+import currency_cache
+from cbr_stub import CBRStubServer, make_payload
+from currency_cache import CurrencyCache, get_currencies_cached
+
+
+class FakeClock:
+    """Управляемые вручную часы для тестов TTL."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCurrencyCache(unittest.TestCase):
+
+    def setUp(self):
+        self.server = CBRStubServer().start()
+        self.clock = FakeClock()
+        self.cache = CurrencyCache(self.server.url, ttl=60, clock=self.clock)
+
+    def tearDown(self):
+        self.cache.session.close()
+        self.server.stop()
+
+    def test_hit_within_ttl(self):
+        for _ in range(5):
+            result = self.cache.get_currencies(['USD', 'EUR'])
+
+        self.assertEqual(result, {"USD": 76.4678, "EUR": 90.3211})
+        self.assertEqual(self.server.request_count, 1)
+        self.assertEqual(self.cache.stats["hits"], 4)
+
+    def test_revalidation_not_modified(self):
+        self.cache.get_currencies(['USD'])
+        self.clock.now += 61
+        self.cache.get_currencies(['USD'])
+
+        self.assertEqual(self.server.request_count, 2)
+        self.assertEqual(self.server.not_modified_count, 1)
+        self.assertEqual(self.cache.stats["not_modified"], 1)
+
+    def test_revalidation_new_document(self):
+        self.cache.get_currencies(['USD'])
+        self.server.set_payload(make_payload({"USD": 80.0}))
+        self.clock.now += 61
+
+        self.assertEqual(self.cache.get_currencies(['USD']), {"USD": 80.0})
+        self.assertEqual(self.server.not_modified_count, 0)
+
+    def test_stale_on_error(self):
+        self.cache.get_currencies(['USD'])
+        self.server.stop()
+        self.server = CBRStubServer()
+        self.clock.now += 61
+
+        self.assertEqual(self.cache.get_currencies(['USD']), {"USD": 76.4678})
+        self.assertEqual(self.cache.get_currencies(['USD']), {"USD": 76.4678})
+        self.assertEqual(self.cache.stats["stale"], 1)
+
+    def test_error_without_data(self):
+        self.server.stop()
+        self.server = CBRStubServer()
+
+        with self.assertRaises(ConnectionError):
+            self.cache.get_currencies(['USD'])
+
+    def test_missing_currency(self):
+        with self.assertRaises(KeyError):
+            self.cache.get_currencies(['XXX'])
+
+    def test_single_flight(self):
+        original_get = self.cache.session.get
+
+        def slow_get(*args, **kwargs):
+            time.sleep(0.05)
+            return original_get(*args, **kwargs)
+
+        self.cache.session.get = slow_get
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(self.cache.get_currencies(['EUR'])))
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, [{"EUR": 90.3211}] * 8)
+        self.assertEqual(self.server.request_count, 1)
+
+    def test_failed_flight_then_new_leader(self):
+        original_refresh = self.cache._refresh
+        started, release = [threading.Event(), threading.Event()], [threading.Event(), threading.Event()]
+        calls = []
+
+        def refresh():
+            call = len(calls)
+            calls.append(call)
+            started[call].set()
+            release[call].wait()
+            if call == 0:
+                raise ConnectionError("API недоступен")
+            original_refresh()
+
+        follower_waiting = threading.Event()
+
+        class LateEvent(threading.Event):
+            # Ожидающий вызов просыпается с опозданием, когда уже идёт следующий запрос
+            def wait(self, timeout=None):
+                follower_waiting.set()
+                result = super().wait(timeout)
+                time.sleep(0.1)
+                return result
+
+        class LateFlight(currency_cache._Flight):
+            def __init__(self):
+                super().__init__()
+                self.done = LateEvent()
+
+        results = {}
+
+        def call(name):
+            try:
+                results[name] = self.cache.get_valutes()
+            except ConnectionError as e:
+                results[name] = e
+
+        self.cache._refresh = refresh
+        with mock.patch.object(currency_cache, "_Flight", LateFlight):
+            leader = threading.Thread(target=call, args=("leader",))
+            leader.start()
+            started[0].wait()
+            follower = threading.Thread(target=call, args=("follower",))
+            follower.start()
+            follower_waiting.wait()
+            release[0].set()
+            leader.join()
+
+            new_leader = threading.Thread(target=call, args=("new_leader",))
+            new_leader.start()
+            started[1].wait()
+            follower.join()
+            release[1].set()
+            new_leader.join()
+
+        self.assertIsInstance(results["leader"], ConnectionError)
+        self.assertIs(results["follower"], results["leader"])
+        self.assertIn("USD", results["new_leader"])
+
+    def test_shared_cache_created_once(self):
+        created = []
+
+        def make_cache(*args, **kwargs):
+            cache = CurrencyCache(*args, clock=self.clock, **kwargs)
+            created.append(cache)
+            return cache
+
+        with mock.patch.object(currency_cache, "CurrencyCache", make_cache), \
+                mock.patch.dict(currency_cache._caches, clear=True):
+            for _ in range(3):
+                self.assertEqual(get_currencies_cached(['USD'], self.server.url), {"USD": 76.4678})
+        for cache in created:
+            cache.session.close()
+
+        self.assertEqual(len(created), 1)
+        self.assertEqual(self.server.request_count, 1)
+
+    def test_disk_persistence(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "cbr_cache.json")
+            first = CurrencyCache(self.server.url, ttl=60, cache_path=path)
+            first.get_currencies(['USD'])
+            first.session.close()
+
+            second = CurrencyCache(self.server.url, ttl=60, cache_path=path)
+            self.assertEqual(second.get_currencies(['USD']), {"USD": 76.4678})
+            second.session.close()
+
+        self.assertEqual(self.server.request_count, 1)
@@ -0,0 +1,112 @@
+import asyncio
+import time
+import unittest
+
+from cbr_stub import CBRStubServer
+from currency_client import AsyncCurrencyClient, CurrencyClient, get_currencies_async
+from Lab7 import flush_async_logs
+from metrics import REGISTRY
+
+
+class TestCurrencyClient(unittest.TestCase):
+
+    def setUp(self):
+        self.server = CBRStubServer().start()
+        self.client = CurrencyClient(self.server.url)
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+
+    def test_correct_return(self):
+        result = self.client.get_currencies(['USD', 'EUR'])
+        self.assertEqual(result, {"USD": 76.4678, "EUR": 90.3211})
+
+    def test_connection_reuse(self):
+        for _ in range(5):
+            self.client.get_currencies(['USD'])
+
+        self.assertEqual(self.server.request_count, 5)
+        self.assertEqual(self.server.connection_count, 1)
+
+    def test_many_preserves_order(self):
+        with CBRStubServer({"Valute": {"USD": {"Value": 1.0}}}) as other:
+            results = self.client.get_currencies_many(['USD'], [self.server.url, other.url])
+
+        self.assertEqual(results, [{"USD": 76.4678}, {"USD": 1.0}])
+
+    def test_many_return_exceptions(self):
+        results = self.client.get_currencies_many(['XXX'], [self.server.url], return_exceptions=True)
+        self.assertIsInstance(results[0], KeyError)
+
+    def test_connection_error(self):
+        closed = CBRStubServer()
+        closed.stop()
+
+        with self.assertRaises(ConnectionError):
+            self.client.get_currencies(['USD'], closed.url)
+
+
+class TestAsyncCurrencyClient(unittest.TestCase):
+
+    def setUp(self):
+        self.server = CBRStubServer().start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_correct_return(self):
+        async def run():
+            async with AsyncCurrencyClient(self.server.url) as client:
+                return await client.get_currencies(['USD', 'EUR'])
+
+        self.assertEqual(asyncio.run(run()), {"USD": 76.4678, "EUR": 90.3211})
+
+    def test_many_concurrent(self):
+        async def run():
+            async with AsyncCurrencyClient(self.server.url, max_connections=4) as client:
+                return await client.get_currencies_many(['GBP'], [self.server.url] * 20)
+
+        results = asyncio.run(run())
+
+        self.assertEqual(results, [{"GBP": 103.0542}] * 20)
+        self.assertEqual(self.server.request_count, 20)
+        self.assertLessEqual(self.server.connection_count, 4)
+
+    def test_many_return_exceptions(self):
+        async def run():
+            async with AsyncCurrencyClient(self.server.url) as client:
+                return await client.get_currencies_many(['USD', 'XXX'], [self.server.url],
+                                                        return_exceptions=True)
+
+        results = asyncio.run(run())
+        self.assertIsInstance(results[0], KeyError)
+
+
+class TestGetCurrenciesAsync(unittest.TestCase):
+
+    def setUp(self):
+        self.server = CBRStubServer(delay=0.1).start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_concurrent_calls_logged(self):
+        async def run():
+            async with AsyncCurrencyClient(self.server.url, max_connections=10) as client:
+                return await asyncio.gather(*(get_currencies_async(['USD'], self.server.url, client=client)
+                                              for _ in range(10)))
+
+        before = REGISTRY.get(get_currencies_async.__qualname__).calls
+        start = time.perf_counter()
+        results = asyncio.run(run())
+        elapsed = time.perf_counter() - start
+        flush_async_logs()
+
+        self.assertEqual(results, [{"USD": 76.4678}] * 10)
+        self.assertLess(elapsed, 0.5)
+        self.assertEqual(REGISTRY.get(get_currencies_async.__qualname__).calls - before, 10)
+
+    def test_default_executor(self):
+        self.server.delay = 0
+        self.assertEqual(asyncio.run(get_currencies_async(['EUR'], self.server.url)), {"EUR": 90.3211})
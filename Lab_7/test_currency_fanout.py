@@ -0,0 +1,108 @@
+import threading
+import time
+import unittest
+
+from cbr_stub import CBRStubServer, make_payload
+from currency_fanout import CurrencyFanout, get_currencies_fanout
+
+
+class TestCurrencyFanout(unittest.TestCase):
+
+    def setUp(self):
+        self.usd = CBRStubServer(make_payload({"USD": 80.0})).start()
+        self.eur = CBRStubServer(make_payload({"EUR": 90.0})).start()
+
+    def tearDown(self):
+        self.usd.stop()
+        self.eur.stop()
+
+    def test_first_success_per_currency(self):
+        result = get_currencies_fanout(['USD', 'EUR'], [self.usd.url, self.eur.url], hedge_delay=1)
+
+        self.assertEqual(result.rates, {"USD": 80.0, "EUR": 90.0})
+        self.assertEqual(result.sources, {"USD": self.usd.url, "EUR": self.eur.url})
+        self.assertTrue(result.complete)
+
+    def test_partial_result(self):
+        result = get_currencies_fanout(['USD', 'XXX'], [self.usd.url, self.eur.url])
+
+        self.assertEqual(result.rates, {"USD": 80.0})
+        self.assertEqual([e.url for e in result.errors["XXX"]], [self.usd.url, self.eur.url])
+        self.assertTrue(all(isinstance(e.error, KeyError) for e in result.errors["XXX"]))
+        self.assertFalse(result.complete)
+
+    def test_hedges_slow_mirror(self):
+        self.eur.set_payload(make_payload({"USD": 81.0}))
+        self.usd.delay = 0.3
+
+        start = time.perf_counter()
+        result = get_currencies_fanout(['USD'], [self.usd.url, self.eur.url], hedge_delay=0.02)
+
+        self.assertLess(time.perf_counter() - start, 0.25)
+        self.assertEqual(result.sources, {"USD": self.eur.url})
+
+    def test_failed_mirror_starts_next_immediately(self):
+        self.usd.inject_fault("status")
+        self.eur.set_payload(make_payload({"USD": 81.0}))
+
+        start = time.perf_counter()
+        result = get_currencies_fanout(['USD'], [self.usd.url, self.eur.url], hedge_delay=10)
+
+        self.assertLess(time.perf_counter() - start, 1)
+        self.assertEqual(result.rates, {"USD": 81.0})
+
+    def test_all_mirrors_fail(self):
+        self.usd.inject_fault("status")
+        self.eur.inject_fault("malformed")
+
+        result = get_currencies_fanout(['USD', 'EUR'], [self.usd.url, self.eur.url])
+
+        self.assertEqual(result.rates, {})
+        self.assertIsInstance(result.errors["USD"][0].error, ConnectionError)
+        self.assertIsInstance(result.errors["EUR"][1].error, ValueError)
+
+    def test_close_waits_for_late_mirror(self):
+        self.eur.set_payload(make_payload({"USD": 81.0}))
+        self.usd.delay = 0.3
+        fanout = CurrencyFanout([self.usd.url, self.eur.url], hedge_delay=0.02)
+        closed = []
+        close_session = fanout.session.close
+
+        def close():
+            # Потоки пула, ещё живые в момент закрытия сессии
+            closed.append([t.name for t in threading.enumerate() if t.name.startswith("currency-fanout_")])
+            close_session()
+
+        fanout.session.close = close
+
+        start = time.perf_counter()
+        self.assertEqual(fanout.get_currencies(['USD']).sources, {"USD": self.eur.url})
+        self.assertLess(time.perf_counter() - start, 0.25)
+        fanout.close()
+
+        self.assertGreaterEqual(time.perf_counter() - start, 0.25)
+        self.assertEqual(closed, [[]])
+
+    def test_close_without_wait(self):
+        self.usd.delay = 0.3
+        fanout = CurrencyFanout([self.usd.url], hedge_delay=0.02)
+        closed = threading.Event()
+        close_session = fanout.session.close
+
+        def close():
+            closed.set()
+            close_session()
+
+        fanout.session.close = close
+        future = fanout._executor.submit(fanout._fetch, self.usd.url, ['USD'])
+        time.sleep(0.05)
+
+        fanout.close(wait=False)
+
+        self.assertFalse(closed.is_set())
+        self.assertEqual(future.result()[0], {"USD": 80.0})
+        self.assertTrue(closed.wait(1))
+
+    def test_no_mirrors(self):
+        with self.assertRaises(ValueError):
+            CurrencyFanout([])
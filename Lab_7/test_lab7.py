@@ -0,0 +1,359 @@
+import io
+import logging
+import logging.handlers
+import unittest
+from unittest.mock import patch, Mock
+
+import requests
+
+import Lab7
+from Lab7 import (QueueSink, QuadraticSolution, STATUS_INFINITE, STATUS_LINEAR, STATUS_NO_REAL_ROOTS,
+                  STATUS_NO_SOLUTION, get_currencies, logger, solve_quadratic, solve_quadratic_roots)
+
+
+class TestGetCurrencies(unittest.TestCase):
+    
+    def setUp(self):
+        self.valid_response = {
+            "Valute": {
+                "USD": {"Value": 93.25},
+                "EUR": {"Value": 101.7}
+            }
+        }
+    
+    @patch('requests.get')
+    def test_correct_return(self, mock_get):
+        mock_response = Mock()
+        mock_response.json.return_value = self.valid_response
+        mock_get.return_value = mock_response
+        
+        result = get_currencies(['USD', 'EUR'])
+        self.assertEqual(result, {"USD": 93.25, "EUR": 101.7})
+    
+    @patch('requests.get')
+    def test_nonexistent_currency(self, mock_get):
+        mock_response = Mock()
+        mock_response.json.return_value = self.valid_response
+        mock_get.return_value = mock_response
+        
+        with self.assertRaises(KeyError) as context:
+            get_currencies(['GBP'])
+        
+        self.assertIn("Валюта GBP отсутствует", str(context.exception))
+    
+    @patch('requests.get')
+    def test_connection_error(self, mock_get):
+        mock_get.side_effect = requests.RequestException("Connection failed")
+        
+        with self.assertRaises(ConnectionError):
+            get_currencies(['USD'])
+    
+    @patch('requests.get')
+    def test_invalid_json(self, mock_get):
+        mock_response = Mock()
+        mock_response.json.side_effect = ValueError("Invalid JSON")
+        mock_get.return_value = mock_response
+        
+        with self.assertRaises(ValueError):
+            get_currencies(['USD'])
+    
+    @patch('requests.get')
+    def test_missing_valute_key(self, mock_get):
+        mock_response = Mock()
+        mock_response.json.return_value = {}
+        mock_get.return_value = mock_response
+        
+        with self.assertRaises(KeyError) as context:
+            get_currencies(['USD'])
+        
+        self.assertIn("отсутствует ключ 'Valute'", str(context.exception))
+    
+    @patch('requests.get')
+    def test_type_error(self, mock_get):
+        invalid_response = {
+            "Valute": {
+                "USD": {"Value": "не число"}
+            }
+        }
+        mock_response = Mock()
+        mock_response.json.return_value = invalid_response
+        mock_get.return_value = mock_response
+        
+        with self.assertRaises(TypeError):
+            get_currencies(['USD'])
+    
+    @patch('requests.get')
+    def test_partial_result(self, mock_get):
+        self.valid_response["Valute"]["CNY"] = {"Value": "не число"}
+        mock_response = Mock()
+        mock_response.json.return_value = self.valid_response
+        mock_get.return_value = mock_response
+        
+        errors = {}
+        result = get_currencies(['USD', 'GBP', 'CNY'], errors=errors)
+        
+        self.assertEqual(result, {"USD": 93.25})
+        self.assertIsInstance(errors["GBP"], KeyError)
+        self.assertIsInstance(errors["CNY"], TypeError)
+
+
+class TestLoggerDecorator(unittest.TestCase):
+    
+    def setUp(self):
+        self.stream = io.StringIO()
+        
+        @logger(handle=self.stream)
+        def test_function(x, y=2):
+            return x * y
+        
+        self.test_function = test_function
+        
+        @logger(handle=self.stream)
+        def error_function():
+            raise ValueError("Тестовая ошибка")
+        
+        self.error_function = error_function
+    
+    def test_success_logging(self):
+        result = self.test_function(3, y=4)
+        
+        self.assertEqual(result, 12)
+        
+        logs = self.stream.getvalue()
+        
+        self.assertIn("INFO: Вызов test_function(3, y=4)", logs)
+        
+        self.assertIn("INFO: test_function вернула 12", logs)
+    
+    def test_error_logging(self):
+        with self.assertRaises(ValueError):
+            self.error_function()
+        
+        logs = self.stream.getvalue()
+        
+        self.assertIn("ERROR: Исключение в error_function: ValueError: Тестовая ошибка", logs)
+        self.assertIn("INFO: Вызов error_function()", logs)
+    
+    def test_disabled_level_skips_formatting(self):
+        class NoRepr:
+            def __repr__(self):
+                raise AssertionError("repr не должен вызываться")
+        
+        quiet = logging.Logger("quiet", logging.WARNING)
+        
+        @logger(handle=quiet)
+        def identity(x):
+            return x
+        
+        arg = NoRepr()
+        self.assertIs(identity(arg), arg)
+    
+    def test_stream_level(self):
+        @logger(handle=self.stream, level=logging.ERROR)
+        def double(x):
+            return x * 2
+        
+        self.assertEqual(double(2), 4)
+        self.assertEqual(self.stream.getvalue(), "")
+    
+    def test_sampling_keeps_errors(self):
+        @logger(handle=self.stream, sample_rate=0.0)
+        def fail():
+            raise ValueError("Тестовая ошибка")
+        
+        with self.assertRaises(ValueError):
+            fail()
+        
+        logs = self.stream.getvalue()
+        self.assertNotIn("INFO", logs)
+        self.assertIn("ERROR: Исключение в fail: ValueError: Тестовая ошибка", logs)
+    
+    def test_queue_sink(self):
+        with QueueSink(self.stream) as sink:
+            @logger(handle=sink)
+            def add(x, y):
+                return x + y
+            
+            self.assertEqual(add(1, 2), 3)
+        
+        logs = self.stream.getvalue()
+        self.assertIn("INFO: Вызов add(1, 2)", logs)
+        self.assertIn("INFO: add вернула 3", logs)
+    
+    def test_huge_arguments_truncated(self):
+        @logger(handle=self.stream, max_repr=100)
+        def total(values):
+            return {i: i for i in range(len(values))}
+        
+        total(list(range(100_000)))
+        
+        call_line, result_line = self.stream.getvalue().splitlines()
+        self.assertTrue(call_line.startswith("INFO: Вызов total([0, 1, 2"))
+        self.assertLess(len(call_line), 150)
+        self.assertLess(len(result_line), 150)
+    
+    def test_max_repr_counts_utf8_bytes(self):
+        @logger(handle=self.stream, max_repr=50)
+        def echo(text):
+            return None
+        
+        echo("ж" * 100)
+        echo("ok")
+        
+        call_line = self.stream.getvalue().splitlines()[0]
+        value = call_line[len("INFO: Вызов echo("):-1]
+        self.assertTrue(value.endswith("..."))
+        self.assertLessEqual(len(value.encode("utf-8")), 50)
+        self.assertIn("INFO: Вызов echo('ok')", self.stream.getvalue())
+    
+    def test_no_truncation_by_default(self):
+        @logger(handle=self.stream)
+        def echo(values):
+            return len(values)
+        
+        values = list(range(2000))
+        echo(values)
+        
+        self.assertIn(f"INFO: Вызов echo({values!r})", self.stream.getvalue())
+    
+    def test_capture_type(self):
+        @logger(handle=self.stream, capture="type")
+        def first(values, default=None):
+            return values[0]
+        
+        first([5, 6, 7], default=1.5)
+        
+        logs = self.stream.getvalue()
+        self.assertIn("INFO: Вызов first(<list len=3>, default=<float>)", logs)
+        self.assertIn("INFO: first вернула <int>", logs)
+    
+    def test_redact(self):
+        @logger(handle=self.stream, redact={"password", "return"})
+        def login(user, password, token=None):
+            return "secret-session"
+        
+        login("admin", "qwerty")
+        login("admin", password="qwerty")
+        
+        logs = self.stream.getvalue()
+        self.assertNotIn("qwerty", logs)
+        self.assertNotIn("secret-session", logs)
+        self.assertIn("INFO: Вызов login('admin', '***')", logs)
+        self.assertIn("INFO: Вызов login('admin', password='***')", logs)
+    
+    def test_invalid_capture(self):
+        with self.assertRaises(ValueError):
+            logger(handle=self.stream, capture="bytes")
+
+
+class TestFileLogging(unittest.TestCase):
+    
+    def test_file_logger_creation(self):
+        file_logger = Lab7.file_logger
+        self.assertIsNotNone(file_logger)
+        self.assertEqual(len(file_logger.handlers), 1)
+        self.assertIsInstance(file_logger.handlers[0], logging.handlers.QueueHandler)
+        self.assertIsInstance(Lab7.file_sink.handler, logging.handlers.RotatingFileHandler)
+        self.assertEqual(Lab7.file_sink.handler.backupCount, 3)
+        self.assertIs(Lab7.file_sink.logger, file_logger)
+    
+    def test_batched_queue_sink(self):
+        records = []
+        
+        class Collect(logging.Handler):
+            def emit_batch(self, batch):
+                records.append(len(batch))
+        
+        with QueueSink(Collect(), batch_size=100) as sink:
+            decorated = logger(handle=sink)(lambda x: x)
+            for i in range(10):
+                decorated(i)
+        
+        self.assertEqual(sum(records), 20)
+    
+    def test_named_sink_recreated(self):
+        name = "lab7.test_named_sink"
+        first_stream, second_stream = io.StringIO(), io.StringIO()
+        
+        with patch.object(Lab7.atexit, "register") as register:
+            first = QueueSink(first_stream, name=name)
+            second = QueueSink(second_stream, name=name)
+        try:
+            self.assertEqual(register.call_count, 1)
+            self.assertEqual(second.logger.handlers, [second.queue_handler])
+            self.assertFalse(first._running)
+            
+            second.logger.info("сообщение")
+            second.stop()
+            self.assertEqual(first_stream.getvalue(), "")
+            self.assertEqual(second_stream.getvalue(), "INFO: сообщение\n")
+        finally:
+            second.stop()
+            second.logger.removeHandler(second.queue_handler)
+            Lab7._named_sinks.pop(name, None)
+
+
+class TestSolveQuadratic(unittest.TestCase):
+    
+    def test_two_roots(self):
+        result = solve_quadratic(1, -3, 2)
+        self.assertEqual(result, (2.0, 1.0))
+    
+    def test_one_root(self):
+        result = solve_quadratic(1, -2, 1)
+        self.assertEqual(result, (1.0,))
+    
+    def test_negative_discriminant(self):
+        result = solve_quadratic(1, 1, 1)
+        self.assertEqual(result, "WARNING: Дискриминант отрицательный, нет действительных корней")
+    
+    def test_linear_equation(self):
+        result = solve_quadratic(0, 2, -4)
+        self.assertEqual(result, (2.0,))
+    
+    def test_invalid_data(self):
+        with self.assertRaises(TypeError):
+            solve_quadratic("abc", 2, 1)
+    
+    def test_impossible_situation(self):
+        with self.assertRaises(ValueError):
+            solve_quadratic(0, 0, 5)
+    
+    def test_stable_small_root(self):
+        classic = solve_quadratic(1, 1e8, 1)
+        stable = solve_quadratic(1, 1e8, 1, method="stable")
+        
+        self.assertAlmostEqual(stable[0] / -1e-8, 1.0, places=12)
+        self.assertGreater(abs(classic[0] / -1e-8 - 1.0), 1e-3)
+        self.assertEqual(stable[1], classic[1])
+    
+    def test_stable_matches_classic_order(self):
+        for coefficients in [(1, -3, 2), (-2, 1, 6), (1, 3, 2), (3, 0, -12)]:
+            classic = solve_quadratic(*coefficients)
+            stable = solve_quadratic(*coefficients, method="stable")
+            for x, y in zip(classic, stable):
+                self.assertAlmostEqual(x, y)
+    
+    def test_complex_roots(self):
+        result = solve_quadratic(1, 2, 5, complex_roots=True)
+        self.assertEqual(result, (-1 + 2j, -1 - 2j))
+    
+    def test_structured_result(self):
+        self.assertEqual(solve_quadratic_roots(1, 1, 1), QuadraticSolution(STATUS_NO_REAL_ROOTS, ()))
+        self.assertEqual(solve_quadratic_roots(0, 0, 5), QuadraticSolution(STATUS_NO_SOLUTION, ()))
+        self.assertEqual(solve_quadratic_roots(0, 0, 0).status, STATUS_INFINITE)
+        self.assertEqual(solve_quadratic_roots(0, 2, -4), QuadraticSolution(STATUS_LINEAR, (2.0,)))
+    
+    def test_invalid_method(self):
+        with self.assertRaises(ValueError):
+            solve_quadratic(1, 2, 1, method="fast")
+    
+    def test_cached(self):
+        solve_quadratic_cached = Lab7.solve_quadratic_cached
+        solve_quadratic_cached.cache_clear()
+        
+        self.assertEqual(solve_quadratic_cached(1, -3, 2), (2.0, 1.0))
+        self.assertEqual(solve_quadratic_cached(1, -3, 2), (2.0, 1.0))
+        self.assertEqual(solve_quadratic_cached.cache_info().hits, 1)
+        with self.assertRaises(ValueError):
+            solve_quadratic_cached(0, 0, 5)
@@ -0,0 +1,37 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+import Lab7
+
+
+class TestLazyImport(unittest.TestCase):
+
+    def run_python(self, code, cwd):
+        lab7_dir = os.path.dirname(os.path.abspath(Lab7.__file__))
+        env = dict(os.environ, PYTHONPATH=lab7_dir)
+        return subprocess.run([sys.executable, "-c", code], cwd=cwd, env=env,
+                              capture_output=True, text=True, check=True).stdout
+
+    def test_import_is_light(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output = self.run_python(
+                "import sys, threading, Lab7\n"
+                "print(sorted(m for m in ('requests', 'unittest', 'asyncio', 'ring_sink', 'log_pipeline')"
+                " if m in sys.modules), threading.active_count())", directory)
+            self.assertEqual(output.split(), ["[]", "1"])
+            self.assertEqual(os.listdir(directory), [])
+
+    def test_lazy_attributes(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output = self.run_python(
+                "import Lab7\n"
+                "from Lab7 import stream\n"
+                "print(stream is Lab7.stream, 'file_sink' in dir(Lab7), type(Lab7.file_sink).__name__)", directory)
+            self.assertEqual(output.split(), ["True", "True", "QueueSink"])
+
+    def test_unknown_attribute(self):
+        with self.assertRaises(AttributeError):
+            Lab7.no_such_attribute
@@ -0,0 +1,79 @@
+import json
+import logging
+import os
+import queue
+import tempfile
+import unittest
+
+from log_pipeline import BatchQueueListener, make_file_handler
+
+
+class TestLogPipeline(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "test.log")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def make_record(self, message, level=logging.INFO):
+        return logging.makeLogRecord({"name": "test", "levelno": level,
+                                      "levelname": logging.getLevelName(level), "msg": message})
+
+    def read(self, path):
+        with open(path, encoding="utf-8") as f:
+            return f.read().splitlines()
+
+    def test_batch_written_once(self):
+        handler = make_file_handler(self.path)
+        writes = []
+        handler.stream = handler._open()
+        original = handler.stream.write
+        handler.stream.write = lambda text: writes.append(text) or original(text)
+
+        handler.emit_batch([self.make_record(f"сообщение {i}") for i in range(100)])
+        handler.close()
+
+        self.assertEqual(len(writes), 1)
+        self.assertEqual(len(self.read(self.path)), 100)
+
+    def test_rotation_bounded(self):
+        handler = make_file_handler(self.path, max_bytes=500, backup_count=2)
+        for i in range(20):
+            handler.emit_batch([self.make_record(f"сообщение {i} " + "x" * 40) for _ in range(5)])
+        handler.close()
+
+        files = sorted(os.listdir(self.directory.name))
+        self.assertEqual(files, ["test.log", "test.log.1", "test.log.2"])
+        for name in files:
+            self.assertLessEqual(os.path.getsize(os.path.join(self.directory.name, name)), 500)
+
+    def test_jsonl_format(self):
+        handler = make_file_handler(self.path, fmt="jsonl")
+        handler.emit(self.make_record("Вызов f(1)"))
+        handler.close()
+
+        record = json.loads(self.read(self.path)[0])
+        self.assertEqual(record["msg"], "Вызов f(1)")
+        self.assertEqual(record["level"], "INFO")
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            make_file_handler(self.path, fmt="xml")
+
+    def test_listener_flushes_on_stop(self):
+        handler = make_file_handler(self.path)
+        handler.setLevel(logging.WARNING)
+        log_queue = queue.SimpleQueue()
+        listener = BatchQueueListener(log_queue, handler, batch_size=1000)
+        listener.start()
+        for i in range(50):
+            log_queue.put_nowait(self.make_record(f"ошибка {i}", logging.ERROR))
+            log_queue.put_nowait(self.make_record(f"инфо {i}"))
+        listener.stop()
+        handler.close()
+
+        lines = self.read(self.path)
+        self.assertEqual(len(lines), 50)
+        self.assertTrue(all("ERROR - ошибка" in line for line in lines))
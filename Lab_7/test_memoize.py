@@ -0,0 +1,181 @@
+import random
+import threading
+import unittest
+
+from memoize import _Entry, _LFUStore, memoize
+
+
+class FakeClock:
+    """Управляемые вручную часы для тестов TTL."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestMemoize(unittest.TestCase):
+
+    def setUp(self):
+        self.calls = []
+
+    def make(self, **options):
+        @memoize(**options)
+        def square(x):
+            self.calls.append(x)
+            return x * x
+
+        return square
+
+    def test_hits_and_misses(self):
+        square = self.make()
+
+        self.assertEqual([square(2), square(2), square(3)], [4, 4, 9])
+        self.assertEqual(self.calls, [2, 3])
+        info = square.cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (1, 2, 2))
+
+    def test_lru_eviction(self):
+        square = self.make(maxsize=2)
+        square(1)
+        square(2)
+        square(1)
+        square(3)
+        square(1)
+        square(2)
+
+        self.assertEqual(self.calls, [1, 2, 3, 2])
+        self.assertEqual(square.cache_info().evictions, 2)
+
+    def test_lfu_eviction(self):
+        square = self.make(maxsize=2, policy="lfu")
+        square(1)
+        square(1)
+        square(2)
+        square(3)
+        square(1)
+
+        self.assertEqual(self.calls, [1, 2, 3])
+
+    def test_ttl(self):
+        clock = FakeClock()
+        square = self.make(ttl=10, clock=clock)
+        square(2)
+        clock.now = 5
+        square(2)
+        clock.now = 11
+        square(2)
+
+        self.assertEqual(self.calls, [2, 2])
+        self.assertEqual(square.cache_info().expirations, 1)
+
+    def test_maxbytes(self):
+        square = self.make(maxsize=None, maxbytes=200)
+        for x in range(20):
+            square(x)
+
+        info = square.cache_info()
+        self.assertLessEqual(info.currbytes, 200)
+        self.assertLess(info.currsize, 20)
+
+    def test_cache_clear(self):
+        square = self.make()
+        square(2)
+        square.cache_clear()
+        square(2)
+
+        self.assertEqual(self.calls, [2, 2])
+        self.assertEqual(square.cache_info().hits, 0)
+
+    def test_exceptions_not_cached(self):
+        @memoize
+        def fail(x):
+            self.calls.append(x)
+            raise ValueError(x)
+
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                fail(1)
+        self.assertEqual(self.calls, [1, 1])
+
+    def test_unhashable_arguments(self):
+        @memoize
+        def total(values):
+            return sum(values)
+
+        self.assertEqual(total([1, 2, 3]), 6)
+        self.assertEqual(total.cache_info().currsize, 0)
+
+    def test_typed(self):
+        square = self.make(typed=True)
+        square(2)
+        square(2.0)
+
+        self.assertEqual(self.calls, [2, 2.0])
+
+    def test_thread_safety(self):
+        square = self.make(maxsize=16, policy="lfu")
+
+        def work(seed):
+            rng = random.Random(seed)
+            for _ in range(2000):
+                x = rng.randint(0, 40)
+                self.assertEqual(square(x), x * x)
+
+        threads = [threading.Thread(target=work, args=(seed,)) for seed in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        info = square.cache_info()
+        self.assertEqual(info.hits + info.misses, 16000)
+        self.assertLessEqual(info.currsize, 16)
+
+    def test_composes_with_logger(self):
+        import io
+        from Lab7 import logger
+
+        stream = io.StringIO()
+        square = logger(handle=stream)(self.make())
+        square(3)
+        square(3)
+
+        self.assertEqual(self.calls, [3])
+        self.assertEqual(stream.getvalue().count("INFO: square вернула 9"), 2)
+
+        stream = io.StringIO()
+        cube = memoize(logger(handle=stream)(lambda x: x ** 3))
+        cube(2)
+        cube(2)
+
+        self.assertEqual(stream.getvalue().count("вернула 8"), 1)
+
+    def test_invalid_policy(self):
+        with self.assertRaises(ValueError):
+            memoize(policy="fifo")
+
+
+class TestLFUStore(unittest.TestCase):
+
+    def test_matches_reference(self):
+        # Образец: жертва - наименьшая (частота, момент перехода на эту частоту)
+        rng = random.Random(3)
+        store = _LFUStore()
+        reference = {}
+        for tick in range(5000):
+            key = (rng.randint(0, 30),)
+            action = rng.random()
+            if key in reference and action < 0.6:
+                store.get(key)
+                reference[key] = (reference[key][0] + 1, tick)
+            elif key in reference and action < 0.75:
+                store.remove(key)
+                del reference[key]
+            elif key not in reference:
+                store.add(key, _Entry(None, 0, 0.0))
+                reference[key] = (1, tick)
+            if reference:
+                self.assertEqual(store.victim(), min(reference, key=reference.get))
+                self.assertEqual(sorted(store.by_freq), sorted({freq for freq, _ in reference.values()}))
@@ -0,0 +1,84 @@
+import io
+import json
+import threading
+import unittest
+
+from Lab7 import logger
+from metrics import MetricsRegistry
+
+
+class TestMetrics(unittest.TestCase):
+    
+    def setUp(self):
+        self.registry = MetricsRegistry(buckets=(0.001, 1.0))
+        
+        @logger(handle=None, metrics=self.registry)
+        def divide(x, y):
+            return x / y
+        
+        self.divide = divide
+    
+    def test_counts(self):
+        self.divide(1, 2)
+        self.divide(3, 4)
+        with self.assertRaises(ZeroDivisionError):
+            self.divide(1, 0)
+        
+        stats = self.registry.snapshot()["TestMetrics.setUp.<locals>.divide"]
+        self.assertEqual(stats["calls"], 3)
+        self.assertEqual(stats["exceptions"], 1)
+        self.assertEqual(sum(stats["buckets"].values()), 3)
+        self.assertEqual(stats["buckets"]["0.001"], 3)
+    
+    def test_logging_still_works(self):
+        stream = io.StringIO()
+        registry = MetricsRegistry()
+        
+        @logger(handle=stream, metrics=registry)
+        def square(x):
+            return x * x
+        
+        square(3)
+        
+        self.assertIn("INFO: square вернула 9", stream.getvalue())
+        self.assertEqual(registry.snapshot()["TestMetrics.test_logging_still_works.<locals>.square"]["calls"], 1)
+    
+    def test_thread_safety(self):
+        def work():
+            for _ in range(1000):
+                self.divide(1, 1)
+        
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        stats = self.registry.snapshot()["TestMetrics.setUp.<locals>.divide"]
+        self.assertEqual(stats["calls"], 8000)
+    
+    def test_json_export(self):
+        self.divide(1, 2)
+        
+        data = json.loads(self.registry.to_json())
+        self.assertEqual(data["TestMetrics.setUp.<locals>.divide"]["calls"], 1)
+    
+    def test_prometheus_export(self):
+        self.divide(1, 2)
+        
+        text = self.registry.to_prometheus()
+        self.assertIn("# TYPE lab7_function_duration_seconds histogram", text)
+        self.assertIn('lab7_function_calls_total{function="TestMetrics.setUp.<locals>.divide"} 1', text)
+        self.assertIn('lab7_function_duration_seconds_bucket{function="TestMetrics.setUp.<locals>.divide",le="+Inf"} 1', text)
+        self.assertIn('lab7_function_duration_seconds_count{function="TestMetrics.setUp.<locals>.divide"} 1', text)
+    
+    def test_prometheus_label_escaping(self):
+        self.registry.observe('a\\b"c\nd', 0.5)
+        
+        text = self.registry.to_prometheus()
+        self.assertIn('lab7_function_calls_total{function="a\\\\b\\"c\\nd"} 1', text)
+        self.assertTrue(all(line.startswith(("#", "lab7_")) for line in text.splitlines()))
+
+
+if __name__ == "__main__":
+    unittest.main()
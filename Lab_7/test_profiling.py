@@ -0,0 +1,179 @@
+import io
+import os
+import pstats
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+from Lab7 import logger
+from metrics import MetricsRegistry
+from profiling import CallProfiler, StackSampler, make_profiler, profile_for
+
+
+def _square_sum(n):
+    return sum(_square(i) for i in range(n))
+
+
+def _square(x):
+    return x * x
+
+
+def _recurse(n):
+    return 0 if n == 0 else _recurse(n - 1) + 1
+
+
+class TestStackSampler(unittest.TestCase):
+
+    def test_stacks_start_at_called_function(self):
+        with StackSampler(interval=0.0005) as sampler:
+            profile_for(lambda: _square_sum(20000), sampler, seconds=0.2)
+
+        stacks = sampler.collapsed()
+        self.assertGreater(sampler.samples, 0)
+        self.assertEqual(sum(stacks.values()), sampler.samples)
+        for stack in stacks:
+            self.assertTrue(stack.startswith("<lambda> (test_profiling.py:"), stack)
+        self.assertTrue(any("_square_sum (test_profiling.py:" in stack for stack in stacks))
+
+    def test_result_and_switch_interval_restored(self):
+        before = sys.getswitchinterval()
+        sampler = StackSampler(interval=0.0001)
+        self.assertEqual(sampler.runcall(_square, 7), 49)
+        sampler.stop()
+        self.assertEqual(sys.getswitchinterval(), before)
+
+    def test_idle_between_calls(self):
+        before = sys.getswitchinterval()
+        sampler = StackSampler(interval=0.0001)
+        sampler.runcall(_square_sum, 20000)
+
+        # Без stop: интервал переключения восстановлен, а поток выборки не работает
+        self.assertEqual(sys.getswitchinterval(), before)
+        self.assertFalse(sampler._active.is_set())
+        samples = sampler.samples
+        time.sleep(0.05)
+        self.assertEqual(sampler.samples, samples)
+
+        sampler.stop()
+        self.assertIsNone(sampler._thread)
+
+    def test_other_threads_not_profiled(self):
+        with StackSampler() as sampler:
+            sampler.runcall(_square, 2)
+            results = []
+            thread = threading.Thread(target=lambda: results.append(sampler.runcall(_square, 3)))
+            thread.start()
+            thread.join()
+        self.assertEqual(results, [9])
+
+    def test_invalid_interval(self):
+        with self.assertRaises(ValueError):
+            StackSampler(interval=0)
+
+
+class TestCallProfiler(unittest.TestCase):
+
+    def test_collapsed_stacks(self):
+        profiler = CallProfiler()
+        self.assertEqual(profiler.runcall(_square_sum, 1000), sum(i * i for i in range(1000)))
+        stacks = profiler.collapsed(min_weight=0)
+
+        self.assertTrue(stacks)
+        self.assertTrue(any(stack.startswith("_square_sum (test_profiling.py:")
+                            and stack.endswith(f"_square (test_profiling.py:{_square.__code__.co_firstlineno})") for stack in stacks), stacks)
+        for stack in stacks:
+            self.assertNotIn("_lsprof", stack)
+
+    def test_recursion_not_expanded(self):
+        profiler = CallProfiler()
+        profiler.runcall(_recurse, 50)
+        stacks = profiler.collapsed(min_weight=0)
+        self.assertEqual(list(stacks), [f"_recurse (test_profiling.py:{_recurse.__code__.co_firstlineno})"])
+
+    def test_nested_runcall(self):
+        profiler = CallProfiler()
+        self.assertEqual(profiler.runcall(profiler.runcall, _square, 5), 25)
+        calls = {name: nc for (_, _, name), (_, nc, *_) in profiler.stats().stats.items()}
+        self.assertEqual(calls["_square"], 1)
+        self.assertEqual(calls["runcall"], 1)
+
+    def test_empty(self):
+        self.assertIsNone(CallProfiler().stats())
+        self.assertEqual(CallProfiler().collapsed(), {})
+
+    def test_write_and_dump(self):
+        profiler = CallProfiler()
+        profiler.runcall(_square_sum, 100)
+        with tempfile.TemporaryDirectory() as directory:
+            collapsed = os.path.join(directory, "out.collapsed")
+            dumped = os.path.join(directory, "out.prof")
+            profiler.write(collapsed)
+            profiler.dump(dumped)
+
+            with open(collapsed, encoding="utf-8") as f:
+                lines = f.read().splitlines()
+            self.assertTrue(lines)
+            for line in lines:
+                stack, weight = line.rsplit(" ", 1)
+                self.assertGreater(int(weight), 0)
+            self.assertIn(("test_profiling.py", _square_sum.__code__.co_firstlineno, "_square_sum"),
+                          {(os.path.basename(f), l, n) for f, l, n in pstats.Stats(dumped).stats})
+
+
+class TestMakeProfiler(unittest.TestCase):
+
+    def test_kinds(self):
+        self.assertIsInstance(make_profiler("sample"), StackSampler)
+        self.assertIsInstance(make_profiler("cprofile"), CallProfiler)
+        with self.assertRaises(ValueError):
+            make_profiler("perf")
+
+
+class TestLoggerProfiler(unittest.TestCase):
+
+    def test_call_profiler(self):
+        stream = io.StringIO()
+        registry = MetricsRegistry()
+        profiler = CallProfiler()
+
+        @logger(handle=stream, metrics=registry, profiler=profiler)
+        def square(x):
+            return x * x
+
+        self.assertEqual(square(3), 9)
+        self.assertEqual(square.__name__, "square")
+        self.assertIn("square вернула 9", stream.getvalue())
+        self.assertEqual(registry.snapshot(), {})
+
+        for i in range(1000):
+            square(i)
+        stacks = profiler.collapsed(min_weight=0)
+        self.assertTrue(any(stack.startswith("wrapper (Lab7.py:") and "square (test_profiling.py:" in stack
+                            for stack in stacks), stacks)
+
+    def test_stack_sampler(self):
+        with StackSampler(interval=0.0005) as sampler:
+            @logger(handle=None, profiler=sampler)
+            def busy():
+                return sum(i * i for i in range(200000))
+
+            busy()
+            busy()
+        self.assertGreater(sampler.samples, 0)
+        self.assertTrue(all(stack.startswith("wrapper (Lab7.py:") for stack in sampler.collapsed()))
+
+    def test_coroutine_rejected(self):
+        async def fetch():
+            return 1
+
+        with self.assertRaises(TypeError):
+            logger(handle=None, profiler=CallProfiler())(fetch)
+
+    def test_generator_rejected(self):
+        def countdown(n):
+            yield from range(n, 0, -1)
+
+        with self.assertRaises(TypeError):
+            logger(handle=None, profiler=StackSampler())(countdown)
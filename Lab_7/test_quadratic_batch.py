@@ -0,0 +1,122 @@
+import random
+import unittest
+
+import numpy as np
+
+from Lab7 import (STATUS_COMPLEX_ROOTS, STATUS_INFINITE, STATUS_LINEAR, STATUS_NO_REAL_ROOTS, STATUS_NO_SOLUTION,
+                  STATUS_ONE_ROOT, STATUS_TWO_ROOTS, solve_quadratic, solve_quadratic_roots)
+from quadratic_batch import solve_quadratic_batch
+
+
+def _expected_row(a, b, c):
+    """Переводит результат скалярной функции в (status, корни)."""
+    try:
+        result = solve_quadratic(a, b, c)
+    except ValueError:
+        return STATUS_NO_SOLUTION, ()
+    if result == "Бесконечное множество решений":
+        return STATUS_INFINITE, ()
+    if isinstance(result, str):
+        return STATUS_NO_REAL_ROOTS, ()
+    if len(result) == 2:
+        return STATUS_TWO_ROOTS, result
+    return (STATUS_LINEAR if a == 0 else STATUS_ONE_ROOT), result
+
+
+class TestSolveQuadraticBatch(unittest.TestCase):
+
+    def assertRowsMatch(self, a, b, c):
+        out = solve_quadratic_batch(a, b, c)
+        for i, coefficients in enumerate(zip(a, b, c)):
+            status, roots = _expected_row(*coefficients)
+            row = out[i]
+            self.assertEqual(row["status"], status, coefficients)
+            self.assertEqual(row["n_roots"], -1 if status == STATUS_INFINITE else len(roots), coefficients)
+            got = [float(row["x1"]), float(row["x2"])][:len(roots)]
+            self.assertEqual(got, list(roots), coefficients)
+
+    def test_all_branches(self):
+        a = [1, 1, 1, 0, 0, 0, 2, -1, 1e-8]
+        b = [-3, -2, 1, 2, 0, 0, 5, 0, 1e8]
+        c = [2, 1, 1, -4, 0, 5, -3, 4, 1]
+        self.assertRowsMatch(a, b, c)
+
+    def test_random_rows_match_scalar(self):
+        rng = random.Random(7)
+        a = [rng.choice([0, rng.uniform(-5, 5)]) for _ in range(2000)]
+        b = [rng.choice([0, rng.uniform(-5, 5)]) for _ in range(2000)]
+        c = [rng.uniform(-5, 5) for _ in range(2000)]
+        self.assertRowsMatch(a, b, c)
+
+    def test_integer_rows_match_scalar(self):
+        rng = random.Random(11)
+        a, b, c = ([rng.randint(-3, 3) for _ in range(2000)] for _ in range(3))
+        self.assertRowsMatch(a, b, c)
+
+    def test_large_integer_discriminant_exact(self):
+        # Во float64 b^2 и 4ac здесь округляются к одному числу, и D выглядел бы нулём
+        self.assertRowsMatch([3], [189812534], [94906267 ** 2 // 3])
+
+        rng = random.Random(13)
+        a, b, c = [], [], []
+        for _ in range(500):
+            root = rng.randint(-2 ** 26, 2 ** 26)
+            scale = rng.randint(1, 5)
+            a.append(scale)
+            b.append(-2 * scale * root + rng.randint(-1, 1))
+            c.append(scale * root * root)
+        self.assertRowsMatch(a, b, c)
+
+    def assertRowsMatchRoots(self, a, b, c, **options):
+        out = solve_quadratic_batch(a, b, c, **options)
+        for i, coefficients in enumerate(zip(a, b, c)):
+            status, roots = solve_quadratic_roots(*coefficients, **options)
+            row = out[i]
+            self.assertEqual(row["status"], status, coefficients)
+            got = [row["x1"].item(), row["x2"].item()][:len(roots)]
+            self.assertEqual(got, list(roots), coefficients)
+
+    def test_stable_rows_match_scalar(self):
+        rng = random.Random(3)
+        a = [rng.choice([0, rng.uniform(-5, 5)]) for _ in range(2000)]
+        b = [rng.choice([0, -0.0, rng.uniform(-1e6, 1e6)]) for _ in range(2000)]
+        c = [rng.uniform(-5, 5) for _ in range(2000)]
+        self.assertRowsMatchRoots(a, b, c, method="stable")
+
+    def test_complex_rows_match_scalar(self):
+        rng = random.Random(5)
+        a, b, c = ([rng.uniform(-5, 5) for _ in range(2000)] for _ in range(3))
+        self.assertRowsMatchRoots(a, b, c, method="stable", complex_roots=True)
+
+    def test_complex_roots(self):
+        out = solve_quadratic_batch([1], [2], [5], complex_roots=True)
+        self.assertEqual(out["status"][0], STATUS_COMPLEX_ROOTS)
+        self.assertEqual(out["n_roots"][0], 2)
+        self.assertEqual((out["x1"][0], out["x2"][0]), (-1 + 2j, -1 - 2j))
+
+    def test_stable_precision(self):
+        out = solve_quadratic_batch([1.0], [1e8], [1.0], method="stable")
+        self.assertAlmostEqual(out["x1"][0] / -1e-8, 1.0, places=12)
+
+    def test_broadcasting(self):
+        out = solve_quadratic_batch(1, [-3, -2], 2)
+        self.assertEqual(out.shape, (2,))
+        self.assertEqual(out["status"].tolist(), [STATUS_TWO_ROOTS, STATUS_NO_REAL_ROOTS])
+
+    def test_invalid_data(self):
+        with self.assertRaises(TypeError):
+            solve_quadratic_batch(["abc"], [2], [1])
+
+    def test_complex_rejected_like_scalar(self):
+        with self.assertRaises(TypeError):
+            solve_quadratic(1j, 2, 1)
+        with self.assertRaises(TypeError):
+            solve_quadratic_batch([1j], [2], [1])
+        with self.assertRaises(TypeError):
+            solve_quadratic_batch(np.array([1, 2], dtype=np.complex64), 2, 1)
+
+    def test_object_arrays_rejected(self):
+        with self.assertRaises(TypeError):
+            solve_quadratic_batch(np.array([1, 2], dtype=object), 2, 1)
+        with self.assertRaises(TypeError):
+            solve_quadratic_batch([2 ** 70], [1], [1])
@@ -0,0 +1,121 @@
+import datetime
+import gc
+import json
+import os
+import tempfile
+import unittest
+import warnings
+
+from cbr_stub import CBRStubServer, make_payload
+from rates_history import (CHUNK_SIZE, MappedRates, RatesStore, _write_snapshots, extract_rates, iter_file_chunks,
+                           iter_json_events, load_history, load_history_dir)
+
+
+class TestJsonEvents(unittest.TestCase):
+
+    DOCUMENT = {
+        "Date": "2026-02-25T11:30:00+03:00",
+        "Valute": {"USD": {"Value": 76.4678, "Nominal": 1, "Name": "Доллар \"США\""}},
+        "List": [1, -2.5e3, True, False, None, [], {}],
+    }
+
+    def events(self, chunk_size: int):
+        data = json.dumps(self.DOCUMENT, ensure_ascii=False).encode("utf-8")
+        chunks = (data[i:i + chunk_size] for i in range(0, len(data), chunk_size))
+        return list(iter_json_events(chunks))
+
+    def test_events(self):
+        events = self.events(CHUNK_SIZE)
+
+        self.assertEqual(events[0], ("", "start_map", None))
+        self.assertIn(("", "map_key", "Date"), events)
+        self.assertIn(("Valute.USD.Value", "number", 76.4678), events)
+        self.assertIn(("Valute.USD.Name", "string", 'Доллар "США"'), events)
+        self.assertIn(("List.item", "number", -2500.0), events)
+        self.assertIn(("List.item", "boolean", True), events)
+        self.assertIn(("List.item", "null", None), events)
+        self.assertEqual(events[-1], ("", "end_map", None))
+
+    def test_chunk_boundaries(self):
+        expected = self.events(CHUNK_SIZE)
+        for chunk_size in range(1, 9):
+            self.assertEqual(self.events(chunk_size), expected, chunk_size)
+
+    def test_invalid_document(self):
+        for data in [b'{"a": }', b'{"a": 1', b'{"a": tru}', b'{"a" 1}']:
+            with self.assertRaises(ValueError, msg=data):
+                list(iter_json_events([data]))
+
+
+class TestRatesHistory(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.paths = _write_snapshots(self.directory.name, 10, ["USD", "EUR", "GBP"])
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_extract_rates(self):
+        with open(self.paths[0], encoding="utf-8") as f:
+            document = json.load(f)
+
+        date, rates = extract_rates(iter_file_chunks(self.paths[0], chunk_size=7), ["EUR", "XXX"])
+
+        self.assertEqual(date, datetime.date(2016, 1, 1))
+        self.assertEqual(rates, {"EUR": document["Valute"]["EUR"]["Value"]})
+
+    def test_load_and_query(self):
+        store = load_history_dir(self.directory.name, ["USD", "EUR"])
+        path = os.path.join(self.directory.name, "rates.bin")
+        store.save(path)
+
+        with open(self.paths[3], encoding="utf-8") as f:
+            usd = json.load(f)["Valute"]["USD"]["Value"]
+
+        with MappedRates(path) as rates:
+            self.assertEqual(len(rates), 10)
+            result = rates.query("USD", datetime.date(2016, 1, 3), datetime.date(2016, 1, 5))
+            self.assertEqual([d.day for d, _ in result], [3, 4, 5])
+            self.assertEqual(result[1][1], usd)
+            with self.assertRaises(KeyError):
+                rates.query("GBP", datetime.date(2016, 1, 1), datetime.date(2016, 1, 2))
+
+    def test_unsorted_and_missing(self):
+        store = RatesStore(["USD", "EUR"])
+        store.add(datetime.date(2020, 1, 2), {"USD": 2.0})
+        store.add(datetime.date(2020, 1, 1), {"USD": 1.0, "EUR": 3.0})
+        path = os.path.join(self.directory.name, "rates.bin")
+        store.save(path)
+
+        with MappedRates(path) as rates:
+            self.assertEqual(list(rates.dates), [datetime.date(2020, 1, 1).toordinal(),
+                                                 datetime.date(2020, 1, 2).toordinal()])
+            self.assertEqual(rates.query("EUR", datetime.date(2020, 1, 1), datetime.date(2020, 1, 2)),
+                             [(datetime.date(2020, 1, 1), 3.0)])
+
+    def test_invalid_files_closed(self):
+        store = RatesStore(["USD"])
+        store.add(datetime.date(2020, 1, 1), {"USD": 1.0})
+        path = os.path.join(self.directory.name, "rates.bin")
+        store.save(path)
+        with open(path, "rb") as f:
+            valid = f.read()
+
+        for content in [b"", b"RATES", b"X" * 64, valid[:-8]]:
+            with open(path, "wb") as f:
+                f.write(content)
+            with self.subTest(size=len(content)), warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter("always", ResourceWarning)
+                with self.assertRaises(ValueError):
+                    MappedRates(path)
+                gc.collect()
+                self.assertEqual([w for w in caught if issubclass(w.category, ResourceWarning)], [])
+
+    def test_load_from_stub(self):
+        payload = make_payload({"USD": 80.5}, date="2024-05-01T11:30:00+03:00")
+        with CBRStubServer(payload) as server:
+            store = load_history([server.url], ["USD"])
+
+        self.assertEqual(list(store.columns["USD"]), [80.5])
+        self.assertEqual(store.dates[0], datetime.date(2024, 5, 1).toordinal())
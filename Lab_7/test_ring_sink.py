@@ -0,0 +1,170 @@
+import threading
+import unittest
+
+from ring_sink import RingBufferSink
+
+
+class TestRingBufferSink(unittest.TestCase):
+
+    def test_order_preserved(self):
+        sink = RingBufferSink()
+        for i in range(5):
+            sink.write(f"{i}\n")
+        self.assertEqual(sink.snapshot(), "0\n1\n2\n3\n4\n")
+        self.assertEqual(sink.snapshot(), sink.getvalue())
+
+    def test_capacity_drops_oldest(self):
+        sink = RingBufferSink(capacity=10)
+        for i in range(10):
+            sink.write(f"{i}{i}\n")
+
+        self.assertEqual(sink.snapshot(), "77\n88\n99\n")
+        self.assertEqual(sink.dropped, 7)
+        self.assertLessEqual(sink.size, 10)
+
+    def test_utf8_size(self):
+        sink = RingBufferSink(capacity=8)
+        sink.write("ёж\n")
+        self.assertEqual(sink.size, 5)
+
+    def test_drain(self):
+        sink = RingBufferSink()
+        sink.write("a\n")
+        self.assertEqual(sink.drain(), "a\n")
+        self.assertEqual(sink.snapshot(), "")
+        self.assertEqual(sink.size, 0)
+
+    def test_threads_merged_in_order(self):
+        sink = RingBufferSink(capacity=1024 * 1024)
+        barrier = threading.Barrier(4)
+
+        def worker(n):
+            barrier.wait()
+            for i in range(500):
+                sink.write(f"{n} {i}\n")
+
+        workers = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+
+        lines = sink.snapshot().splitlines()
+        self.assertEqual(len(lines), 2000)
+        for n in range(4):
+            self.assertEqual([line for line in lines if line.startswith(f"{n} ")],
+                             [f"{n} {i}" for i in range(500)])
+
+    def test_budget_shared_between_threads(self):
+        sink = RingBufferSink(capacity=100)
+        sink.write("x" * 40 + "\n")
+        thread = threading.Thread(target=lambda: sink.write("y" * 40 + "\n"))
+        thread.start()
+        thread.join()
+        sink.write("z" * 40 + "\n")
+
+        self.assertLessEqual(sink.size, 100)
+        self.assertTrue(sink.snapshot().endswith("z" * 40 + "\n"))
+
+    def test_capacity_never_exceeded(self):
+        sink = RingBufferSink(capacity=100)
+        sink.write("a" * 40 + "\n")
+        thread = threading.Thread(target=lambda: [sink.write("b" * 40 + "\n") for _ in range(3)])
+        thread.start()
+        thread.join()
+        for _ in range(3):
+            sink.write("c" * 20 + "\n")
+
+        self.assertLessEqual(sink.size, 100)
+        self.assertEqual(sink.size, len(sink.snapshot().encode("utf-8")))
+        self.assertEqual(sink.snapshot(), ("c" * 20 + "\n") * 3)
+
+    def test_line_larger_than_capacity(self):
+        sink = RingBufferSink(capacity=10)
+        sink.write("ok\n")
+        sink.write("x" * 20 + "\n")
+
+        self.assertEqual(sink.snapshot(), "")
+        self.assertEqual(sink.size, 0)
+        self.assertEqual(sink.dropped, 2)
+
+    def test_thread_churn_drops_oldest(self):
+        sink = RingBufferSink(capacity=4096)
+        for n in range(300):
+            thread = threading.Thread(target=sink.write, args=(f"поток {n}\n",))
+            thread.start()
+            thread.join()
+        for i in range(50):
+            sink.write(f"main {i}\n")
+
+        lines = sink.snapshot().splitlines()
+        self.assertLessEqual(sink.size, 4096)
+        self.assertEqual(lines[-50:], [f"main {i}" for i in range(50)])
+        # Остались самые новые строки завершившихся потоков, идущие подряд
+        survivors = [int(line.split()[1]) for line in lines[:-50]]
+        self.assertEqual(survivors, list(range(300 - len(survivors), 300)))
+        self.assertEqual(sink.dropped, 300 - len(survivors))
+
+    def test_dead_thread_buffers_released(self):
+        sink = RingBufferSink(capacity=1000)
+        for n in range(100):
+            thread = threading.Thread(target=sink.write, args=(f"{n}\n",))
+            thread.start()
+            thread.join()
+        sink.drain()
+        sink.write("main\n")
+
+        self.assertEqual(len(sink._buffers), 1)
+        self.assertEqual(sink.snapshot(), "main\n")
+
+    def test_writers_do_not_share_a_lock(self):
+        sink = RingBufferSink(capacity=1000)
+        registered, resume = threading.Event(), threading.Event()
+
+        def worker():
+            sink.write("a\n")
+            registered.set()
+            resume.wait()
+            sink.write("b\n")
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        registered.wait()
+        with sink._lock:
+            # Пока читатель держит общую блокировку, уже записывавший поток пишет без ожидания
+            resume.set()
+            thread.join(timeout=1)
+            self.assertFalse(thread.is_alive())
+        self.assertEqual(sink.snapshot(), "a\nb\n")
+
+    def test_dropped_kept_after_thread_exit(self):
+        sink = RingBufferSink(capacity=10)
+
+        def worker():
+            for i in range(5):
+                sink.write(f"{i}{i}{i}\n")
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        self.assertEqual(sink.drain(), "333\n444\n")
+        sink.write("x\n")
+
+        self.assertEqual(len(sink._buffers), 1)
+        self.assertEqual(sink.dropped, 3)
+
+    def test_logger_handle(self):
+        from Lab7 import logger
+
+        sink = RingBufferSink()
+
+        @logger(handle=sink)
+        def square(x):
+            return x * x
+
+        square(3)
+        self.assertEqual(sink.snapshot(), "INFO: Вызов square(3)\nINFO: square вернула 9\n")
+
+    def test_invalid_capacity(self):
+        with self.assertRaises(ValueError):
+            RingBufferSink(capacity=0)
@@ -0,0 +1,437 @@
+"""
+Единый набор бенчмарков для функций всех лабораторных работ.
+
+Запуск из корня репозитория:
+    python benchmarks/run_benchmarks.py                     # замер и сравнение с baseline.json
+    python benchmarks/run_benchmarks.py --quick -k quadratic  # быстрый прогон части бенчмарков
+    python benchmarks/run_benchmarks.py --update-baseline   # сохранить текущие результаты как эталон
+    python benchmarks/run_benchmarks.py --profile prof -k lab4  # свёрнутые стеки вместо замеров
+
+Код возврата 1, если какой-либо бенчмарк медленнее эталона больше чем на threshold.
+
+Профилирование (--profile) - отдельный режим: время в нём не измеряется и с эталоном
+не сравнивается, поэтому накладные расходы профилировщика не попадают в результаты.
+Для каждой точки создаётся файл <имя>[<размер>].collapsed для flamegraph.pl или speedscope,
+а для --profiler cprofile ещё и .prof в формате pstats.
+"""
+import argparse
+import datetime
+import io
+import json
+import os
+import platform
+import random
+import sys
+import timeit
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for lab in ("Lab_1", "Lab_2", "Lab_3", "Lab_4", "Lab_5", "Lab_6", "Lab_7"):
+    sys.path.insert(0, os.path.join(ROOT, lab))
+
+DEFAULT_BASELINE = os.path.join(ROOT, "benchmarks", "baseline.json")
+DEFAULT_THRESHOLD = 0.25
+
+
+class Case(NamedTuple):
+    """
+    Параметризованный бенчмарк.
+
+    setup(size) готовит входные данные и возвращает функцию без аргументов,
+    время одного вызова которой измеряется.
+    """
+    name: str
+    sizes: Tuple[int, ...]
+    setup: Callable[[int], Callable[[], object]]
+
+
+def _light_left(x: int) -> int:
+    return x + 1
+
+
+def _light_right(x: int) -> int:
+    return x - 1
+
+
+def _sumoftwo(n: int):
+    from Lab1_Sum_of_two import sumoftwo
+    rng = random.Random(n)
+    nums = [rng.randint(-10 ** 6, 10 ** 6) for _ in range(n)]
+    return lambda: sumoftwo(nums, 10 ** 7)  # пары нет - полный проход
+
+
+def _ksum(k: int):
+    def setup(n: int):
+        from Lab1_Sum_of_two import ksum
+        rng = random.Random(n)
+        nums = [rng.randint(-10 ** 6, 10 ** 6) for _ in range(n)]
+        target = sum(nums[i] for i in rng.sample(range(n // 2, n), k))
+        return lambda: ksum(nums, target, k)
+    return setup
+
+
+def _guess_number(search_type: str):
+    def setup(n: int):
+        from Lab2 import guess_number
+        lst = list(range(n))
+        return lambda: guess_number(n - 1, lst, search_type)
+    return setup
+
+
+def _sorted_buckets(n: int):
+    from Lab2 import guess_number
+    from sorted_buckets import SortedBuckets
+    sb = SortedBuckets(range(0, 2 * n, 2))
+    value = n + 1
+
+    def update():
+        sb.add(value)
+        guess_number(value, sb, 'bin')
+        sb.discard(value)
+    return update
+
+
+def _lab3_tree(n: int):
+    from Lab3_Binary_tree import gen_bin_tree
+    return lambda: gen_bin_tree(12, n, _light_left, _light_right)
+
+
+def _lab3_deque(n: int):
+    from Lab3_Binary_tree import tree_with_deque
+    return lambda: tree_with_deque(12, n)
+
+
+def _lab5_tree(n: int):
+    from Lab5_Binary_tree2 import gen_bin_tree
+    return lambda: gen_bin_tree(n, 12, _light_left, _light_right)
+
+
+def _lab5_sweep(n: int):
+    from tree_builder import TreeBuilder
+
+    def sweep():
+        builder = TreeBuilder(12, _light_left, _light_right)
+        for _ in range(n):
+            builder.extend(1)
+    return sweep
+
+
+def _lab5_vectorized(n: int):
+    from vectorized_tree import gen_bin_tree_vectorized
+    return lambda: gen_bin_tree_vectorized(n, 12, _light_left, _light_right, fmt="flat")
+
+
+def _factorial(name: str):
+    def setup(n: int):
+        import Lab4
+        func = getattr(Lab4, name)
+        return lambda: func(n)
+    return setup
+
+
+def _factorials_for(n: int):
+    from Lab4 import factorials_for
+    ns = list(range(n // 10, n + 1, n // 10))
+    return lambda: list(factorials_for(ns))
+
+
+def _lab6_tree(name: str):
+    def setup(n: int):
+        import Lab6
+        func = getattr(Lab6, name)
+        return lambda: func(n)
+    return setup
+
+
+def _quadratic_coefficients(n: int) -> List[Tuple[float, float, float]]:
+    rng = random.Random(n)
+    return [(rng.uniform(-10, 10), rng.uniform(-10, 10), rng.uniform(-10, 10)) for _ in range(n)]
+
+
+def _solve_quadratic(n: int):
+    from Lab7 import solve_quadratic
+    coefficients = _quadratic_coefficients(n)
+
+    def run():
+        for a, b, c in coefficients:
+            try:
+                solve_quadratic(a, b, c)
+            except ValueError:
+                pass
+    return run
+
+
+def _solve_quadratic_batch(n: int):
+    import numpy as np
+    from quadratic_batch import solve_quadratic_batch
+    a, b, c = np.array(_quadratic_coefficients(n)).T
+    return lambda: solve_quadratic_batch(a, b, c)
+
+
+def _logger(handle_name: str):
+    def setup(n: int):
+        from Lab7 import logger
+        handle = io.StringIO() if handle_name == "stringio" else None
+
+        @logger(handle=handle)
+        def target(a, b, c):
+            return a * b + c
+
+        def run():
+            for i in range(n):
+                target(i, 2, c=3)
+        return run
+    return setup
+
+
+CASES = [
+    Case("lab1.sumoftwo", (1_000, 100_000), _sumoftwo),
+    Case("lab1.ksum3", (10_000, 100_000), _ksum(3)),
+    Case("lab1.ksum4", (10_000, 100_000), _ksum(4)),
+    Case("lab2.guess_number.seq", (1_000, 100_000), _guess_number("seq")),
+    Case("lab2.guess_number.bin", (1_000, 100_000), _guess_number("bin")),
+    Case("lab2.sorted_buckets.update", (1_000, 100_000), _sorted_buckets),
+    Case("lab3.gen_bin_tree", (8, 14), _lab3_tree),
+    Case("lab3.tree_with_deque", (4, 6), _lab3_deque),
+    Case("lab4.fact_recursive", (100, 900), _factorial("fact_recursive")),
+    Case("lab4.fact_iterative", (100, 900), _factorial("fact_iterative")),
+    Case("lab4.factorials_for", (100, 10_000), _factorials_for),
+    Case("lab5.gen_bin_tree", (8, 14), _lab5_tree),
+    Case("lab5.tree_builder.sweep", (8, 14), _lab5_sweep),
+    Case("lab5.gen_bin_tree_vectorized", (8, 14), _lab5_vectorized),
+    Case("lab6.build_tree_recursive", (6, 10), _lab6_tree("build_tree_recursive")),
+    Case("lab6.build_tree_iterative", (6, 10), _lab6_tree("build_tree_iterative")),
+    Case("lab7.solve_quadratic", (1_000, 10_000), _solve_quadratic),
+    Case("lab7.solve_quadratic_batch", (1_000, 100_000), _solve_quadratic_batch),
+    Case("lab7.logger.stringio", (1_000,), _logger("stringio")),
+    Case("lab7.logger.none", (1_000,), _logger("none")),
+]
+
+
+def iter_benchmarks(pattern: Optional[str] = None) -> Iterator[Tuple[str, Case, int]]:
+    """Перебирает пары (имя результата, бенчмарк, размер), отфильтрованные по подстроке pattern."""
+    for case in CASES:
+        for size in case.sizes:
+            key = f"{case.name}[{size}]"
+            if pattern is None or pattern in key:
+                yield key, case, size
+
+
+def measure(func: Callable[[], object], repeat: int = 5, min_time: float = 0.2) -> float:
+    """
+    Время одного вызова func в секундах: минимум по repeat прогонам,
+    число вызовов в прогоне подбирается так, чтобы прогон длился не меньше min_time.
+    """
+    timer = timeit.Timer(func)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time or number >= 10 ** 6:
+            break
+        number *= 2 if elapsed > min_time / 10 else 10
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def _calibration_workload() -> int:
+    total = 0
+    for i in range(20000):
+        total += i * i % 7
+    return total
+
+
+def calibrate(repeat: int = 5) -> float:
+    """Время эталонной нагрузки на чистом Python: поправка на скорость машины при сравнении."""
+    return measure(_calibration_workload, repeat=repeat, min_time=0.1)
+
+
+def run(pattern: Optional[str] = None, quick: bool = False) -> Dict[str, float]:
+    """
+    Выполняет бенчмарки.
+
+    Args:
+        pattern: Подстрока имени для отбора бенчмарков
+        quick: Меньше повторов и короче прогоны (для быстрой проверки)
+
+    Returns:
+        Словарь {имя[размер]: секунды на вызов}
+    """
+    repeat, min_time = (3, 0.05) if quick else (5, 0.2)
+    results = {}
+    for key, case, size in iter_benchmarks(pattern):
+        results[key] = measure(case.setup(size), repeat=repeat, min_time=min_time)
+        print(f"{key:<42} {results[key] * 1e6:>14.2f} мкс", file=sys.stderr)
+    return results
+
+
+def compare(results: Dict[str, float], baseline: Dict[str, float],
+            threshold: float = DEFAULT_THRESHOLD, scale: float = 1.0) -> List[Tuple[str, Optional[float], float, Optional[float], str]]:
+    """
+    Сравнивает результаты с эталоном.
+
+    Args:
+        results: Текущие результаты
+        baseline: Эталонные результаты
+        threshold: Допустимое относительное замедление
+        scale: Во сколько раз текущая машина медленнее эталонной (по calibrate)
+
+    Returns:
+        Строки (имя, эталон, текущее, отношение, статус), где статус -
+        'ok', 'медленнее', 'быстрее' или 'новый'
+    """
+    rows = []
+    for key, current in results.items():
+        reference = baseline.get(key)
+        if reference is None:
+            rows.append((key, None, current, None, "новый"))
+            continue
+        ratio = current / (reference * scale)
+        if ratio > 1 + threshold:
+            status = "медленнее"
+        elif ratio < 1 / (1 + threshold):
+            status = "быстрее"
+        else:
+            status = "ok"
+        rows.append((key, reference, current, ratio, status))
+    return rows
+
+
+def load_baseline(path: str) -> Tuple[Dict[str, float], Optional[float]]:
+    """Возвращает эталонные результаты и время калибровки (None, если файла нет)."""
+    if not os.path.exists(path):
+        return {}, None
+    with open(path, encoding="utf-8") as f:
+        document = json.load(f)
+    return document["results"], document["meta"].get("calibration")
+
+
+def save_results(path: str, results: Dict[str, float], calibration: float) -> None:
+    """Сохраняет результаты в JSON вместе со сведениями об окружении."""
+    document = {
+        "meta": {
+            "date": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "calibration": calibration,
+        },
+        "results": results,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(document, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+
+
+def profile_benchmarks(directory: str, pattern: Optional[str] = None, kind: str = "sample",
+                       seconds: float = 1.0) -> List[str]:
+    """
+    Профилирует бенчмарки и сохраняет свёрнутые стеки по файлу на точку.
+
+    Подготовка данных (setup) и первый, разогревающий вызов выполняются без профилировщика.
+
+    Args:
+        directory: Каталог для файлов (создаётся при необходимости)
+        pattern: Подстрока имени для отбора бенчмарков
+        kind: 'sample' - выборки стеков, 'cprofile' - детерминированный профилировщик
+        seconds: Длительность профилирования одной точки
+
+    Returns:
+        Пути созданных файлов .collapsed
+    """
+    from profiling import make_profiler, profile_for
+
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for key, case, size in iter_benchmarks(pattern):
+        func = case.setup(size)
+        func()
+        profiler = make_profiler(kind)
+        calls = profile_for(func, profiler, seconds)
+        path = os.path.join(directory, f"{key}.collapsed")
+        profiler.write(path)
+        if kind == "cprofile":
+            profiler.dump(os.path.join(directory, f"{key}.prof"))
+        paths.append(path)
+        print(f"{key:<42} {calls:>8} вызовов -> {path}", file=sys.stderr)
+    return paths
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Бенчмарки лабораторных работ с контролем регрессий")
+    parser.add_argument("-k", dest="pattern", help="запускать только бенчмарки, имя которых содержит подстроку")
+    parser.add_argument("--quick", action="store_true", help="меньше повторов, короче прогоны")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="файл эталонных результатов")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="допустимое замедление относительно эталона (0.25 = 25%%)")
+    parser.add_argument("--output", help="сохранить результаты в JSON")
+    parser.add_argument("--update-baseline", action="store_true", help="записать результаты в файл эталона")
+    parser.add_argument("--retries", type=int, default=2,
+                        help="сколько раз перемерять бенчмарк, оказавшийся медленнее эталона")
+    parser.add_argument("--list", action="store_true", help="показать список бенчмарков")
+    parser.add_argument("--profile", metavar="DIR",
+                        help="вместо замеров сохранить свёрнутые стеки для flame graph в каталог DIR")
+    parser.add_argument("--profiler", choices=("sample", "cprofile"), default="sample",
+                        help="профилировщик для --profile: выборки стеков или cProfile")
+    parser.add_argument("--profile-time", type=float, default=1.0,
+                        help="сколько секунд профилировать каждую точку")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for key, _, _ in iter_benchmarks(args.pattern):
+            print(key)
+        return 0
+
+    if args.profile:
+        profile_benchmarks(args.profile, args.pattern, args.profiler, args.profile_time)
+        return 0
+
+    calibration = calibrate()
+    results = run(args.pattern, quick=args.quick)
+    calibration = min(calibration, calibrate())
+    if args.output:
+        save_results(args.output, results, calibration)
+
+    baseline, baseline_calibration = load_baseline(args.baseline)
+    if args.update_baseline:
+        # Эталон должен быть устойчивым: берётся лучший из двух прогонов
+        second = run(args.pattern, quick=args.quick)
+        results = {key: min(value, second[key]) for key, value in results.items()}
+        if args.pattern and baseline_calibration:
+            # Остальные записи эталона измерены при прежней калибровке - приводим новые к ней
+            results = {key: value * baseline_calibration / calibration for key, value in results.items()}
+            calibration = baseline_calibration
+        elif not args.pattern:
+            # Полный прогон заменяет эталон целиком; частичный без калибровки только дополняет его
+            baseline = {}
+        save_results(args.baseline, {**baseline, **results}, calibration)
+        print(f"Эталон обновлён: {args.baseline}")
+        return 0
+
+    scale = calibration / baseline_calibration if baseline_calibration else 1.0
+    rows = compare(results, baseline, args.threshold, scale)
+
+    # Единичный выброс не считается регрессией: подозрительные бенчмарки перемеряются
+    benchmarks = {key: (case, size) for key, case, size in iter_benchmarks(args.pattern)}
+    for _ in range(args.retries):
+        slow = [row[0] for row in rows if row[4] == "медленнее"]
+        if not slow:
+            break
+        for key in slow:
+            case, size = benchmarks[key]
+            results[key] = min(results[key], measure(case.setup(size)))
+        rows = compare(results, baseline, args.threshold, scale)
+
+    print(f"Поправка на скорость машины: {scale:.2f}")
+    print(f"{'Бенчмарк':<42} {'Эталон (мкс)':>14} {'Сейчас (мкс)':>14} {'Отношение':>10}  Статус")
+    for key, reference, current, ratio, status in rows:
+        reference_text = f"{reference * 1e6:14.2f}" if reference is not None else f"{'-':>14}"
+        ratio_text = f"{ratio:10.2f}" if ratio is not None else f"{'-':>10}"
+        print(f"{key:<42} {reference_text} {current * 1e6:14.2f} {ratio_text}  {status}")
+
+    regressions = [row[0] for row in rows if row[4] == "медленнее"]
+    if regressions:
+        print(f"\nЗамедление больше {args.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())